@@ -4,17 +4,56 @@ import click
 import logging
 from typing import Optional
 import config
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, config.LOG_LEVEL),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+
+
+def _build_shard_filter(
+    shard_index: Optional[int],
+    shard_count: Optional[int],
+    previous_shard_count: Optional[int]
+):
+    """Build a ShardFilter from the --shard-* options (None when sharding is off)."""
+    if shard_index is None and shard_count is None:
+        if previous_shard_count is not None:
+            raise click.BadParameter("--previous-shard-count requires --shard-index and --shard-count")
+        return None
+    if shard_index is None or shard_count is None:
+        raise click.BadParameter("--shard-index and --shard-count must be given together")
+    
+    from pipelines.sharding import ShardFilter
+    try:
+        return ShardFilter(shard_index, shard_count, previous_shard_count)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
 
 
 @click.group()
-def cli():
+@click.option("--profile", is_flag=True, default=False,
+              help="Profile the command: sampled stacks (flamegraph .folded) and top allocations")
+@click.option("--profile-dir", type=click.Path(file_okay=False), default=None,
+              help="Directory for profile reports (default: PROFILE_DIR)")
+@click.option("--profile-interval", type=float, default=0.01, help="Seconds between stack samples (default: 0.01)")
+@click.pass_context
+def cli(ctx: click.Context, profile: bool, profile_dir: Optional[str], profile_interval: float):
     """Kol Torah Ingestion Pipelines - CLI tool for managing data ingestion."""
-    pass
+    # Configure logging (here rather than at import, so --help stays cheap)
+    logging.basicConfig(
+        level=getattr(logging, config.LOG_LEVEL),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    
+    if profile:
+        import sys
+        from pathlib import Path
+        from pipelines.profiling import RunProfiler
+        
+        # Name the reports after the command, e.g. youtube-download-audio
+        argv = sys.argv[1:]
+        words = argv[argv.index(ctx.invoked_subcommand):][:2] if ctx.invoked_subcommand in argv else []
+        name = "-".join(w for w in words if not w.startswith("-") and "/" not in w) or "cli"
+        profiler = RunProfiler(Path(profile_dir) if profile_dir else config.PROFILE_DIR, name, interval=profile_interval)
+        profiler.start()
+        # Runs when the command finishes, including on errors and Ctrl-C
+        ctx.call_on_close(profiler.stop)
 
 
 @cli.group()
@@ -155,17 +194,59 @@ def fetch_rabinovitch_sample(rabbi_slug: str, series_slug: str):
 
 @youtube.command("download-audio")
 @click.option("--limit", type=int, default=None, help="Maximum number of videos to process")
-def download_audio(limit: Optional[int]):
+@click.option("--metrics-dir", type=click.Path(file_okay=False), default=None,
+              help="Write per-stage metrics (JSON lines + Prometheus textfile) to this directory")
+@click.option("--workers", type=int, default=None, help="Maximum concurrent downloads (default: DOWNLOAD_WORKERS)")
+@click.option("--policy", type=click.Choice(["catalog", "newest", "shortest", "weighted", "round-robin"]),
+              default=None, help="Backlog scheduling policy (default: SCHEDULER_POLICY)")
+@click.option("--series-weight", "series_weights", multiple=True,
+              help="Priority weight for a series as <series-slug>=<weight> (repeatable)")
+@click.option("--speech-chunks/--no-speech-chunks", default=None,
+              help="Also upload 16 kHz mono chunks for transcription (default: SPEECH_CHUNKS_ENABLED)")
+@click.option("--trim-silence/--no-trim-silence", default=None,
+              help="Cut silence out of the stored MP3 (default: TRIM_SILENCE_ENABLED)")
+@click.option("--shard-index", type=int, default=None, help="This node's shard (0-based, requires --shard-count)")
+@click.option("--shard-count", type=int, default=None, help="Total number of shards")
+@click.option("--previous-shard-count", type=int, default=None,
+              help="Rebalance-safe mode: shard count before a change; only items owned under both counts are taken")
+def download_audio(
+    limit: Optional[int],
+    metrics_dir: Optional[str],
+    workers: Optional[int],
+    policy: Optional[str],
+    series_weights: tuple,
+    speech_chunks: Optional[bool],
+    trim_silence: Optional[bool],
+    shard_index: Optional[int],
+    shard_count: Optional[int],
+    previous_shard_count: Optional[int]
+):
     """Download audio from all YouTube videos that need processing and upload to S3."""
+    from pathlib import Path
     from pipelines.youtube.download_audio import YouTubeAudioDownloader
+    from pipelines.youtube.scheduler import VideoScheduler, parse_series_weights
+    
+    try:
+        scheduler = VideoScheduler(policy or config.SCHEDULER_POLICY, parse_series_weights(series_weights))
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+    shard = _build_shard_filter(shard_index, shard_count, previous_shard_count)
+    
+    metrics_dir = metrics_dir or (str(config.METRICS_DIR) if config.METRICS_DIR else None)
     
     click.echo("Starting audio download and S3 upload for all unprocessed videos...")
     if limit:
         click.echo(f"Processing up to {limit} videos")
     
     try:
-        downloader = YouTubeAudioDownloader()
-        stats = downloader.process_all_videos(limit)
+        downloader = YouTubeAudioDownloader(
+            workers=workers,
+            scheduler=scheduler,
+            speech_chunks=speech_chunks,
+            trim_silence=trim_silence,
+            shard=shard
+        )
+        stats = downloader.process_all_videos(limit, Path(metrics_dir) if metrics_dir else None)
         
         click.echo(f"\n{'='*60}")
         click.echo(f"Processing Complete!")
@@ -174,12 +255,153 @@ def download_audio(limit: Optional[int]):
         click.echo(f"✓ Processed:      {stats['processed']}")
         click.echo(f"○ Skipped:        {stats['skipped']}")
         click.echo(f"✗ Failed:         {stats['failed']}")
+        if stats["too_large"]:
+            click.echo(f"○ Too large:      {stats['too_large']} (exceed the scratch budget)")
+        click.echo(f"↻ Requeued:       {stats['requeued']}")
+        
+        if downloader.metrics.records:
+            click.echo(f"\n{downloader.metrics.format_table()}")
         
     except Exception as e:
         click.echo(f"✗ Error: {e}", err=True)
         raise click.Abort()
 
 
+@youtube.command("reprocess-audio")
+@click.option("--video-id", "video_ids", multiple=True, required=True, help="YouTube video ID to reprocess (repeatable)")
+def reprocess_audio(video_ids: tuple):
+    """Transcode and upload audio again for specific videos, overwriting S3.
+    
+    Reads the original audio from the local audio cache when available
+    (see AUDIO_CACHE_DIR) and only downloads from YouTube on a cache miss.
+    """
+    from pipelines.youtube.download_audio import YouTubeAudioDownloader
+    
+    downloader = YouTubeAudioDownloader()
+    failed = 0
+    
+    for video_id in video_ids:
+        try:
+            downloader.reprocess_video(video_id)
+            click.echo(f"✓ Reprocessed {video_id}")
+        except Exception as e:
+            click.echo(f"✗ Failed to reprocess {video_id}: {e}", err=True)
+            failed += 1
+    
+    if failed:
+        raise click.Abort()
+
+
+@cli.command("daemon")
+@click.option("--poll-interval", type=float, default=300.0, help="Seconds between passes without notifications (default: 300)")
+@click.option("--workers", type=int, default=None, help="Maximum concurrent downloads (default: DOWNLOAD_WORKERS)")
+@click.option("--policy", type=click.Choice(["catalog", "newest", "shortest", "weighted", "round-robin"]),
+              default=None, help="Backlog scheduling policy (default: SCHEDULER_POLICY)")
+def daemon(poll_interval: float, workers: Optional[int], policy: Optional[str]):
+    """Process new videos continuously, woken by database notifications.
+    
+    Keeps the S3 client and database pool warm between passes and starts a
+    pass as soon as videos are inserted into sources.youtube_videos.
+    """
+    from pipelines.daemon import IngestionDaemon
+    from pipelines.youtube.download_audio import YouTubeAudioDownloader
+    from pipelines.youtube.scheduler import VideoScheduler
+    
+    downloader = YouTubeAudioDownloader(
+        workers=workers,
+        scheduler=VideoScheduler(policy or config.SCHEDULER_POLICY)
+    )
+    IngestionDaemon(downloader, poll_interval=poll_interval).run()
+
+
+@cli.group()
+def pipeline():
+    """End-to-end ingestion commands."""
+    pass
+
+
+@pipeline.command("run")
+@click.option("--source", "sources", multiple=True,
+              type=click.Choice(["butbul-daily-halacha", "halichot-olam", "rabinovitch-sample"]),
+              help="Discovery source (repeatable; default: all)")
+@click.option("--no-discover", is_flag=True, default=False, help="Skip discovery (with --backlog: process existing videos only)")
+@click.option("--backlog/--no-backlog", default=False, help="Also process videos left unprocessed by earlier runs")
+@click.option("--transcript-dir", type=click.Path(exists=True, file_okay=False, dir_okay=True), default=None,
+              help="Attach transcripts named <video-id>.json from this directory after each upload")
+@click.option("--limit", type=int, default=None, help="Maximum number of videos sent to audio processing")
+@click.option("--workers", type=int, default=None, help="Concurrent audio downloads (default: DOWNLOAD_WORKERS)")
+@click.option("--transcript-workers", type=int, default=2, help="Concurrent transcript uploads (default: 2)")
+@click.option("--queue-size", type=int, default=None, help="Capacity of each stage queue (default: PIPELINE_QUEUE_SIZE)")
+@click.option("--policy", type=click.Choice(["catalog", "newest", "shortest", "weighted", "round-robin"]),
+              default=None, help="Ordering of the --backlog videos (default: SCHEDULER_POLICY)")
+@click.option("--metrics-dir", type=click.Path(file_okay=False), default=None,
+              help="Write per-stage metrics (JSON lines + Prometheus textfile) here (default: METRICS_DIR)")
+def pipeline_run(
+    sources: tuple,
+    no_discover: bool,
+    backlog: bool,
+    transcript_dir: Optional[str],
+    limit: Optional[int],
+    workers: Optional[int],
+    transcript_workers: int,
+    queue_size: Optional[int],
+    policy: Optional[str],
+    metrics_dir: Optional[str]
+):
+    """Discover new videos, download their audio and attach transcripts in one flow.
+    
+    Stages run concurrently and are connected by bounded queues: each video
+    inserted by discovery goes straight to audio processing, and then to
+    transcript attachment, while discovery and other downloads continue.
+    """
+    from pathlib import Path
+    from pipelines.orchestrator import PipelineOrchestrator, SOURCES
+    from pipelines.youtube.download_audio import YouTubeAudioDownloader
+    from pipelines.youtube.scheduler import VideoScheduler
+    
+    selected = [] if no_discover else (list(sources) or list(SOURCES))
+    metrics_dir = metrics_dir or (str(config.METRICS_DIR) if config.METRICS_DIR else None)
+    
+    try:
+        downloader = YouTubeAudioDownloader(
+            workers=workers,
+            scheduler=VideoScheduler(policy or config.SCHEDULER_POLICY)
+        )
+        orchestrator = PipelineOrchestrator(
+            downloader,
+            transcript_dir=Path(transcript_dir) if transcript_dir else None,
+            transcript_workers=transcript_workers,
+            queue_size=queue_size
+        )
+        stats = orchestrator.run(selected, backlog=backlog, limit=limit, metrics_dir=Path(metrics_dir) if metrics_dir else None)
+    except Exception as e:
+        click.echo(f"✗ Error: {e}", err=True)
+        raise click.Abort()
+    
+    click.echo(f"\n{'='*60}")
+    click.echo(f"Pipeline Run Complete!")
+    click.echo(f"{'='*60}")
+    click.echo(f"Discovered:            {stats['discovered']}")
+    if stats["deferred"]:
+        click.echo(f"○ Deferred (limit):    {stats['deferred']}")
+    if stats["sources_failed"]:
+        click.echo(f"✗ Sources failed:      {stats['sources_failed']}")
+    click.echo(f"✓ Audio processed:     {stats['audio_processed']}")
+    click.echo(f"○ Audio skipped:       {stats['audio_skipped']}")
+    click.echo(f"✗ Audio failed:        {stats['audio_failed']}")
+    if stats["audio_too_large"]:
+        click.echo(f"○ Audio too large:     {stats['audio_too_large']} (exceed the scratch budget)")
+    click.echo(f"↻ Audio requeued:      {stats['audio_requeued']}")
+    if transcript_dir:
+        click.echo(f"✓ Transcripts:         {stats['transcripts_attached']}")
+        click.echo(f"○ No transcript file:  {stats['transcripts_missing']}")
+        click.echo(f"○ Transcripts skipped: {stats['transcripts_skipped']}")
+        click.echo(f"✗ Transcripts failed:  {stats['transcripts_failed']}")
+    
+    if orchestrator.metrics.records:
+        click.echo(f"\n{orchestrator.metrics.format_table()}")
+
+
 @cli.group()
 def transcript():
     """Transcript-related ingestion commands."""
@@ -187,33 +409,343 @@ def transcript():
 
 
 @transcript.command("upload-existing")
-@click.argument("transcript_dir", type=click.Path(exists=True, file_okay=False, dir_okay=True))
-def upload_existing_transcripts(transcript_dir: str):
-    """Upload existing transcript files from a directory to S3.
+@click.argument("transcript_source", type=click.Path(exists=True, file_okay=True, dir_okay=True))
+@click.option("--shard-index", type=int, default=None, help="This node's shard (0-based, requires --shard-count)")
+@click.option("--shard-count", type=int, default=None, help="Total number of shards")
+@click.option("--previous-shard-count", type=int, default=None,
+              help="Rebalance-safe mode: shard count before a change; only items owned under both counts are taken")
+@click.option("--workers", type=int, default=None,
+              help="Concurrent uploads (default: TRANSCRIPT_UPLOAD_WORKERS; 1 uploads sequentially with progress)")
+@click.option("--manifest/--no-manifest", default=True,
+              help="Skip files unchanged since their last upload, using a local manifest (default: on; directories only)")
+@click.option("--verify", is_flag=True, default=False,
+              help="Re-check uploaded files against S3 ETags first and re-upload any that are out of sync")
+@click.option("--normalize/--no-normalize", default=None,
+              help="Upload compact JSON instead of the file as it is (default: TRANSCRIPT_NORMALIZE)")
+@click.option("--encoding", type=click.Choice(["identity", "gzip", "zstd"]), default=None,
+              help="Content-Encoding of uploaded objects (default: TRANSCRIPT_CONTENT_ENCODING)")
+def upload_existing_transcripts(
+    transcript_source: str,
+    shard_index: Optional[int],
+    shard_count: Optional[int],
+    previous_shard_count: Optional[int],
+    workers: Optional[int],
+    manifest: bool,
+    verify: bool,
+    normalize: Optional[bool],
+    encoding: Optional[str]
+):
+    """Upload existing transcript files from a directory or archive to S3.
     
-    Expects transcript files named <video-id>.json in the specified directory.
+    Expects transcript files named <video-id>.json in the specified directory, or
+    a .tar, .tar.gz, .tgz or .zip archive of them (streamed, never extracted).
     Will upload to S3 and update the database for videos that don't already have transcripts.
     """
+    from pathlib import Path
+    from pipelines.transcript.archive import is_archive, ARCHIVE_SUFFIXES
     from pipelines.transcript.upload_existing_transcripts import TranscriptUploader
     
-    click.echo(f"Uploading transcripts from: {transcript_dir}")
+    shard = _build_shard_filter(shard_index, shard_count, previous_shard_count)
+    archive = is_archive(Path(transcript_source))
+    
+    click.echo(f"Uploading transcripts from: {transcript_source}")
     
     try:
-        uploader = TranscriptUploader()
-        stats = uploader.upload_from_directory(transcript_dir)
+        if verify and not manifest:
+            raise click.BadParameter("--verify requires the manifest")
+        if verify and archive:
+            raise click.BadParameter("--verify applies to directories only")
+        if Path(transcript_source).is_file() and not archive:
+            raise click.BadParameter(f"Expected a directory or an archive ({', '.join(ARCHIVE_SUFFIXES)})")
+        uploader = TranscriptUploader(workers=workers, use_manifest=manifest, normalize=normalize, encoding=encoding)
+        if archive:
+            stats = uploader.upload_from_archive(transcript_source, shard)
+        else:
+            stats = uploader.upload_from_directory(transcript_source, shard, verify=verify)
         
         click.echo(f"\n{'='*60}")
         click.echo(f"Processing Complete!")
         click.echo(f"{'='*60}")
         click.echo(f"Total files:      {stats['total']}")
+        if "verified" in stats:
+            click.echo(f"Verified:         {stats['verified']} ({stats['stale']} out of sync)")
+        click.echo(f"= Unchanged:      {stats['unchanged']}")
         click.echo(f"✓ Uploaded:       {stats['uploaded']}")
         click.echo(f"○ Skipped:        {stats['skipped']}")
         click.echo(f"✗ Failed:         {stats['failed']}")
         
+        for file_name, error in sorted(uploader.errors.items())[:20]:
+            click.echo(f"  ✗ {file_name}: {error}", err=True)
+        if len(uploader.errors) > 20:
+            click.echo(f"  ... and {len(uploader.errors) - 20} more (see log)", err=True)
+        if uploader.segment_warnings:
+            click.echo(
+                f"⚠ Segments not loaded for {len(uploader.segment_warnings)} uploaded transcripts; "
+                f"run `transcript load-segments` to backfill",
+                err=True
+            )
+        
     except Exception as e:
         click.echo(f"✗ Error: {e}", err=True)
         raise click.Abort()
 
 
+@transcript.command("recompress")
+@click.option("--encoding", type=click.Choice(["identity", "gzip", "zstd"]), required=True,
+              help="Target Content-Encoding")
+@click.option("--limit", type=int, default=None, help="Maximum number of transcripts to process")
+@click.option("--workers", type=int, default=None, help="Concurrent objects (default: TRANSCRIPT_UPLOAD_WORKERS)")
+@click.option("--dry-run", is_flag=True, default=False, help="Report the size change without writing anything")
+def recompress_transcripts(encoding: str, limit: Optional[int], workers: Optional[int], dry_run: bool):
+    """Re-encode transcripts already in S3 with a new Content-Encoding.
+    
+    Objects keep their keys; the database records each transcript's encoding and stored size.
+    """
+    from pipelines.transcript.recompress import TranscriptRecompressor
+    
+    click.echo(f"Recompressing transcripts to {encoding}{' (dry run)' if dry_run else ''}")
+    
+    try:
+        recompressor = TranscriptRecompressor(encoding, workers=workers)
+        stats = recompressor.run(limit=limit, dry_run=dry_run)
+    except Exception as e:
+        click.echo(f"✗ Error: {e}", err=True)
+        raise click.Abort()
+    
+    before, after = stats["bytes_before"], stats["bytes_after"]
+    click.echo(f"\n{'='*60}")
+    click.echo(f"Recompression Complete!")
+    click.echo(f"{'='*60}")
+    click.echo(f"✓ Processed:  {stats['processed']}")
+    click.echo(f"✗ Failed:     {stats['failed']}")
+    click.echo(f"Stored size:  {before / 1024**2:.1f} MB -> {after / 1024**2:.1f} MB"
+               + (f" ({before / after:.1f}x smaller)" if after else ""))
+    for video_id, error in sorted(recompressor.errors.items())[:20]:
+        click.echo(f"  ✗ {video_id}: {error}", err=True)
+
+
+@transcript.command("load-segments")
+@click.option("--limit", type=int, default=None, help="Maximum number of videos to process")
+@click.option("--workers", type=int, default=None, help="Concurrent transcript downloads (default: TRANSCRIPT_UPLOAD_WORKERS)")
+@click.option("--reload", is_flag=True, default=False, help="Also replace segments of videos that already have them")
+def load_transcript_segments(limit: Optional[int], workers: Optional[int], reload: bool):
+    """Load transcript segments from S3 into sources.transcript_segments.
+    
+    Each batch of videos is replaced atomically with one COPY, so re-runs are safe.
+    """
+    from pipelines.transcript.load_segments import TranscriptSegmentLoader
+    
+    try:
+        loader = TranscriptSegmentLoader(workers=workers)
+        stats = loader.run(limit=limit, reload=reload)
+    except Exception as e:
+        click.echo(f"✗ Error: {e}", err=True)
+        raise click.Abort()
+    
+    click.echo(f"\n{'='*60}")
+    click.echo(f"Segment Load Complete!")
+    click.echo(f"{'='*60}")
+    click.echo(f"✓ Videos:    {stats['videos']}")
+    click.echo(f"✓ Segments:  {stats['segments']} in {stats['seconds']}s")
+    click.echo(f"✗ Failed:    {stats['failed']}")
+    for video_id, error in sorted(loader.errors.items())[:20]:
+        click.echo(f"  ✗ {video_id}: {error}", err=True)
+
+
+@transcript.command("segment-at")
+@click.argument("video_id")
+@click.argument("seconds", type=click.FloatRange(min=0))
+def transcript_segment_at(video_id: str, seconds: float):
+    """Print the transcript segment spoken at SECONDS into a video.
+    
+    Reads only the video's segment index sidecar, with S3 ranged GETs.
+    """
+    import math
+    
+    # FloatRange lets nan and inf through
+    if not math.isfinite(seconds):
+        raise click.BadParameter("must be a finite number of seconds", param_hint="SECONDS")
+    
+    try:
+        import boto3
+        from kol_torah_db.models import YoutubeVideo
+        from pipelines.utils import get_db_session
+        from pipelines.transcript.segment_index import fetch_segment_at
+        
+        with get_db_session() as session:
+            row = session.query(
+                YoutubeVideo.transcript_bucket,
+                YoutubeVideo.transcript_index_path
+            ).filter(YoutubeVideo.video_id == video_id).first()
+        if not row or not row.transcript_index_path:
+            raise click.ClickException(f"Video {video_id} has no transcript segment index")
+        
+        s3_client = boto3.client(
+            's3',
+            aws_access_key_id=config.get_aws_access_key_id(),
+            aws_secret_access_key=config.get_aws_secret_access_key(),
+            region_name=config.AWS_REGION
+        )
+        segment = fetch_segment_at(
+            s3_client, row.transcript_bucket or config.S3_BUCKET_NAME, row.transcript_index_path, seconds
+        )
+        if segment is None:
+            raise click.ClickException(f"No segment starts before {seconds:.1f}s")
+        start, end, text = segment
+        click.echo(f"[{start:.2f}-{end:.2f}] {text}")
+        
+    except Exception as e:
+        click.echo(f"✗ Error: {e}", err=True)
+        raise click.Abort()
+
+
+@cli.command("search")
+@click.argument("query")
+@click.option("--limit", type=int, default=20, help="Maximum number of lessons (default: 20)")
+@click.option("--segments", type=int, default=3, help="Matching transcript segments shown per lesson (default: 3)")
+def search(query: str, limit: int, segments: int):
+    """Search lesson titles, descriptions and transcripts.
+    
+    QUERY accepts web-search syntax: "exact phrase", or, -excluded.
+    """
+    import time
+    from pipelines.search import search_lessons
+    
+    try:
+        started = time.perf_counter()
+        lessons = search_lessons(query, limit=limit, segments_per_lesson=segments)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        
+        if not lessons:
+            click.echo(f"No lessons match {query!r}")
+            return
+        
+        for lesson in lessons:
+            click.echo(f"\n{lesson['title']}  (rank {lesson['rank']:.3f}, {lesson['segment_hits']} segment hits)")
+            click.echo(f"  {lesson['url']}")
+            for segment in lesson["segments"]:
+                minutes, seconds = divmod(int(segment["start"]), 60)
+                click.echo(f"  [{minutes:02d}:{seconds:02d}] {segment['text'].strip()}")
+        click.echo(f"\n{len(lessons)} lessons in {elapsed_ms:.0f} ms")
+        
+    except Exception as e:
+        click.echo(f"✗ Error: {e}", err=True)
+        raise click.Abort()
+
+
+@cli.command("reconcile")
+@click.option("--dry-run", is_flag=True, help="Report repairs without writing them")
+@click.option("--workers", type=int, default=None, help="Series prefixes listed concurrently (default: RECONCILE_WORKERS)")
+@click.option("--orphans-file", type=click.Path(dir_okay=False, writable=True),
+              help="Write every orphaned key (and size) to this file")
+def reconcile(dry_run: bool, workers: Optional[int], orphans_file: Optional[str]):
+    """Reconcile S3 objects with the audio and transcript pointers in the database.
+    
+    Lists each rabbi/series prefix once, repairs dangling and missing pointers
+    and reports objects no video claims. Nothing is deleted from S3.
+    """
+    from pipelines.reconcile import S3Reconciler
+    
+    try:
+        reconciler = S3Reconciler(workers=workers)
+        stats = reconciler.run(dry_run=dry_run)
+        
+        click.echo(
+            f"{'[dry run] ' if dry_run else ''}"
+            f"Listed {stats['objects']} objects under {stats['prefixes']} series in {stats['list_calls']} calls"
+        )
+        click.echo(
+            f"Pointers: ok={stats['ok']} adopted={stats['adopted']} repointed={stats['repointed']} "
+            f"cleared={stats['cleared']} other_bucket={stats['other_bucket']} outside_prefix={stats['outside_prefix']}"
+        )
+        click.echo(f"Orphans: {stats['orphans']} objects, {stats['orphan_bytes'] / 1024 / 1024:.1f} MB")
+        for key, size in reconciler.orphans[:20]:
+            click.echo(f"  {key} ({size} bytes)")
+        if stats['orphans'] > 20:
+            click.echo(f"  ... and {stats['orphans'] - 20} more")
+        for prefix in reconciler.unknown_prefixes:
+            click.echo(f"Unknown prefix: {prefix}")
+        
+        if orphans_file:
+            with open(orphans_file, "w", encoding="utf-8") as f:
+                for key, size in reconciler.orphans:
+                    f.write(f"{key}\t{size}\n")
+            click.echo(f"Wrote {stats['orphans']} orphaned keys to {orphans_file}")
+        
+    except Exception as e:
+        click.echo(f"✗ Error: {e}", err=True)
+        raise click.Abort()
+
+
+@cli.group()
+def ledger():
+    """Inspect and reset per-item retry state."""
+    pass
+
+
+@ledger.command("quarantined")
+@click.option("--pipeline", type=click.Choice(["youtube-audio", "transcript-upload", "transcript-segments"]), default="youtube-audio",
+              help="Pipeline to inspect (default: youtube-audio)")
+def ledger_quarantined(pipeline: str):
+    """List items quarantined after repeated failures."""
+    from pipelines.ledger import RunLedger
+    
+    items = RunLedger(pipeline).quarantined()
+    if not items:
+        click.echo("No quarantined items")
+        return
+    
+    for item in items:
+        click.echo(
+            f"{item['item_key']:<20} failures={item['failures']:<3} "
+            f"stage={item['last_stage'] or '-':<10} error={item['last_error_class'] or '-'}"
+        )
+
+
+@ledger.command("release")
+@click.argument("item_keys", nargs=-1, required=True)
+@click.option("--pipeline", type=click.Choice(["youtube-audio", "transcript-upload", "transcript-segments"]), default="youtube-audio",
+              help="Pipeline the items belong to (default: youtube-audio)")
+def ledger_release(item_keys: tuple, pipeline: str):
+    """Clear the retry state of items (e.g. video IDs) so the next run retries them."""
+    from pipelines.ledger import RunLedger
+    
+    run_ledger = RunLedger(pipeline)
+    for item_key in item_keys:
+        if run_ledger.release(item_key):
+            click.echo(f"✓ Released {item_key}")
+        else:
+            click.echo(f"○ {item_key} has no retry state")
+
+
+@cli.group()
+def dev():
+    """Developer checks."""
+    pass
+
+
+@dev.command("startup-check")
+@click.option("--budget-ms", type=float, default=None,
+              help="Maximum cumulative import time of `cli.py --help` in ms (default: STARTUP_BUDGET_MS)")
+@click.option("--runs", type=int, default=3, help="Cold starts to measure; the fastest one is compared (default: 3)")
+def startup_check(budget_ms: Optional[float], runs: int):
+    """Fail if CLI cold start exceeds the import-time budget or imports heavy libraries."""
+    from pipelines.startup import HEAVY_MODULES, measure_cold_start
+    
+    budget_ms = budget_ms or config.STARTUP_BUDGET_MS
+    try:
+        elapsed_ms, loaded = measure_cold_start(runs)
+    except RuntimeError as e:
+        raise click.ClickException(str(e))
+    
+    offenders = sorted(loaded.intersection(HEAVY_MODULES))
+    click.echo(f"Cold start imports: {elapsed_ms:.1f} ms (budget {budget_ms:.0f} ms)")
+    if offenders:
+        raise click.ClickException(f"Heavy modules imported at startup: {', '.join(offenders)}")
+    if elapsed_ms > budget_ms:
+        raise click.ClickException(f"Cold start exceeds the budget by {elapsed_ms - budget_ms:.1f} ms")
+    click.echo("✓ Startup within budget")
+
+
 if __name__ == "__main__":
     cli()
@@ -7,15 +7,29 @@ This module centralizes all configuration, separating:
 
 import os
 from pathlib import Path
-from dotenv import load_dotenv
+from typing import Any, Dict, Optional
 
-# Load environment variables from .env file
 env_path = Path(__file__).parent / ".env"
-load_dotenv(env_path)
+_env_loaded = False
+
+
+def _load_env() -> None:
+    """Load environment variables from the .env file (once, on first use).
+    
+    Deferred so that importing config (e.g. for `cli.py --help`) costs
+    nothing; every getter and setting below calls this first.
+    """
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv(env_path)
+        _env_loaded = True
+
 
 __all__ = [
     # Secret getters
     "get_database_url",
+    "get_database_listen_url",
     "get_youtube_api_key",
     "get_aws_access_key_id",
     "get_aws_secret_access_key",
@@ -24,23 +38,98 @@ __all__ = [
     "S3_BUCKET_NAME",
     "LOG_LEVEL",
     "BATCH_SIZE",
+    "WORK_DIR",
+    "AUDIO_CACHE_DIR",
+    "AUDIO_CACHE_MAX_BYTES",
+    "METRICS_DIR",
+    "DOWNLOAD_WORKERS",
+    "SCHEDULER_POLICY",
+    "SPEECH_CHUNKS_ENABLED",
+    "SPEECH_CHUNK_SECONDS",
+    "SPEECH_CHUNK_OVERLAP_SECONDS",
+    "TRIM_SILENCE_ENABLED",
+    "WAVEFORM_PEAKS_ENABLED",
+    "SCRATCH_DISK_BUDGET_BYTES",
+    "SCRATCH_MIN_FREE_BYTES",
+    "SCRATCH_RAM_BUDGET_BYTES",
+    "LEDGER_MAX_FAILURES",
+    "LEDGER_BASE_DELAY_SECONDS",
+    "LEDGER_MAX_DELAY_SECONDS",
+    "STARTUP_BUDGET_MS",
+    "PROFILE_DIR",
+    "PIPELINE_QUEUE_SIZE",
+    "TRANSCRIPT_UPLOAD_WORKERS",
+    "TRANSCRIPT_MANIFEST_DIR",
+    "TRANSCRIPT_NORMALIZE",
+    "TRANSCRIPT_CONTENT_ENCODING",
+    "TRANSCRIPT_INDEX_ENABLED",
+    "TRANSCRIPT_SEGMENTS_ON_UPLOAD",
+    "RECONCILE_WORKERS",
 ]
 
 
+# Declared for static analysis and type checkers only: the values are
+# assigned by __getattr__ below on first access (annotations bind no value).
+AWS_REGION: str
+S3_BUCKET_NAME: str
+LOG_LEVEL: str
+BATCH_SIZE: int
+WORK_DIR: Path
+AUDIO_CACHE_DIR: Optional[Path]
+AUDIO_CACHE_MAX_BYTES: int
+METRICS_DIR: Optional[Path]
+DOWNLOAD_WORKERS: int
+SCHEDULER_POLICY: str
+SPEECH_CHUNKS_ENABLED: bool
+SPEECH_CHUNK_SECONDS: float
+SPEECH_CHUNK_OVERLAP_SECONDS: float
+TRIM_SILENCE_ENABLED: bool
+WAVEFORM_PEAKS_ENABLED: bool
+SCRATCH_DISK_BUDGET_BYTES: int
+SCRATCH_MIN_FREE_BYTES: int
+SCRATCH_RAM_BUDGET_BYTES: int
+LEDGER_MAX_FAILURES: int
+LEDGER_BASE_DELAY_SECONDS: float
+LEDGER_MAX_DELAY_SECONDS: float
+STARTUP_BUDGET_MS: float
+PROFILE_DIR: Path
+PIPELINE_QUEUE_SIZE: int
+TRANSCRIPT_UPLOAD_WORKERS: int
+TRANSCRIPT_MANIFEST_DIR: Optional[Path]
+TRANSCRIPT_NORMALIZE: bool
+TRANSCRIPT_CONTENT_ENCODING: str
+TRANSCRIPT_INDEX_ENABLED: bool
+TRANSCRIPT_SEGMENTS_ON_UPLOAD: bool
+RECONCILE_WORKERS: int
+
+
 # ============================================================================
 # SECRETS (from .env file)
 # ============================================================================
 
 def get_database_url() -> str:
     """Get database connection URL."""
+    _load_env()
     url = os.getenv("DATABASE_URL")
     if not url:
         raise ValueError("DATABASE_URL environment variable is required")
     return url
 
 
+def get_database_listen_url() -> str:
+    """Get database URL for LISTEN/NOTIFY.
+    
+    Connection poolers (e.g. Neon's -pooler endpoint) do not deliver
+    notifications, so DATABASE_LISTEN_URL may point at the direct endpoint.
+    Falls back to DATABASE_URL.
+    """
+    _load_env()
+    return os.getenv("DATABASE_LISTEN_URL") or get_database_url()
+
+
 def get_youtube_api_key() -> str:
     """Get YouTube Data API key."""
+    _load_env()
     key = os.getenv("YOUTUBE_API_KEY")
     if not key:
         raise ValueError("YOUTUBE_API_KEY environment variable is required")
@@ -49,6 +138,7 @@ def get_youtube_api_key() -> str:
 
 def get_aws_access_key_id() -> str:
     """Get AWS access key ID."""
+    _load_env()
     key = os.getenv("AWS_ACCESS_KEY_ID")
     if not key:
         raise ValueError("AWS_ACCESS_KEY_ID environment variable is required")
@@ -57,6 +147,7 @@ def get_aws_access_key_id() -> str:
 
 def get_aws_secret_access_key() -> str:
     """Get AWS secret access key."""
+    _load_env()
     key = os.getenv("AWS_SECRET_ACCESS_KEY")
     if not key:
         raise ValueError("AWS_SECRET_ACCESS_KEY environment variable is required")
@@ -67,12 +158,100 @@ def get_aws_secret_access_key() -> str:
 # NON-SECRET CONFIGURATION
 # ============================================================================
 
-# AWS Configuration
-AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
-S3_BUCKET_NAME = os.getenv("S3_BUCKET_NAME", "kol-torah-media")
+def _positive_float(name: str, default: str) -> float:
+    """Read a float setting that must be greater than zero."""
+    value = float(os.getenv(name, default))
+    if value <= 0:
+        raise ValueError(f"{name} must be greater than 0, got {value}")
+    return value
+
+
+def _load_settings() -> Dict[str, Any]:
+    """Compute the non-secret configuration (after loading .env)."""
+    _load_env()
+    return {
+        # AWS Configuration
+        "AWS_REGION": os.getenv("AWS_REGION", "us-east-1"),
+        "S3_BUCKET_NAME": os.getenv("S3_BUCKET_NAME", "kol-torah-media"),
+
+        # Logging Configuration
+        "LOG_LEVEL": os.getenv("LOG_LEVEL", "INFO"),
+
+        # Pipeline Configuration
+        "BATCH_SIZE": int(os.getenv("BATCH_SIZE", "100")),
+
+        # Persistent scratch space for in-progress audio downloads (one subdirectory per video)
+        "WORK_DIR": Path(os.getenv("WORK_DIR", str(Path(__file__).parent / "work"))),
+
+        # Optional on-disk LRU cache of original audio streams (disabled when AUDIO_CACHE_DIR is unset)
+        "AUDIO_CACHE_DIR": Path(os.environ["AUDIO_CACHE_DIR"]) if os.getenv("AUDIO_CACHE_DIR") else None,
+        "AUDIO_CACHE_MAX_BYTES": int(float(os.getenv("AUDIO_CACHE_MAX_GB", "50")) * 1024**3),
+
+        # Directory for per-stage run metrics (JSON lines + Prometheus textfile); disabled when unset
+        "METRICS_DIR": Path(os.environ["METRICS_DIR"]) if os.getenv("METRICS_DIR") else None,
+
+        # Maximum concurrent audio downloads (lowered automatically while YouTube throttles)
+        "DOWNLOAD_WORKERS": int(os.getenv("DOWNLOAD_WORKERS", "2")),
+
+        # Order in which the audio backlog is processed (catalog, newest, shortest, weighted, round-robin)
+        "SCHEDULER_POLICY": os.getenv("SCHEDULER_POLICY", "catalog"),
+
+        # Speech derivative for transcription: 16 kHz mono WAV chunks cut on silence
+        "SPEECH_CHUNKS_ENABLED": os.getenv("SPEECH_CHUNKS_ENABLED", "false").lower() in ("1", "true", "yes"),
+        "SPEECH_CHUNK_SECONDS": _positive_float("SPEECH_CHUNK_SECONDS", "30"),
+        "SPEECH_CHUNK_OVERLAP_SECONDS": float(os.getenv("SPEECH_CHUNK_OVERLAP_SECONDS", "1")),
+
+        # Cut silence out of stored audio (a trim map keeps offsets to the original timeline)
+        "TRIM_SILENCE_ENABLED": os.getenv("TRIM_SILENCE_ENABLED", "false").lower() in ("1", "true", "yes"),
+
+        # Upload a multi-resolution waveform peaks sidecar (.peaks) next to every MP3
+        "WAVEFORM_PEAKS_ENABLED": os.getenv("WAVEFORM_PEAKS_ENABLED", "true").lower() in ("1", "true", "yes"),
+
+        # Admission control: scratch disk/RAM reserved by concurrent downloads (estimated from duration)
+        "SCRATCH_DISK_BUDGET_BYTES": int(float(os.getenv("SCRATCH_DISK_BUDGET_GB", "20")) * 1024**3),
+        "SCRATCH_MIN_FREE_BYTES": int(float(os.getenv("SCRATCH_MIN_FREE_GB", "2")) * 1024**3),
+        "SCRATCH_RAM_BUDGET_BYTES": int(float(os.getenv("SCRATCH_RAM_BUDGET_GB", "2")) * 1024**3),
+
+        # Retry policy for failed items: exponential cool-down, quarantine after N consecutive failures
+        "LEDGER_MAX_FAILURES": int(os.getenv("LEDGER_MAX_FAILURES", "5")),
+        "LEDGER_BASE_DELAY_SECONDS": float(os.getenv("LEDGER_BASE_DELAY_SECONDS", "900")),
+        "LEDGER_MAX_DELAY_SECONDS": float(os.getenv("LEDGER_MAX_DELAY_SECONDS", str(7 * 24 * 3600))),
+
+        # Import-time budget for `cli.py --help`, checked by `cli.py dev startup-check`
+        "STARTUP_BUDGET_MS": float(os.getenv("STARTUP_BUDGET_MS", "150")),
+
+        # Output directory for `cli.py --profile` reports
+        "PROFILE_DIR": Path(os.getenv("PROFILE_DIR", str(Path(__file__).parent / "profiles"))),
+
+        # Capacity of each stage queue in `pipeline run` (a full queue blocks the stage feeding it)
+        "PIPELINE_QUEUE_SIZE": int(os.getenv("PIPELINE_QUEUE_SIZE", "20")),
+
+        # Concurrent transcript uploads (each file is small, so uploads are latency-bound)
+        "TRANSCRIPT_UPLOAD_WORKERS": int(os.getenv("TRANSCRIPT_UPLOAD_WORKERS", "8")),
+
+        # Where upload manifests of transcript directories are kept (default: WORK_DIR/transcript-manifests)
+        "TRANSCRIPT_MANIFEST_DIR": Path(os.environ["TRANSCRIPT_MANIFEST_DIR"]) if os.getenv("TRANSCRIPT_MANIFEST_DIR") else None,
+
+        # Upload transcripts as compact JSON (no indentation, UTF-8 instead of \u escapes)
+        "TRANSCRIPT_NORMALIZE": os.getenv("TRANSCRIPT_NORMALIZE", "false").lower() in ("1", "true", "yes"),
+
+        # Content-Encoding of uploaded transcripts: identity, gzip or zstd (zstd needs the zstandard package)
+        "TRANSCRIPT_CONTENT_ENCODING": os.getenv("TRANSCRIPT_CONTENT_ENCODING", "identity").lower(),
+
+        # Upload a segment index sidecar (.idx) with each transcript for time-offset lookups
+        "TRANSCRIPT_INDEX_ENABLED": os.getenv("TRANSCRIPT_INDEX_ENABLED", "true").lower() in ("1", "true", "yes"),
+
+        # Load each uploaded transcript's segments into sources.transcript_segments (keeps search current)
+        "TRANSCRIPT_SEGMENTS_ON_UPLOAD": os.getenv("TRANSCRIPT_SEGMENTS_ON_UPLOAD", "true").lower() in ("1", "true", "yes"),
+
+        # Series prefixes listed concurrently by `reconcile` (each listing is latency-bound)
+        "RECONCILE_WORKERS": int(os.getenv("RECONCILE_WORKERS", "8")),
+    }
 
-# Logging Configuration
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
-# Pipeline Configuration
-BATCH_SIZE = int(os.getenv("BATCH_SIZE", "100"))
+def __getattr__(name: str) -> Any:
+    """Resolve non-secret settings lazily on first attribute access."""
+    if name.isupper() and name in __all__:
+        globals().update(_load_settings())
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1 @@
+"""Audio processing helpers (FFmpeg/PCM based derivatives)."""
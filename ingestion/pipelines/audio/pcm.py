@@ -0,0 +1,49 @@
+"""Streaming PCM decoding with FFmpeg into NumPy arrays."""
+
+import subprocess
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+
+
+def iter_pcm_blocks(
+    path: Path,
+    sample_rate: int = 16000,
+    block_samples: int = 16000 * 60
+) -> Iterator[np.ndarray]:
+    """Decode an audio file to mono float32 samples, one block at a time.
+
+    Memory use is bounded by the block size regardless of the file length.
+
+    Args:
+        path: Audio file FFmpeg can read
+        sample_rate: Output sample rate in Hz
+        block_samples: Samples per yielded block (the last block may be shorter)
+
+    Yields:
+        float32 arrays of samples in [-1.0, 1.0]
+    """
+    process = subprocess.Popen(
+        [
+            'ffmpeg', '-hide_banner', '-loglevel', 'error',
+            '-i', str(path),
+            '-vn', '-ac', '1', '-ar', str(sample_rate), '-f', 's16le', '-',
+        ],
+        stdout=subprocess.PIPE
+    )
+    assert process.stdout is not None
+    block_bytes = block_samples * 2
+    try:
+        while True:
+            data = process.stdout.read(block_bytes)
+            if not data:
+                break
+            # Guard against an odd trailing byte
+            data = data[:len(data) - (len(data) % 2)]
+            yield np.frombuffer(data, dtype='<i2').astype(np.float32) / 32768.0
+    finally:
+        process.stdout.close()
+        returncode = process.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, process.args)
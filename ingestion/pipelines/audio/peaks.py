@@ -0,0 +1,132 @@
+"""Multi-resolution waveform peaks for audio players and previews."""
+
+import struct
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+
+from pipelines.audio.pcm import iter_pcm_blocks
+
+PEAKS_SAMPLE_RATE = 8000
+
+# Binary layout (little endian):
+#   header:  magic "KTPK", version u16, level count u16, sample rate u32, duration ms u32
+#   per level: samples per peak u32, peak count u32, data offset u32
+#   data:    per level, `peak count` interleaved (min, max) int8 pairs
+MAGIC = b"KTPK"
+VERSION = 1
+_HEADER = struct.Struct("<4sHHII")
+_LEVEL = struct.Struct("<III")
+
+
+def compute_peaks(
+    path: Path,
+    samples_per_peak: int = 800,
+    level_factor: int = 4,
+    min_peaks: int = 2000
+) -> Tuple[float, List[Tuple[int, np.ndarray, np.ndarray]]]:
+    """Compute min/max peaks of a recording at several resolutions.
+
+    The finest level has one peak per `samples_per_peak` samples at 8 kHz
+    (10 per second by default); each following level is `level_factor`
+    times coarser, down to the first level with at most `min_peaks` peaks.
+
+    Args:
+        path: Audio file FFmpeg can read
+        samples_per_peak: Samples per peak at the finest level
+        level_factor: Resolution ratio between consecutive levels
+        min_peaks: Stop adding levels once a level has at most this many peaks
+
+    Returns:
+        Tuple of (duration in seconds, [(samples per peak, mins, maxs), ...])
+        with mins/maxs as float32 arrays in [-1.0, 1.0]
+    """
+    mins, maxs = [], []
+    total = 0
+    carry = np.zeros(0, dtype=np.float32)
+    for block in iter_pcm_blocks(path, PEAKS_SAMPLE_RATE, samples_per_peak * 600):
+        total += len(block)
+        block = np.concatenate((carry, block)) if len(carry) else block
+        usable = len(block) - (len(block) % samples_per_peak)
+        frames = block[:usable].reshape(-1, samples_per_peak)
+        mins.append(frames.min(axis=1))
+        maxs.append(frames.max(axis=1))
+        carry = block[usable:]
+    if len(carry):
+        mins.append(carry.min(keepdims=True))
+        maxs.append(carry.max(keepdims=True))
+
+    level_mins = np.concatenate(mins) if mins else np.zeros(0, dtype=np.float32)
+    level_maxs = np.concatenate(maxs) if maxs else np.zeros(0, dtype=np.float32)
+    levels = [(samples_per_peak, level_mins, level_maxs)]
+
+    while len(level_mins) > min_peaks:
+        pad = (-len(level_mins)) % level_factor
+        # Pad with neutral values so partial groups reduce correctly
+        level_mins = np.concatenate((level_mins, np.full(pad, np.inf, dtype=np.float32)))
+        level_maxs = np.concatenate((level_maxs, np.full(pad, -np.inf, dtype=np.float32)))
+        level_mins = level_mins.reshape(-1, level_factor).min(axis=1)
+        level_maxs = level_maxs.reshape(-1, level_factor).max(axis=1)
+        levels.append((levels[-1][0] * level_factor, level_mins, level_maxs))
+
+    return total / PEAKS_SAMPLE_RATE, levels
+
+
+def encode_peaks(duration: float, levels: List[Tuple[int, np.ndarray, np.ndarray]]) -> bytes:
+    """Serialize peaks into the compact binary sidecar format.
+
+    Args:
+        duration: Duration in seconds
+        levels: Levels from compute_peaks
+
+    Returns:
+        Encoded bytes (8-bit min/max pairs per peak)
+    """
+    offset = _HEADER.size + _LEVEL.size * len(levels)
+    level_headers, payloads = [], []
+    for spp, level_mins, level_maxs in levels:
+        pairs = np.empty(len(level_mins) * 2, dtype=np.int8)
+        pairs[0::2] = np.clip(np.round(level_mins * 127), -128, 127)
+        pairs[1::2] = np.clip(np.round(level_maxs * 127), -128, 127)
+        level_headers.append(_LEVEL.pack(spp, len(level_mins), offset))
+        payloads.append(pairs.tobytes())
+        offset += len(pairs)
+
+    header = _HEADER.pack(MAGIC, VERSION, len(levels), PEAKS_SAMPLE_RATE, int(round(duration * 1000)))
+    return header + b"".join(level_headers) + b"".join(payloads)
+
+
+def decode_peaks(data: bytes) -> Tuple[float, List[Tuple[int, np.ndarray, np.ndarray]]]:
+    """Parse a peaks sidecar.
+
+    Args:
+        data: Bytes produced by encode_peaks
+
+    Returns:
+        Tuple of (duration in seconds, [(samples per peak, mins, maxs), ...])
+        with mins/maxs as int8 arrays
+    """
+    magic, version, level_count, sample_rate, duration_ms = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a peaks file or unsupported version")
+
+    levels = []
+    for index in range(level_count):
+        spp, count, offset = _LEVEL.unpack_from(data, _HEADER.size + index * _LEVEL.size)
+        pairs = np.frombuffer(data, dtype=np.int8, count=count * 2, offset=offset)
+        levels.append((spp, pairs[0::2], pairs[1::2]))
+    return duration_ms / 1000, levels
+
+
+def build_peaks(path: Path) -> bytes:
+    """Compute and encode the peaks sidecar for an audio file.
+
+    Args:
+        path: Audio file FFmpeg can read
+
+    Returns:
+        Encoded peaks sidecar
+    """
+    duration, levels = compute_peaks(path)
+    return encode_peaks(duration, levels)
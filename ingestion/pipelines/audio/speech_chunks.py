@@ -0,0 +1,211 @@
+"""Speech-optimized audio derivative: 16 kHz mono chunks cut on silence."""
+
+import logging
+import re
+import subprocess
+import wave
+from pathlib import Path
+from typing import List, Tuple, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+CHANNELS = 1
+SAMPLE_WIDTH = 2  # 16-bit PCM
+
+_SILENCE_START_RE = re.compile(r"silence_start:\s*(-?[\d.]+)")
+_SILENCE_END_RE = re.compile(r"silence_end:\s*(-?[\d.]+)")
+
+
+def convert_to_speech_wav(source_path: Path, output_path: Path) -> None:
+    """Decode and resample audio to 16 kHz mono 16-bit PCM WAV.
+
+    Args:
+        source_path: Any audio file FFmpeg can read
+        output_path: Destination WAV path
+    """
+    subprocess.run(
+        [
+            'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
+            '-i', str(source_path),
+            '-vn', '-ac', str(CHANNELS), '-ar', str(SAMPLE_RATE), '-c:a', 'pcm_s16le',
+            str(output_path),
+        ],
+        check=True
+    )
+
+
+def detect_silences(
+    wav_path: Path,
+    noise_db: float = -35.0,
+    min_silence: float = 0.4
+) -> List[Tuple[float, float]]:
+    """Find silent intervals with FFmpeg's silencedetect filter.
+
+    Args:
+        wav_path: Audio file to analyze
+        noise_db: Level below which audio counts as silence
+        min_silence: Minimum silence length in seconds
+
+    Returns:
+        List of (start, end) silence intervals in seconds
+    """
+    result = subprocess.run(
+        [
+            'ffmpeg', '-hide_banner', '-nostats',
+            '-i', str(wav_path),
+            '-af', f'silencedetect=noise={noise_db}dB:d={min_silence}',
+            '-f', 'null', '-',
+        ],
+        check=True,
+        capture_output=True,
+        text=True
+    )
+
+    silences = []
+    start = None
+    for line in result.stderr.splitlines():
+        match = _SILENCE_START_RE.search(line)
+        if match:
+            start = max(0.0, float(match.group(1)))
+            continue
+        match = _SILENCE_END_RE.search(line)
+        if match and start is not None:
+            silences.append((start, float(match.group(1))))
+            start = None
+    return silences
+
+
+def plan_chunks(
+    duration: float,
+    silences: List[Tuple[float, float]],
+    chunk_seconds: float = 30.0,
+    overlap_seconds: float = 1.0,
+    search_seconds: float = 5.0
+) -> List[Tuple[float, float]]:
+    """Plan chunk boundaries of roughly fixed length, cut inside silences.
+
+    Each cut is placed at the middle of the latest silence ending within
+    `search_seconds` before the target length; without such a silence the
+    chunk is cut at exactly `chunk_seconds`. Every chunk after the first
+    starts `overlap_seconds` before the previous cut. The search window is
+    capped at half a chunk so every cut moves forward.
+
+    Args:
+        duration: Total audio duration in seconds
+        silences: Silent intervals from detect_silences
+        chunk_seconds: Target chunk length
+        overlap_seconds: Overlap between consecutive chunks
+        search_seconds: How far before the target length to look for silence
+
+    Returns:
+        List of (start, end) chunk intervals in seconds on the original timeline
+
+    Raises:
+        ValueError: If chunk_seconds is not positive
+    """
+    if chunk_seconds <= 0:
+        raise ValueError(f"chunk_seconds must be positive, got {chunk_seconds}")
+    search_seconds = min(search_seconds, chunk_seconds / 2)
+    chunks = []
+    cut = 0.0
+    while cut < duration:
+        start = max(0.0, cut - overlap_seconds) if chunks else 0.0
+        target = cut + chunk_seconds
+        if target >= duration:
+            chunks.append((start, duration))
+            break
+
+        next_cut = target
+        for silence_start, silence_end in silences:
+            middle = (silence_start + silence_end) / 2
+            if middle > cut and target - search_seconds <= middle <= target:
+                next_cut = middle
+            elif middle > target:
+                break
+
+        chunks.append((start, next_cut))
+        cut = next_cut
+    return chunks
+
+
+def write_chunks(wav_path: Path, out_dir: Path, chunks: List[Tuple[float, float]]) -> List[Path]:
+    """Slice a PCM WAV file into chunk files without re-encoding.
+
+    Args:
+        wav_path: 16 kHz mono WAV produced by convert_to_speech_wav
+        out_dir: Directory for chunk files
+        chunks: (start, end) intervals in seconds
+
+    Returns:
+        Paths of the written chunk files, in order
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    with wave.open(str(wav_path), 'rb') as src:
+        rate = src.getframerate()
+        for index, (start, end) in enumerate(chunks):
+            src.setpos(int(start * rate))
+            frames = src.readframes(int((end - start) * rate))
+            path = out_dir / f"{index:04d}.wav"
+            with wave.open(str(path), 'wb') as dst:
+                dst.setnchannels(src.getnchannels())
+                dst.setsampwidth(src.getsampwidth())
+                dst.setframerate(rate)
+                dst.writeframes(frames)
+            paths.append(path)
+    return paths
+
+
+def build_speech_chunks(
+    source_path: Path,
+    out_dir: Path,
+    chunk_seconds: float = 30.0,
+    overlap_seconds: float = 1.0
+) -> Dict[str, Any]:
+    """Produce 16 kHz mono chunks of a recording and describe them in a manifest.
+
+    Args:
+        source_path: Source audio file
+        out_dir: Directory for the intermediate WAV and chunk files
+        chunk_seconds: Target chunk length
+        overlap_seconds: Overlap between consecutive chunks
+
+    Returns:
+        Manifest dictionary; each chunk entry has index, file, start, end and bytes.
+        Chunk files are in `out_dir`.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    wav_path = out_dir / "speech.wav"
+    convert_to_speech_wav(source_path, wav_path)
+
+    with wave.open(str(wav_path), 'rb') as wav:
+        duration = wav.getnframes() / wav.getframerate()
+
+    silences = detect_silences(wav_path)
+    chunks = plan_chunks(duration, silences, chunk_seconds, overlap_seconds)
+    paths = write_chunks(wav_path, out_dir / "chunks", chunks)
+    wav_path.unlink()
+
+    logger.info(
+        f"Split {duration:.0f}s of speech audio into {len(chunks)} chunks "
+        f"({len(silences)} silences detected)"
+    )
+    return {
+        "sample_rate": SAMPLE_RATE,
+        "channels": CHANNELS,
+        "format": "wav/pcm_s16le",
+        "duration": round(duration, 3),
+        "chunk_seconds": chunk_seconds,
+        "overlap_seconds": overlap_seconds,
+        "chunks": [
+            {
+                "index": index,
+                "file": path.name,
+                "start": round(start, 3),
+                "end": round(end, 3),
+                "bytes": path.stat().st_size,
+            }
+            for index, ((start, end), path) in enumerate(zip(chunks, paths))
+        ],
+    }
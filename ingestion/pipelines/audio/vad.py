@@ -0,0 +1,199 @@
+"""Energy-based voice activity detection and silence trimming."""
+
+import logging
+import subprocess
+from pathlib import Path
+from typing import List, Tuple, Dict, Any
+
+import numpy as np
+
+from pipelines.audio.pcm import iter_pcm_blocks
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_SAMPLE_RATE = 16000
+
+
+def frame_energies(path: Path, frame_seconds: float = 0.03) -> np.ndarray:
+    """Compute the RMS level of each frame of a recording, in dBFS.
+
+    Decodes in bounded-size blocks; only the per-frame levels are kept.
+
+    Args:
+        path: Audio file FFmpeg can read
+        frame_seconds: Analysis frame length
+
+    Returns:
+        float32 array with one dBFS value per frame
+    """
+    frame = int(ANALYSIS_SAMPLE_RATE * frame_seconds)
+    # Whole frames per block so frames never straddle blocks
+    block_samples = frame * 2000
+    levels = []
+    for block in iter_pcm_blocks(path, ANALYSIS_SAMPLE_RATE, block_samples):
+        usable = len(block) - (len(block) % frame)
+        if usable == 0:
+            continue
+        frames = block[:usable].reshape(-1, frame)
+        rms = np.sqrt(np.mean(frames * frames, axis=1))
+        levels.append(20 * np.log10(np.maximum(rms, 1e-6)))
+    if not levels:
+        return np.zeros(0, dtype=np.float32)
+    return np.concatenate(levels).astype(np.float32)
+
+
+def detect_speech(
+    levels_db: np.ndarray,
+    frame_seconds: float = 0.03,
+    margin_db: float = 12.0,
+    min_silence: float = 1.0,
+    padding: float = 0.25
+) -> List[Tuple[float, float]]:
+    """Find speech segments from per-frame levels.
+
+    The threshold adapts to the recording: frames louder than the noise
+    floor (10th percentile level) plus `margin_db` count as speech. Gaps
+    shorter than `min_silence` are bridged and each segment is padded so
+    word onsets and endings are kept.
+
+    Args:
+        levels_db: Per-frame dBFS levels from frame_energies
+        frame_seconds: Analysis frame length used for `levels_db`
+        margin_db: Level above the noise floor that counts as speech
+        min_silence: Shortest silence (seconds) that is removed
+        padding: Seconds kept before and after every speech segment
+
+    Returns:
+        List of (start, end) speech segments in seconds on the original timeline
+    """
+    if len(levels_db) == 0:
+        return []
+
+    noise_floor = float(np.percentile(levels_db, 10))
+    active = levels_db > noise_floor + margin_db
+    if not active.any():
+        return []
+
+    # Run boundaries: +1 where speech starts, -1 where it ends
+    edges = np.diff(np.concatenate(([0], active.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1) * frame_seconds
+    ends = np.flatnonzero(edges == -1) * frame_seconds
+
+    # Bridge short gaps, then pad and clip to the recording
+    gaps = starts[1:] - ends[:-1]
+    keep = np.concatenate(([True], gaps >= min_silence))
+    merged_starts = starts[keep]
+    merged_ends = np.concatenate((ends[np.flatnonzero(keep)[1:] - 1], ends[-1:]))
+
+    duration = len(levels_db) * frame_seconds
+    merged_starts = np.maximum(0.0, merged_starts - padding)
+    merged_ends = np.minimum(duration, merged_ends + padding)
+    return [(round(float(s), 3), round(float(e), 3)) for s, e in zip(merged_starts, merged_ends)]
+
+
+def build_trim_map(segments: List[Tuple[float, float]], duration: float) -> Dict[str, Any]:
+    """Describe how the trimmed timeline maps back to the original.
+
+    Args:
+        segments: Kept (start, end) segments on the original timeline
+        duration: Original duration in seconds
+
+    Returns:
+        Map with original/trimmed durations and, per segment, its original
+        start/end and its start on the trimmed timeline
+    """
+    entries = []
+    trimmed = 0.0
+    for start, end in segments:
+        entries.append({"start": start, "end": end, "trimmed_start": round(trimmed, 3)})
+        trimmed += end - start
+    return {
+        "original_duration": round(duration, 3),
+        "trimmed_duration": round(trimmed, 3),
+        "segments": entries,
+    }
+
+
+def to_original_time(trim_map: Dict[str, Any], trimmed_time: float) -> float:
+    """Convert a time on the trimmed timeline to the original timeline.
+
+    Args:
+        trim_map: Map from build_trim_map
+        trimmed_time: Seconds into the trimmed audio
+
+    Returns:
+        Seconds into the original recording
+    """
+    segments = trim_map["segments"]
+    if not segments:
+        return trimmed_time
+    starts = [s["trimmed_start"] for s in segments]
+    index = max(0, int(np.searchsorted(starts, trimmed_time, side="right")) - 1)
+    segment = segments[index]
+    return segment["start"] + (trimmed_time - segment["trimmed_start"])
+
+
+def trim_to_mp3(
+    source_path: Path,
+    segments: List[Tuple[float, float]],
+    output_path: Path,
+    bitrate: str = '192k'
+) -> None:
+    """Encode only the given segments of a recording to MP3.
+
+    The segment list is passed to FFmpeg as a filter script, so recordings
+    with many segments do not hit command-line length limits.
+
+    Args:
+        source_path: Source audio file
+        segments: (start, end) segments to keep, in seconds
+        output_path: Destination MP3 path
+        bitrate: MP3 bitrate
+    """
+    expression = "+".join(f"between(t,{start:.3f},{end:.3f})" for start, end in segments)
+    script_path = output_path.with_name(output_path.stem + '.filter')
+    script_path.write_text(f"aselect='{expression}',asetpts=N/SR/TB", encoding='utf-8')
+    tmp_path = output_path.with_name(output_path.stem + '.tmp.mp3')
+    try:
+        subprocess.run(
+            [
+                'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
+                '-i', str(source_path),
+                '-vn', '-filter_script:a', str(script_path),
+                '-codec:a', 'libmp3lame', '-b:a', bitrate,
+                str(tmp_path),
+            ],
+            check=True
+        )
+        tmp_path.replace(output_path)
+    finally:
+        script_path.unlink(missing_ok=True)
+
+
+def trim_silence(source_path: Path, output_path: Path) -> Dict[str, Any]:
+    """Detect speech in a recording and encode only the speech to MP3.
+
+    Args:
+        source_path: Source audio file
+        output_path: Destination MP3 path
+
+    Returns:
+        Trim map (see build_trim_map)
+    """
+    frame_seconds = 0.03
+    levels = frame_energies(source_path, frame_seconds)
+    duration = len(levels) * frame_seconds
+    segments = detect_speech(levels, frame_seconds)
+    if not segments:
+        # Nothing recognizable as speech; keep the recording whole
+        segments = [(0.0, round(duration, 3))]
+
+    trim_map = build_trim_map(segments, duration)
+    trim_to_mp3(source_path, segments, output_path)
+
+    removed = trim_map["original_duration"] - trim_map["trimmed_duration"]
+    logger.info(
+        f"Trimmed {removed:.0f}s of silence "
+        f"({removed / duration * 100 if duration else 0:.1f}% of {duration:.0f}s, {len(segments)} segments)"
+    )
+    return trim_map
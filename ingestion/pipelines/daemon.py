@@ -0,0 +1,156 @@
+"""Long-running ingestion daemon woken by Postgres LISTEN/NOTIFY."""
+
+import logging
+import select
+import signal
+import time
+from typing import Optional
+
+import psycopg2
+import psycopg2.extensions
+
+import config
+from pipelines.youtube.download_audio import YouTubeAudioDownloader
+
+logger = logging.getLogger(__name__)
+
+
+class IngestionDaemon:
+    """Processes the audio backlog continuously with warm clients.
+
+    The downloader (S3 client, DB engine and pool, yt-dlp import) is created
+    once and reused for every pass. A pass runs whenever a
+    `youtube_video_inserted` notification arrives (raised by a trigger on
+    sources.youtube_videos) and at least every `poll_interval` seconds as a
+    fallback for missed notifications and retries.
+    """
+
+    CHANNEL = "youtube_video_inserted"
+
+    def __init__(
+        self,
+        downloader: Optional[YouTubeAudioDownloader] = None,
+        listen_url: Optional[str] = None,
+        poll_interval: float = 300.0,
+        debounce: float = 2.0
+    ):
+        """Initialize the daemon.
+
+        Args:
+            downloader: Audio downloader to reuse (created if not provided)
+            listen_url: Direct (non-pooled) Postgres URL for LISTEN (uses config if not provided)
+            poll_interval: Seconds between passes when no notification arrives
+            debounce: Seconds to wait after a notification so bulk inserts are handled in one pass
+        """
+        self.downloader = downloader or YouTubeAudioDownloader()
+        self.listen_url = listen_url or config.get_database_listen_url()
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self._conn: Optional[psycopg2.extensions.connection] = None
+        self._stopping = False
+
+    def _connect(self) -> None:
+        """Open the LISTEN connection."""
+        # libpq does not understand SQLAlchemy driver suffixes (postgresql+psycopg2://)
+        url = self.listen_url.replace("postgresql+psycopg2://", "postgresql://", 1)
+        self._conn = psycopg2.connect(url)
+        self._conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+        with self._conn.cursor() as cur:
+            cur.execute(f"LISTEN {self.CHANNEL}")
+        logger.info(f"Listening for '{self.CHANNEL}' notifications")
+
+    def _close(self) -> None:
+        """Close the LISTEN connection, ignoring errors."""
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+    def _drain(self) -> int:
+        """Consume pending notifications.
+
+        Returns:
+            Number of notifications consumed
+        """
+        assert self._conn is not None
+        self._conn.poll()
+        count = len(self._conn.notifies)
+        self._conn.notifies.clear()
+        return count
+
+    def _wait(self, timeout: float) -> bool:
+        """Wait for a notification or the timeout.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if woken by a notification
+        """
+        if self._conn is None:
+            self._connect()
+        assert self._conn is not None
+
+        if self._drain():
+            return True
+
+        deadline = time.monotonic() + timeout
+        while not self._stopping:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            # Wake at least once a second to notice stop requests
+            readable, _, _ = select.select([self._conn], [], [], min(remaining, 1.0))
+            if readable and self._drain():
+                return True
+        return False
+
+    def _sleep(self, seconds: float) -> None:
+        """Sleep, waking early when a stop is requested.
+
+        Args:
+            seconds: Maximum seconds to sleep
+        """
+        deadline = time.monotonic() + seconds
+        while not self._stopping and time.monotonic() < deadline:
+            time.sleep(max(0.0, min(deadline - time.monotonic(), 1.0)))
+
+    def stop(self, *_args) -> None:
+        """Request a graceful stop after the current pass."""
+        logger.info("Stop requested, finishing current pass")
+        self._stopping = True
+
+    def run(self) -> None:
+        """Run passes until stopped (SIGINT/SIGTERM)."""
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        logger.info("Ingestion daemon started")
+        try:
+            while not self._stopping:
+                try:
+                    stats = self.downloader.process_all_videos(metrics_dir=config.METRICS_DIR)
+                    if stats["total"]:
+                        logger.info(f"Pass complete: {stats}")
+                except Exception as e:
+                    # Transient Postgres/S3 errors must not end the daemon
+                    logger.error(f"Pass failed: {e}; retrying in {self.poll_interval:.0f}s")
+                    self._sleep(self.poll_interval)
+                    continue
+
+                try:
+                    woken = self._wait(self.poll_interval)
+                    if woken:
+                        logger.info("New videos announced, starting pass")
+                        # Let a burst of inserts settle into a single pass
+                        time.sleep(self.debounce)
+                        self._drain()
+                except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+                    logger.warning(f"LISTEN connection lost ({e}), reconnecting")
+                    self._close()
+                    time.sleep(5)
+        finally:
+            self._close()
+            logger.info("Ingestion daemon stopped")
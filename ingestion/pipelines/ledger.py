@@ -0,0 +1,281 @@
+"""Persistent run ledger and per-item retry state with exponential backoff."""
+
+import logging
+import socket
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, Set, Iterable, List
+
+from sqlalchemy import and_, or_, exists, func
+from sqlalchemy.dialects.postgresql import insert
+
+import config
+from kol_torah_db.models import IngestionRun, IngestionAttempt, IngestionItemState
+from pipelines.utils import get_db_session
+
+logger = logging.getLogger(__name__)
+
+
+class RunLedger:
+    """Records runs and item attempts, and decides which items may be retried.
+
+    A failed item gets a retry state with an exponentially growing
+    cool-down (base_delay * 2^(failures-1), capped at max_delay). Work
+    selection skips items that are still cooling down, and an item is
+    quarantined (skipped until released) after `max_failures` consecutive
+    failures. A success clears the item's state.
+
+    Usage:
+        ledger = RunLedger("youtube-audio")
+        ledger.start()
+        query = query.filter(ledger.eligible(YoutubeVideo.video_id))
+        ledger.record_failure(video_id, "download", error)
+        ledger.finish(stats)  # or ledger.abort(stats) when the run raised
+    """
+
+    def __init__(
+        self,
+        pipeline: str,
+        max_failures: Optional[int] = None,
+        base_delay: Optional[float] = None,
+        max_delay: Optional[float] = None
+    ):
+        """Initialize the ledger.
+
+        Args:
+            pipeline: Pipeline name (e.g. youtube-audio, transcript-upload)
+            max_failures: Consecutive failures before quarantine (uses config if not provided)
+            base_delay: Cool-down after the first failure, in seconds (uses config if not provided)
+            max_delay: Longest cool-down, in seconds (uses config if not provided)
+        """
+        self.pipeline = pipeline
+        self.max_failures = max_failures or config.LEDGER_MAX_FAILURES
+        self.base_delay = base_delay or config.LEDGER_BASE_DELAY_SECONDS
+        self.max_delay = max_delay or config.LEDGER_MAX_DELAY_SECONDS
+        self.run_id: Optional[int] = None
+
+    def start(self) -> int:
+        """Create the run record.
+
+        Returns:
+            Database ID of the run
+        """
+        with get_db_session() as session:
+            run = IngestionRun(pipeline=self.pipeline, status="running", hostname=socket.gethostname())
+            session.add(run)
+            session.flush()
+            self.run_id = int(run.id)  # type: ignore
+        logger.info(f"Started {self.pipeline} run {self.run_id}")
+        return self.run_id
+
+    def finish(self, stats: Dict[str, Any], status: str = "completed") -> None:
+        """Close the run record.
+
+        Args:
+            stats: Run statistics to store
+            status: Final status (completed or failed)
+        """
+        if self.run_id is None:
+            return
+        with get_db_session() as session:
+            run = session.query(IngestionRun).filter(IngestionRun.id == self.run_id).first()
+            if run:
+                run.status = status  # type: ignore
+                run.stats = stats  # type: ignore
+                run.finished_at = func.now()  # type: ignore
+
+    def abort(self, stats: Dict[str, Any]) -> None:
+        """Close the run record as failed after an error.
+
+        Called from an exception handler, so errors closing the record are
+        logged rather than raised over the original one.
+
+        Args:
+            stats: Statistics gathered before the error
+        """
+        try:
+            self.finish(stats, status="failed")
+        except Exception as e:
+            logger.error(f"Failed to close {self.pipeline} run {self.run_id}: {e}")
+
+    def eligible(self, key_column):
+        """SQL condition selecting items that are not cooling down or quarantined.
+
+        Args:
+            key_column: Column holding the item key (e.g. YoutubeVideo.video_id)
+
+        Returns:
+            SQLAlchemy boolean clause for use in `.filter()`
+        """
+        return ~exists().where(and_(
+            IngestionItemState.pipeline == self.pipeline,
+            IngestionItemState.item_key == key_column,
+            or_(
+                IngestionItemState.quarantined.is_(True),
+                IngestionItemState.next_eligible_at > func.now()
+            )
+        ))
+
+    def blocked_keys(self, keys: Optional[Iterable[str]] = None) -> Set[str]:
+        """Get item keys that are cooling down or quarantined.
+
+        Args:
+            keys: Restrict the lookup to these keys (None for all)
+
+        Returns:
+            Set of blocked item keys
+        """
+        with get_db_session() as session:
+            query = session.query(IngestionItemState.item_key).filter(
+                IngestionItemState.pipeline == self.pipeline,
+                or_(
+                    IngestionItemState.quarantined.is_(True),
+                    IngestionItemState.next_eligible_at > func.now()
+                )
+            )
+            if keys is not None:
+                query = query.filter(IngestionItemState.item_key.in_(list(keys)))
+            return {row[0] for row in query.all()}
+
+    def _add_attempt(self, session, item_key: str, status: str, attempt: int, **fields) -> None:
+        """Insert an attempt record for the current run."""
+        if self.run_id is None:
+            return
+        session.add(IngestionAttempt(
+            run_id=self.run_id,
+            pipeline=self.pipeline,
+            item_key=item_key,
+            status=status,
+            attempt=attempt,
+            **fields
+        ))
+
+    def record_success(self, item_key: str, status: str = "succeeded") -> None:
+        """Record a successful (or skipped) attempt and clear the item's retry state.
+
+        Args:
+            item_key: Item key (e.g. YouTube video ID)
+            status: Attempt status to record (succeeded or skipped)
+        """
+        with get_db_session() as session:
+            state = session.query(IngestionItemState).filter(
+                IngestionItemState.pipeline == self.pipeline,
+                IngestionItemState.item_key == item_key
+            ).first()
+            attempt = (int(state.failures) + 1) if state else 1  # type: ignore
+            self._add_attempt(session, item_key, status, attempt)
+            if state:
+                session.delete(state)
+
+    def record_successes(self, item_keys: Iterable[str], status: str = "succeeded") -> None:
+        """Record successful attempts of many items in one transaction (see `record_success`).
+
+        Args:
+            item_keys: Item keys (e.g. YouTube video IDs)
+            status: Attempt status to record (succeeded or skipped)
+        """
+        keys = list(item_keys)
+        if not keys:
+            return
+        with get_db_session() as session:
+            states = {
+                state.item_key: state
+                for state in session.query(IngestionItemState).filter(
+                    IngestionItemState.pipeline == self.pipeline,
+                    IngestionItemState.item_key.in_(keys)
+                ).all()
+            }
+            for key in keys:
+                state = states.get(key)
+                self._add_attempt(session, key, status, (int(state.failures) + 1) if state else 1)  # type: ignore
+                if state:
+                    session.delete(state)
+
+    def record_failure(self, item_key: str, stage: Optional[str], error: BaseException) -> datetime:
+        """Record a failed attempt and schedule the next eligible time.
+
+        Args:
+            item_key: Item key (e.g. YouTube video ID)
+            stage: Stage that failed (None if unknown)
+            error: The exception
+
+        Returns:
+            Time from which the item may be retried
+        """
+        with get_db_session() as session:
+            state = session.query(IngestionItemState).filter(
+                IngestionItemState.pipeline == self.pipeline,
+                IngestionItemState.item_key == item_key
+            ).with_for_update().first()
+
+            failures = (int(state.failures) if state else 0) + 1  # type: ignore
+            delay = min(self.max_delay, self.base_delay * (2 ** (failures - 1)))
+            next_eligible_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
+            quarantined = failures >= self.max_failures
+            error_class = type(error).__name__
+
+            values = {
+                "failures": failures,
+                "last_stage": stage,
+                "last_error_class": error_class,
+                "next_eligible_at": next_eligible_at,
+                "quarantined": quarantined,
+            }
+            session.execute(
+                insert(IngestionItemState)
+                .values(pipeline=self.pipeline, item_key=item_key, **values)
+                .on_conflict_do_update(
+                    constraint="uq_ingestion_item_states_pipeline_item_key",
+                    set_={**values, "updated_at": func.now()}
+                )
+            )
+            self._add_attempt(
+                session, item_key, "failed", failures,
+                stage=stage,
+                error_class=error_class,
+                error_message=str(error)[:2000],
+                next_eligible_at=next_eligible_at
+            )
+
+        if quarantined:
+            logger.warning(f"Quarantined {self.pipeline} item {item_key} after {failures} failures")
+        else:
+            logger.info(f"{self.pipeline} item {item_key} may be retried after {next_eligible_at:%Y-%m-%d %H:%M} UTC")
+        return next_eligible_at
+
+    def quarantined(self) -> List[Dict[str, Any]]:
+        """List quarantined items of this pipeline.
+
+        Returns:
+            List of dictionaries with item_key, failures, last_stage, last_error_class and updated_at
+        """
+        with get_db_session() as session:
+            rows = session.query(IngestionItemState).filter(
+                IngestionItemState.pipeline == self.pipeline,
+                IngestionItemState.quarantined.is_(True)
+            ).order_by(IngestionItemState.updated_at).all()
+            return [
+                {
+                    "item_key": r.item_key,
+                    "failures": r.failures,
+                    "last_stage": r.last_stage,
+                    "last_error_class": r.last_error_class,
+                    "updated_at": r.updated_at,
+                }
+                for r in rows
+            ]
+
+    def release(self, item_key: str) -> bool:
+        """Clear an item's retry state so the next run picks it up.
+
+        Args:
+            item_key: Item key
+
+        Returns:
+            True if the item had a retry state
+        """
+        with get_db_session() as session:
+            deleted = session.query(IngestionItemState).filter(
+                IngestionItemState.pipeline == self.pipeline,
+                IngestionItemState.item_key == item_key
+            ).delete()
+        return bool(deleted)
@@ -0,0 +1,241 @@
+"""Per-stage timing and throughput metrics for ingestion runs."""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Generator
+
+logger = logging.getLogger(__name__)
+
+
+class StageRecord:
+    """Measurements for one stage of one item."""
+
+    __slots__ = ("item_id", "stage", "started_at", "seconds", "bytes", "retries", "error_class")
+
+    def __init__(self, item_id: str, stage: str):
+        self.item_id = item_id
+        self.stage = stage
+        self.started_at = time.time()
+        self.seconds = 0.0
+        self.bytes = 0
+        self.retries = 0
+        self.error_class: Optional[str] = None
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Throughput of the stage."""
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "item_id": self.item_id,
+            "stage": self.stage,
+            "started_at": datetime.fromtimestamp(self.started_at, timezone.utc).isoformat(),
+            "seconds": round(self.seconds, 3),
+            "bytes": self.bytes,
+            "bytes_per_second": round(self.bytes_per_second, 1),
+            "retries": self.retries,
+            "error_class": self.error_class,
+        }
+
+
+class RunMetrics:
+    """Collects stage records for a pipeline run and exports them.
+
+    Usage:
+        metrics = RunMetrics("youtube-audio")
+        with metrics.stage(video_id, "download") as rec:
+            path = download(...)
+            rec.bytes = path.stat().st_size
+        metrics.write(Path("metrics"))
+    """
+
+    def __init__(self, pipeline: str):
+        """Start collecting metrics for a run.
+
+        Args:
+            pipeline: Pipeline name used in file names and metric labels
+        """
+        self.pipeline = pipeline
+        self.started_at = time.time()
+        self.records: List[StageRecord] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, item_id: str, stage: str) -> Generator[StageRecord, None, None]:
+        """Time a stage of an item; exceptions are recorded and re-raised.
+
+        Args:
+            item_id: Item being processed (e.g. YouTube video ID)
+            stage: Stage name (e.g. download, transcode, upload)
+
+        Yields:
+            StageRecord whose `bytes` and `retries` the caller may fill in
+        """
+        record = StageRecord(item_id, stage)
+        start = time.perf_counter()
+        try:
+            yield record
+        except BaseException as e:
+            record.error_class = type(e).__name__
+            raise
+        finally:
+            record.seconds = time.perf_counter() - start
+            with self._lock:
+                self.records.append(record)
+
+    def add(self, item_id: str, stage: str, seconds: float, bytes: int = 0) -> None:
+        """Record a stage measured by the caller (e.g. only when it turned out to apply).
+
+        Args:
+            item_id: Item being processed
+            stage: Stage name
+            seconds: Wall time of the stage
+            bytes: Bytes handled
+        """
+        record = StageRecord(item_id, stage)
+        record.started_at -= seconds
+        record.seconds = seconds
+        record.bytes = bytes
+        with self._lock:
+            self.records.append(record)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Aggregate records per stage.
+
+        Returns:
+            Mapping of stage name to count, failures, seconds, bytes,
+            bytes_per_second, retries and error counts by class
+        """
+        summary: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            records = list(self.records)
+
+        for r in records:
+            s = summary.setdefault(r.stage, {
+                "count": 0, "failures": 0, "seconds": 0.0, "bytes": 0, "retries": 0, "errors": {}
+            })
+            s["count"] += 1
+            s["seconds"] += r.seconds
+            s["bytes"] += r.bytes
+            s["retries"] += r.retries
+            if r.error_class:
+                s["failures"] += 1
+                s["errors"][r.error_class] = s["errors"].get(r.error_class, 0) + 1
+
+        for s in summary.values():
+            s["bytes_per_second"] = s["bytes"] / s["seconds"] if s["seconds"] > 0 else 0.0
+        return summary
+
+    def format_table(self) -> str:
+        """Render the per-stage summary as a plain-text table."""
+        lines = [
+            f"{'Stage':<12} {'Count':>6} {'Failed':>6} {'Wall (s)':>10} {'MB':>10} {'MB/s':>8} {'Retries':>7}  Errors",
+        ]
+        for stage, s in self.summary().items():
+            errors = ", ".join(f"{cls}={n}" for cls, n in sorted(s["errors"].items()))
+            lines.append(
+                f"{stage:<12} {s['count']:>6} {s['failures']:>6} {s['seconds']:>10.1f} "
+                f"{s['bytes'] / (1024*1024):>10.2f} {s['bytes_per_second'] / (1024*1024):>8.2f} "
+                f"{s['retries']:>7}  {errors}"
+            )
+        return "\n".join(lines)
+
+    def write_jsonl(self, path: Path) -> None:
+        """Write one JSON line per stage record.
+
+        Args:
+            path: Destination file
+        """
+        with self._lock:
+            records = list(self.records)
+        with open(path, 'w', encoding='utf-8') as f:
+            for r in records:
+                f.write(json.dumps({"pipeline": self.pipeline, **r.to_dict()}) + "\n")
+
+    def write_prometheus(self, path: Path) -> None:
+        """Write the summary in Prometheus textfile-collector format.
+
+        The file is written atomically so node_exporter never reads a partial file.
+
+        Args:
+            path: Destination .prom file
+        """
+        prefix = "kol_torah_ingestion_stage"
+        labels = f'pipeline="{self.pipeline}"'
+        summary = self.summary()
+
+        # The file is replaced on every run, so each value describes the last run
+        # only: these are gauges, not counters (a counter that drops back to one
+        # run's totals breaks rate() and increase())
+        lines = [
+            f"# HELP {prefix}_seconds Wall time spent in each stage in the last run.",
+            f"# TYPE {prefix}_seconds gauge",
+        ]
+        lines += [f'{prefix}_seconds{{{labels},stage="{st}"}} {s["seconds"]:.3f}' for st, s in summary.items()]
+        lines += [
+            f"# HELP {prefix}_bytes Bytes handled by each stage in the last run.",
+            f"# TYPE {prefix}_bytes gauge",
+        ]
+        lines += [f'{prefix}_bytes{{{labels},stage="{st}"}} {s["bytes"]}' for st, s in summary.items()]
+        lines += [
+            f"# HELP {prefix}_throughput_bytes_per_second Average throughput of each stage in the last run.",
+            f"# TYPE {prefix}_throughput_bytes_per_second gauge",
+        ]
+        lines += [
+            f'{prefix}_throughput_bytes_per_second{{{labels},stage="{st}"}} {s["bytes_per_second"]:.1f}'
+            for st, s in summary.items()
+        ]
+        lines += [
+            f"# HELP {prefix}_executions Stage executions by outcome in the last run.",
+            f"# TYPE {prefix}_executions gauge",
+        ]
+        for st, s in summary.items():
+            lines.append(f'{prefix}_executions{{{labels},stage="{st}",outcome="success"}} {s["count"] - s["failures"]}')
+            lines.append(f'{prefix}_executions{{{labels},stage="{st}",outcome="failure"}} {s["failures"]}')
+        lines += [
+            f"# HELP {prefix}_retries Retries within each stage in the last run.",
+            f"# TYPE {prefix}_retries gauge",
+        ]
+        lines += [f'{prefix}_retries{{{labels},stage="{st}"}} {s["retries"]}' for st, s in summary.items()]
+        lines += [
+            f"# HELP {prefix}_errors Stage failures by error class in the last run.",
+            f"# TYPE {prefix}_errors gauge",
+        ]
+        for st, s in summary.items():
+            for cls, n in sorted(s["errors"].items()):
+                lines.append(f'{prefix}_errors{{{labels},stage="{st}",error_class="{cls}"}} {n}')
+        lines += [
+            "# HELP kol_torah_ingestion_last_run_timestamp_seconds Start time of the last run.",
+            "# TYPE kol_torah_ingestion_last_run_timestamp_seconds gauge",
+            f"kol_torah_ingestion_last_run_timestamp_seconds{{{labels}}} {self.started_at:.0f}",
+        ]
+
+        tmp_path = path.with_suffix('.prom.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp_path, path)
+
+    def write(self, metrics_dir: Path) -> None:
+        """Write the JSON-lines record file and the Prometheus textfile.
+
+        Args:
+            metrics_dir: Directory to write into (created if needed)
+        """
+        metrics_dir = Path(metrics_dir)
+        metrics_dir.mkdir(parents=True, exist_ok=True)
+
+        stamp = datetime.fromtimestamp(self.started_at, timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        jsonl_path = metrics_dir / f"{self.pipeline}-{stamp}.jsonl"
+        prom_path = metrics_dir / f"kol_torah_{self.pipeline.replace('-', '_')}.prom"
+
+        self.write_jsonl(jsonl_path)
+        self.write_prometheus(prom_path)
+        logger.info(f"Wrote stage metrics to {jsonl_path} and {prom_path}")
@@ -0,0 +1,388 @@
+"""End-to-end ingestion run: discover → download audio → attach transcript."""
+
+import logging
+import queue
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterable, List
+
+import config
+from kol_torah_db.models import Rabbi, Series
+from pipelines.utils import get_db_session
+from pipelines.metrics import RunMetrics
+from pipelines.youtube.download_audio import YouTubeAudioDownloader, VideoWorkItem
+
+logger = logging.getLogger(__name__)
+
+# Discovery sources: name -> (rabbi slug, series slug, fetcher method, extra arguments)
+SOURCES = {
+    "butbul-daily-halacha": ("butbul", "daily-halacha", "fetch_butbul_halacha_yomit", {"max_duration_minutes": 10.0}),
+    "halichot-olam": ("butbul", "halichot-olam", "fetch_halichot_olam", {}),
+    "rabinovitch-sample": ("rabinovitch", "sample", "fetch_rabinovitch_sample", {}),
+}
+
+# End-of-stream marker passed through the stage queues
+_DONE = object()
+
+
+class PipelineOrchestrator:
+    """Runs discovery, audio processing and transcript attachment as overlapping stages.
+
+    Stages are connected by bounded queues:
+
+        discover (one thread per source)
+            → audio queue → audio workers (`downloader.workers` threads)
+            → transcript queue → transcript workers
+
+    The fetchers commit every API batch of new videos and hand each
+    inserted row to the audio queue right away, so the first videos are
+    downloading while later batches are still being fetched, and their
+    transcripts are attached while other videos are still downloading. A
+    full queue blocks the stage feeding it, which bounds memory and keeps
+    fast stages from running far ahead.
+
+    Audio workers use the downloader's adaptive throttle, admission
+    control and run ledger exactly like `download-audio`; throttled videos
+    are retried by the same worker after the back-off.
+    """
+
+    def __init__(
+        self,
+        downloader: Optional[YouTubeAudioDownloader] = None,
+        transcript_dir: Optional[Path] = None,
+        transcript_workers: int = 2,
+        queue_size: Optional[int] = None
+    ):
+        """Initialize the orchestrator.
+
+        Args:
+            downloader: Audio downloader (created if not provided); its `workers`
+                setting is the audio stage concurrency
+            transcript_dir: Directory of transcript files named <video-id>.json
+                (None to skip the transcript stage)
+            transcript_workers: Concurrent transcript uploads
+            queue_size: Capacity of each stage queue (uses config if not provided)
+        """
+        self.downloader = downloader or YouTubeAudioDownloader()
+        self.transcript_dir = Path(transcript_dir) if transcript_dir else None
+        self.transcript_workers = max(1, transcript_workers)
+        self.queue_size = queue_size or config.PIPELINE_QUEUE_SIZE
+
+        self.uploader = None
+        if self.transcript_dir:
+            from pipelines.transcript.upload_existing_transcripts import TranscriptUploader
+            self.uploader = TranscriptUploader()
+
+        self.metrics = RunMetrics("pipeline")
+        self._audio_queue: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_size)
+        self._transcript_queue: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_size)
+        self._stats: Counter = Counter()
+        self._lock = threading.Lock()
+        self._slot_lock = threading.Lock()
+        self._running = 0
+        self._seen: set = set()
+        self._limit: Optional[int] = None
+        self._stop = threading.Event()
+
+    def _count(self, key: str, n: int = 1) -> None:
+        """Increment a run statistic."""
+        with self._lock:
+            self._stats[key] += n
+
+    def _put(self, q: "queue.Queue[Any]", item: Any) -> bool:
+        """Put an item on a stage queue, waiting while it is full (unless stopping)."""
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=1.0)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, q: "queue.Queue[Any]") -> Any:
+        """Take the next item from a stage queue (_DONE when stopping)."""
+        while not self._stop.is_set():
+            try:
+                return q.get(timeout=1.0)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _enqueue_audio(self, item: VideoWorkItem) -> None:
+        """Hand a video to the audio stage (once, within the limit and this node's shard)."""
+        shard = self.downloader.shard
+        if shard and not shard.matches(item.video_id):
+            return
+        with self._lock:
+            if item.video_id in self._seen:
+                return
+            if self._limit is not None and len(self._seen) >= self._limit:
+                self._stats["deferred"] += 1
+                return
+            self._seen.add(item.video_id)
+        self._put(self._audio_queue, item)
+
+    def _lookup_series(self, rabbi_slug: str, series_slug: str) -> int:
+        """Get the database ID of a series by rabbi and series slug."""
+        with get_db_session() as session:
+            series = session.query(Series).join(Rabbi).filter(
+                Rabbi.slug == rabbi_slug,
+                Series.slug == series_slug
+            ).first()
+            if not series:
+                raise ValueError(f"Series not found for rabbi '{rabbi_slug}' and series '{series_slug}'")
+            return int(series.id)  # type: ignore
+
+    # ------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------
+
+    def _discover(self, source: str, series_id: int) -> None:
+        """Fetch one source, streaming inserted videos into the audio queue.
+
+        Each discovery thread builds its own fetcher: the YouTube API client
+        runs on a single httplib2 connection, which is not thread-safe.
+        """
+        rabbi_slug, series_slug, method, kwargs = SOURCES[source]
+
+        def on_inserted(db_id: int, video: Dict[str, Any]) -> None:
+            self._count("discovered")
+            self._enqueue_audio(VideoWorkItem(
+                db_id, video["video_id"], video["title"], video["publish_date"],
+                video["duration"], series_slug, rabbi_slug
+            ))
+
+        try:
+            from pipelines.youtube.fetch_youtube_videos import YouTubeVideoFetcher
+            fetcher = YouTubeVideoFetcher()
+            with self.metrics.stage(source, "discover"):
+                getattr(fetcher, method)(series_id, on_inserted=on_inserted, **kwargs)
+        except Exception as e:
+            logger.error(f"Discovery failed for {source}: {e}")
+            self._count("sources_failed")
+
+    def _feed_backlog(self, items: List[VideoWorkItem]) -> None:
+        """Queue previously discovered videos (already in scheduling order)."""
+        for item in items:
+            self._enqueue_audio(item)
+
+    def _acquire_slot(self, item: VideoWorkItem) -> bool:
+        """Wait until the throttle and the scratch budget allow the video to start.
+
+        Returns:
+            True once reserved, False if the video can never fit or the run is stopping
+        """
+        downloader = self.downloader
+        disk, ram = downloader.admission.estimate(item.duration, downloader.speech_chunks)
+        while not self._stop.is_set():
+            with self._slot_lock:
+                if downloader.throttle.can_start(self._running):
+                    if downloader.admission.try_reserve(item.video_id, disk, ram):
+                        self._running += 1
+                        return True
+                    if self._running == 0:
+                        logger.error(
+                            f"Not enough scratch space for video {item.video_id} "
+                            f"(needs ~{disk / 1024**3:.1f} GB), skipping it this run"
+                        )
+                        return False
+            time.sleep(min(downloader.throttle.paused_for, 1.0) or 0.2)
+        return False
+
+    def _release_slot(self, item: VideoWorkItem) -> None:
+        """Release the reservation taken by `_acquire_slot`."""
+        with self._slot_lock:
+            self._running -= 1
+            self.downloader.admission.release(item.video_id)
+
+    def _process_audio(self, item: VideoWorkItem) -> None:
+        """Run the audio stages of one video, retrying after throttling."""
+        downloader = self.downloader
+        attempts = 0
+        while True:
+            if not self._acquire_slot(item):
+                # Never attempted (too large for the scratch budget, or stopping): not a failure
+                if not self._stop.is_set():
+                    self._count("audio_too_large")
+                return
+            try:
+                result = downloader.process_item(item)
+            except Exception as e:
+                if downloader.record_item_failure(item, e):
+                    attempts += 1
+                    self._count("audio_requeued")
+                    logger.info(f"Retrying video {item.video_id} after throttling (attempt {attempts + 1})")
+                    continue
+                logger.error(f"Failed to process video {item.video_id}: {e}")
+                self._count("audio_failed")
+                return
+            finally:
+                self._release_slot(item)
+            break
+
+        downloader.record_item_success(item, result)
+        self._count("audio_processed" if result else "audio_skipped")
+
+        # Skipped videos may already have audio (e.g. found in S3), so offer them too
+        if self.uploader:
+            self._put(self._transcript_queue, item)
+
+    def _audio_worker(self) -> None:
+        """Consume the audio queue until the end-of-stream marker."""
+        while True:
+            item = self._get(self._audio_queue)
+            if item is _DONE:
+                return
+            # A worker must outlive any error (e.g. a ledger write), or the pool
+            # shrinks and producers block on a full queue
+            try:
+                self._process_audio(item)
+            except Exception as e:
+                logger.error(f"Unexpected error handling video {item.video_id}: {e}")
+                self._count("audio_failed")
+
+    def _process_transcript(self, item: VideoWorkItem) -> None:
+        """Attach the transcript of one video, if there is one in the directory."""
+        assert self.uploader is not None and self.transcript_dir is not None
+        transcript_file = self.transcript_dir / f"{item.video_id}.json"
+        if not transcript_file.exists():
+            self._count("transcripts_missing")
+            return
+        if self.uploader.ledger.blocked_keys([item.video_id]):
+            logger.info(f"Transcript of {item.video_id} failed recently or is quarantined, skipping")
+            self._count("transcripts_skipped")
+            return
+
+        with self.metrics.stage(item.video_id, "transcript") as rec:
+            rec.bytes = transcript_file.stat().st_size
+            attached = self.uploader.attach_transcript(item.video_id, transcript_file)
+        self._count("transcripts_attached" if attached else "transcripts_skipped")
+
+    def _transcript_worker(self) -> None:
+        """Consume the transcript queue until the end-of-stream marker."""
+        while True:
+            item = self._get(self._transcript_queue)
+            if item is _DONE:
+                return
+            try:
+                self._process_transcript(item)
+            except Exception as e:
+                logger.error(f"Failed to attach transcript for video {item.video_id}: {e}")
+                self._count("transcripts_failed")
+
+    # ------------------------------------------------------------------
+    # Run
+    # ------------------------------------------------------------------
+
+    def run(
+        self,
+        sources: Iterable[str],
+        backlog: bool = False,
+        limit: Optional[int] = None,
+        metrics_dir: Optional[Path] = None
+    ) -> Dict[str, int]:
+        """Run all stages until every discovered video has gone through them.
+
+        Args:
+            sources: Names of discovery sources (keys of SOURCES)
+            backlog: Also process videos left unprocessed by earlier runs
+            limit: Maximum number of videos sent to the audio stage (None for all);
+                discovery still stores every new video
+            metrics_dir: Directory for metrics files (None to skip writing)
+
+        Returns:
+            Dictionary with per-stage statistics
+        """
+        sources = list(sources)
+        unknown = [s for s in sources if s not in SOURCES]
+        if unknown:
+            raise ValueError(f"Unknown source(s): {', '.join(unknown)}")
+
+        series_ids = {s: self._lookup_series(SOURCES[s][0], SOURCES[s][1]) for s in sources}
+
+        downloader = self.downloader
+        self._limit = limit
+        downloader.begin_run(self.metrics)
+
+        producers: List[threading.Thread] = []
+        audio_workers: List[threading.Thread] = []
+        transcript_workers: List[threading.Thread] = []
+        failed = False
+        try:
+            if self.uploader:
+                self.uploader.ledger.start()
+
+            # Load the backlog before discovery starts, so new videos are not picked up twice
+            backlog_items: List[VideoWorkItem] = downloader.load_backlog(limit) if backlog else []
+            logger.info(
+                f"Starting pipeline run: sources={', '.join(sources) or 'none'}, backlog={len(backlog_items)}, "
+                f"audio workers={downloader.workers}, transcripts={'on' if self.uploader else 'off'}"
+            )
+
+            for source in sources:
+                producers.append(threading.Thread(
+                    target=self._discover, args=(source, series_ids[source]), name=f"discover-{source}"
+                ))
+            if backlog_items:
+                producers.append(threading.Thread(target=self._feed_backlog, args=(backlog_items,), name="backlog"))
+
+            audio_workers.extend(
+                threading.Thread(target=self._audio_worker, name=f"audio-{i}")
+                for i in range(downloader.workers)
+            )
+            transcript_workers.extend(
+                threading.Thread(target=self._transcript_worker, name=f"transcript-{i}")
+                for i in range(self.transcript_workers if self.uploader else 0)
+            )
+
+            for thread in producers + audio_workers + transcript_workers:
+                thread.start()
+
+            # Drain stage by stage: each stage ends once its producers are done
+            for thread in producers:
+                thread.join()
+            for _ in audio_workers:
+                self._put(self._audio_queue, _DONE)
+            for thread in audio_workers:
+                thread.join()
+            for _ in transcript_workers:
+                self._put(self._transcript_queue, _DONE)
+            for thread in transcript_workers:
+                thread.join()
+        except KeyboardInterrupt:
+            logger.warning("Interrupted, stopping after the videos in progress")
+            self._stop.set()
+            for thread in producers + audio_workers + transcript_workers:
+                if thread.is_alive():
+                    thread.join()
+            raise
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            stats = {key: self._stats.get(key, 0) for key in (
+                "discovered", "deferred", "sources_failed",
+                "audio_processed", "audio_skipped", "audio_failed", "audio_too_large", "audio_requeued",
+                "transcripts_attached", "transcripts_skipped", "transcripts_missing", "transcripts_failed",
+            )}
+            audio_stats = {k: v for k, v in stats.items() if k.startswith("audio_") or k == "discovered"}
+            transcript_stats = {k: v for k, v in stats.items() if k.startswith("transcripts_")}
+            if failed or self._stop.is_set():
+                # abort() logs its own errors, so the original exception is the one raised
+                downloader.ledger.abort(audio_stats)
+                if self.uploader:
+                    self.uploader.ledger.abort(transcript_stats)
+            else:
+                downloader.ledger.finish(audio_stats)
+                if self.uploader:
+                    self.uploader.ledger.finish(transcript_stats)
+            if metrics_dir:
+                try:
+                    self.metrics.write(metrics_dir)
+                except Exception as e:
+                    logger.error(f"Failed to write pipeline metrics to {metrics_dir}: {e}")
+
+        logger.info(f"\nPipeline run complete: {stats}")
+        return stats
@@ -0,0 +1,182 @@
+"""Sampling CPU profiler and allocation report for CLI runs."""
+
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, List
+
+logger = logging.getLogger(__name__)
+
+
+class RunProfiler:
+    """Samples the stacks of all threads and tracks allocations during a run.
+
+    A background thread reads `sys._current_frames()` every `interval`
+    seconds, so worker threads (downloads, uploads) are profiled too, which
+    cProfile cannot do. Stacks are written in the folded format read by
+    flamegraph.pl, inferno and speedscope. tracemalloc records where memory
+    was allocated; the report lists the top allocation sites at the highest
+    traced usage seen (checked every `snapshot_interval` seconds), at exit,
+    and their growth over the run.
+
+    Nothing here is imported unless profiling is requested.
+
+    Usage:
+        profiler = RunProfiler(Path("profiles"), "download-audio")
+        profiler.start()
+        ...
+        profiler.stop()  # writes {name}-{stamp}.folded and {name}-{stamp}.alloc.txt
+    """
+
+    def __init__(
+        self,
+        output_dir: Path,
+        name: str,
+        interval: float = 0.01,
+        trace_frames: int = 1,
+        top_allocations: int = 30,
+        snapshot_interval: float = 5.0
+    ):
+        """Initialize the profiler.
+
+        Args:
+            output_dir: Directory to write the reports into (created if needed)
+            name: Run name used in the file names (e.g. the CLI command)
+            interval: Seconds between stack samples
+            trace_frames: Frames stored per allocation by tracemalloc (more is slower)
+            top_allocations: Allocation sites listed in the report
+            snapshot_interval: Seconds between checks for a new memory high-water mark
+        """
+        self.output_dir = Path(output_dir)
+        self.name = name
+        self.interval = interval
+        self.trace_frames = trace_frames
+        self.top_allocations = top_allocations
+        self.snapshot_interval = snapshot_interval
+
+        self._stacks: Counter = Counter()
+        self._samples = 0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started_at = 0.0
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._peak_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._peak_snapshot_bytes = 0
+
+    def start(self) -> None:
+        """Start sampling and allocation tracing."""
+        self._started_at = time.time()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.trace_frames)
+        self._baseline = tracemalloc.take_snapshot()
+        self._thread = threading.Thread(target=self._sample_loop, name="profiler", daemon=True)
+        self._thread.start()
+        logger.info(f"Profiling enabled (sampling every {self.interval * 1000:.0f} ms)")
+
+    def _sample_loop(self) -> None:
+        """Collect stack samples until stopped."""
+        own_id = threading.get_ident()
+        next_check = time.monotonic() + self.snapshot_interval
+        while not self._stop_event.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                self._stacks[self._fold(names.get(thread_id, str(thread_id)), frame)] += 1
+            self._samples += 1
+
+            if time.monotonic() >= next_check:
+                next_check = time.monotonic() + self.snapshot_interval
+                current, _ = tracemalloc.get_traced_memory()
+                # Snapshots are costly; only take one on a clear new high-water mark
+                if current > self._peak_snapshot_bytes * 1.1:
+                    self._peak_snapshot = tracemalloc.take_snapshot()
+                    self._peak_snapshot_bytes = current
+
+    @staticmethod
+    def _fold(thread_name: str, frame) -> str:
+        """Render a stack as `thread;outer;...;inner` (root first)."""
+        frames: List[str] = []
+        while frame is not None:
+            code = frame.f_code
+            module = frame.f_globals.get("__name__", os.path.basename(code.co_filename))
+            frames.append(f"{module}:{code.co_name}")
+            frame = frame.f_back
+        frames.append(thread_name.replace(";", ":").replace(" ", "_"))
+        return ";".join(reversed(frames))
+
+    def stop(self) -> Optional[Path]:
+        """Stop profiling and write the reports.
+
+        Returns:
+            Path of the folded stack file, or None if profiling was not started
+        """
+        if self._thread is None:
+            return None
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.fromtimestamp(self._started_at, timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        folded_path = self.output_dir / f"{self.name}-{stamp}.folded"
+        alloc_path = self.output_dir / f"{self.name}-{stamp}.alloc.txt"
+
+        with open(folded_path, 'w', encoding='utf-8') as f:
+            for stack, count in self._stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+        self._write_allocations(alloc_path, snapshot, current, peak)
+        logger.info(f"Wrote profile ({self._samples} samples) to {folded_path} and {alloc_path}")
+        return folded_path
+
+    def _write_allocations(self, path: Path, snapshot: tracemalloc.Snapshot, current: int, peak: int) -> None:
+        """Write the top allocation sites at peak, at exit and by growth during the run."""
+        ignore = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ]
+        snapshot = snapshot.filter_traces(ignore)
+
+        def site_lines(title: str, snap: tracemalloc.Snapshot) -> List[str]:
+            out = ["", title]
+            for stat in snap.statistics("lineno")[:self.top_allocations]:
+                frame = stat.traceback[0]
+                out.append(f"  {stat.size / 1024:>10.1f} KiB  {stat.count:>8} blocks  {frame.filename}:{frame.lineno}")
+            return out
+
+        lines = [
+            f"Command: {' '.join(sys.argv)}",
+            f"Duration: {time.time() - self._started_at:.1f} s, samples: {self._samples}",
+            f"Traced memory: current {current / 1024**2:.1f} MiB, peak {peak / 1024**2:.1f} MiB",
+        ]
+        if self._peak_snapshot is not None:
+            lines += site_lines(
+                f"Top {self.top_allocations} allocation sites "
+                f"(at {self._peak_snapshot_bytes / 1024**2:.1f} MiB, the highest usage sampled):",
+                self._peak_snapshot.filter_traces(ignore)
+            )
+        lines += site_lines(f"Top {self.top_allocations} allocation sites (held at exit):", snapshot)
+
+        if self._baseline is not None:
+            lines += ["", f"Top {self.top_allocations} allocation sites (growth during the run):"]
+            diff = snapshot.compare_to(self._baseline.filter_traces(ignore), "lineno")
+            for stat in diff[:self.top_allocations]:
+                frame = stat.traceback[0]
+                lines.append(
+                    f"  {stat.size_diff / 1024:>+10.1f} KiB  {stat.count_diff:>+8} blocks  {frame.filename}:{frame.lineno}"
+                )
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
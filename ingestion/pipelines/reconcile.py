@@ -0,0 +1,353 @@
+"""Reconcile S3 objects with the video pointers stored in the database."""
+
+import logging
+import re
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple, Set
+import boto3
+from botocore.config import Config
+from sqlalchemy import text
+
+import config
+from kol_torah_db.models import YoutubeVideo, Series, Rabbi
+from pipelines.transcript.compression import IDENTITY
+from pipelines.utils import get_db_session
+
+logger = logging.getLogger(__name__)
+
+# Object kinds stored next to a video's MP3, by key suffix (longest first), and
+# the youtube_videos column pointing at each
+_SUFFIXES: Tuple[Tuple[str, str], ...] = (
+    (".trim.json", "trim_map"),
+    (".json", "transcript"),
+    (".mp3", "audio"),
+    (".peaks", "peaks"),
+    (".idx", "transcript_index"),
+)
+_COLUMNS: Dict[str, str] = {
+    "audio": "path",
+    "trim_map": "trim_map_path",
+    "peaks": "peaks_path",
+    "transcript": "transcript_path",
+    "transcript_index": "transcript_index_path",
+}
+# Columns cleared together with a pointer whose object is gone
+_CLEARED_WITH: Dict[str, Tuple[str, ...]] = {
+    "path": ("bucket",),
+    "transcript_path": ("transcript_bucket", "transcript_encoding", "transcript_size"),
+}
+# Columns set together with a pointer adopted from S3
+_BUCKET_COLUMNS: Dict[str, str] = {"path": "bucket", "transcript_path": "transcript_bucket"}
+
+# {publish-date}-{video-id}, the stem of every per-video key
+_STEM_RE = re.compile(r"^\d{4}-\d{2}-\d{2}-(?P<video_id>.+)$")
+
+
+def parse_key(relative_key: str) -> Optional[Tuple[str, str]]:
+    """Map a key below a series prefix to its video ID and object kind.
+
+    Args:
+        relative_key: Key without the {rabbi}/{series}/ prefix
+
+    Returns:
+        Tuple of (video_id, kind), kind being audio, transcript, trim_map,
+        peaks, transcript_index or speech (chunk files); None if the key does
+        not follow the naming scheme
+    """
+    if "/" in relative_key:
+        # Speech chunks: {stem}.speech/NNNN.wav and {stem}.speech/manifest.json
+        folder = relative_key.split("/", 1)[0]
+        match = _STEM_RE.match(folder[:-len(".speech")]) if folder.endswith(".speech") else None
+        return (match.group("video_id"), "speech") if match else None
+    for suffix, kind in _SUFFIXES:
+        if relative_key.endswith(suffix):
+            match = _STEM_RE.match(relative_key[:-len(suffix)])
+            return (match.group("video_id"), kind) if match else None
+    return None
+
+
+class S3Reconciler:
+    """Compares the bucket listing with the database and repairs pointers.
+
+    Each rabbi/series prefix is listed once with paginated `list_objects_v2`
+    (1,000 keys per call) and matched against every video of the series in
+    memory:
+
+    - a pointer whose object is missing is cleared, or moved to this
+      video's object of the same kind if one exists under another key
+      (e.g. after a publish date change);
+    - an object with no pointer is adopted;
+    - columns describing the object (a transcript's encoding and size) are
+      cleared or refreshed with its pointer;
+    - objects no video of the series claims are reported as orphans, as are
+      rabbi and series prefixes unknown to the database.
+
+    Repairs are applied with one set-based UPDATE per column. Objects are
+    never deleted.
+    """
+
+    def __init__(
+        self,
+        aws_access_key_id: Optional[str] = None,
+        aws_secret_access_key: Optional[str] = None,
+        aws_region: Optional[str] = None,
+        s3_bucket: Optional[str] = None,
+        workers: Optional[int] = None
+    ):
+        """Initialize S3 client and configuration.
+
+        Args:
+            aws_access_key_id: AWS access key (uses config if not provided)
+            aws_secret_access_key: AWS secret key (uses config if not provided)
+            aws_region: AWS region (uses config if not provided)
+            s3_bucket: S3 bucket name (uses config if not provided)
+            workers: Prefixes listed concurrently (uses RECONCILE_WORKERS if not provided)
+        """
+        self.s3_bucket = s3_bucket or config.S3_BUCKET_NAME
+        self.workers = max(1, workers or config.RECONCILE_WORKERS)
+        self.s3_client = boto3.client(
+            's3',
+            aws_access_key_id=aws_access_key_id or config.get_aws_access_key_id(),
+            aws_secret_access_key=aws_secret_access_key or config.get_aws_secret_access_key(),
+            region_name=aws_region or config.AWS_REGION,
+            config=Config(max_pool_connections=max(10, self.workers))
+        )
+        self.orphans: List[Tuple[str, int]] = []
+        self.unknown_prefixes: List[str] = []
+        self._list_calls = 0
+        self._lock = threading.Lock()
+
+    def _list(self, prefix: str, delimiter: Optional[str] = None) -> Tuple[Dict[str, int], List[str]]:
+        """List every key (and common prefix) below a prefix.
+
+        Args:
+            prefix: Key prefix
+            delimiter: Group keys by this delimiter into common prefixes
+
+        Returns:
+            Tuple of ({key: size}, [common prefixes])
+        """
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        params = {"Bucket": self.s3_bucket, "Prefix": prefix}
+        if delimiter:
+            params["Delimiter"] = delimiter
+        keys: Dict[str, int] = {}
+        prefixes: List[str] = []
+        for page in paginator.paginate(**params):
+            with self._lock:
+                self._list_calls += 1
+            for item in page.get('Contents', []):
+                keys[item['Key']] = item['Size']
+            prefixes.extend(p['Prefix'] for p in page.get('CommonPrefixes', []))
+        return keys, prefixes
+
+    def _load_catalog(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Load every video's pointers grouped by its series prefix.
+
+        Returns:
+            Mapping of "{rabbi}/{series}/" to video rows (as dicts)
+        """
+        catalog: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        with get_db_session() as session:
+            rows = session.query(
+                Rabbi.slug.label("rabbi_slug"),
+                Series.slug.label("series_slug"),
+                YoutubeVideo.id,
+                YoutubeVideo.video_id,
+                YoutubeVideo.bucket,
+                YoutubeVideo.path,
+                YoutubeVideo.trim_map_path,
+                YoutubeVideo.peaks_path,
+                YoutubeVideo.transcript_bucket,
+                YoutubeVideo.transcript_path,
+                YoutubeVideo.transcript_index_path
+            ).join(Series, YoutubeVideo.series_id == Series.id).join(Rabbi, Series.rabbi_id == Rabbi.id).all()
+            for row in rows:
+                catalog[f"{row.rabbi_slug}/{row.series_slug}/"].append(dict(row._mapping))
+            # Series without videos still own their prefix
+            for rabbi_slug, series_slug in session.query(Rabbi.slug, Series.slug).join(Series, Series.rabbi_id == Rabbi.id):
+                catalog.setdefault(f"{rabbi_slug}/{series_slug}/", [])
+        return catalog
+
+    def _owns_bucket(self, video: Dict[str, Any], column: str) -> bool:
+        """Whether a video's pointer refers to this bucket (or to none yet)."""
+        bucket_column = _BUCKET_COLUMNS.get(column)
+        if bucket_column is None:
+            # Sidecars live in the audio bucket
+            bucket_column = "transcript_bucket" if column == "transcript_index_path" else "bucket"
+        return video[bucket_column] in (None, self.s3_bucket)
+
+    def _content_encoding(self, key: str) -> Optional[str]:
+        """Get the Content-Encoding of an object (None if it cannot be read)."""
+        try:
+            response = self.s3_client.head_object(Bucket=self.s3_bucket, Key=key)
+        except Exception as e:
+            logger.warning(f"Could not read the Content-Encoding of {key}: {e}")
+            return None
+        return response.get('ContentEncoding') or IDENTITY
+
+    def _describe(self, column: str, key: str, size: int) -> Dict[str, Any]:
+        """Values of the columns describing the object a pointer moves to.
+
+        Args:
+            column: Pointer column
+            key: Object key
+            size: Object size from the listing
+
+        Returns:
+            Mapping of column to value (empty for pointers without such columns)
+        """
+        if column != "transcript_path":
+            return {}
+        return {"transcript_encoding": self._content_encoding(key), "transcript_size": size}
+
+    def _reconcile_series(
+        self,
+        prefix: str,
+        videos: List[Dict[str, Any]],
+        keys: Dict[str, int],
+        changes: Dict[str, Dict[int, Any]],
+        stats: Counter
+    ) -> None:
+        """Match one series' listing against its videos and collect repairs.
+
+        Args:
+            prefix: "{rabbi}/{series}/"
+            videos: Video rows of the series
+            keys: Listing of the prefix ({key: size})
+            changes: Column -> {video database ID: new value}, filled in
+            stats: Counters, updated in place
+        """
+        # video_id -> kind -> keys found
+        found: Dict[str, Dict[str, List[str]]] = defaultdict(lambda: defaultdict(list))
+        for key, size in keys.items():
+            parsed = parse_key(key[len(prefix):])
+            if parsed is None:
+                self.orphans.append((key, size))
+                continue
+            found[parsed[0]][parsed[1]].append(key)
+
+        claimed: Set[str] = set()
+        known_ids = set()
+        for video in videos:
+            known_ids.add(video["video_id"])
+            objects = found.get(video["video_id"], {})
+            claimed.update(objects.get("speech", []))
+            for kind, column in _COLUMNS.items():
+                if not self._owns_bucket(video, column):
+                    stats["other_bucket"] += 1
+                    claimed.update(objects.get(kind, []))
+                    continue
+                candidates = sorted(objects.get(kind, []))
+                current = video[column]
+                if current and not current.startswith(prefix):
+                    # Stored under another series (e.g. before a move); not listed here
+                    stats["outside_prefix"] += 1
+                    claimed.update(candidates)
+                    continue
+                if current in keys:
+                    stats["ok"] += 1
+                    claimed.add(current)
+                elif candidates:
+                    # Adopt the object (or move a dangling pointer to it)
+                    target = candidates[-1]
+                    changes[column][video["id"]] = target
+                    if column in _BUCKET_COLUMNS:
+                        changes[_BUCKET_COLUMNS[column]][video["id"]] = self.s3_bucket
+                    # The old object's encoding and size do not describe the new one
+                    for extra, value in self._describe(column, target, keys[target]).items():
+                        changes[extra][video["id"]] = value
+                    stats["repointed" if current else "adopted"] += 1
+                    claimed.add(target)
+                elif current:
+                    changes[column][video["id"]] = None
+                    for extra in _CLEARED_WITH.get(column, ()):
+                        changes[extra][video["id"]] = None
+                    stats["cleared"] += 1
+                # Any further objects of the same kind are duplicates
+                for key in candidates:
+                    if key not in claimed:
+                        self.orphans.append((key, keys[key]))
+                        claimed.add(key)
+
+        for video_id, objects in found.items():
+            if video_id in known_ids:
+                continue
+            for kind_keys in objects.values():
+                self.orphans.extend((key, keys[key]) for key in kind_keys)
+
+    def _apply(self, changes: Dict[str, Dict[int, Any]]) -> None:
+        """Write the repairs with one set-based UPDATE per column.
+
+        Args:
+            changes: Column -> {video database ID: new value}
+        """
+        with get_db_session() as session:
+            for column, values in changes.items():
+                if not values:
+                    continue
+                cast = "integer" if column == "transcript_size" else "text"
+                # Column names come from the fixed maps above, never from input
+                session.execute(
+                    text(
+                        f"UPDATE sources.youtube_videos AS v "
+                        f"SET {column} = d.value, updated_at = now() "
+                        f"FROM unnest(CAST(:ids AS integer[]), CAST(:values AS {cast}[])) AS d(id, value) "
+                        f"WHERE v.id = d.id"
+                    ),
+                    {"ids": list(values), "values": list(values.values())}
+                )
+                logger.info(f"Updated {column} of {len(values)} videos")
+
+    def run(self, dry_run: bool = False) -> Dict[str, Any]:
+        """Reconcile the whole catalog.
+
+        Args:
+            dry_run: Report repairs without writing them
+
+        Returns:
+            Stats with prefixes, list_calls, objects, ok, adopted, repointed,
+            cleared, other_bucket, outside_prefix, orphans, orphan_bytes and
+            unknown_prefixes
+        """
+        self.orphans = []
+        self.unknown_prefixes = []
+        self._list_calls = 0
+        stats: Counter = Counter()
+
+        catalog = self._load_catalog()
+        logger.info(f"Loaded {sum(len(v) for v in catalog.values())} videos in {len(catalog)} series")
+
+        # Rabbi and series prefixes present in the bucket but not in the database
+        known_rabbis = {prefix.split("/", 1)[0] + "/" for prefix in catalog}
+        _, rabbi_prefixes = self._list("", delimiter="/")
+        self.unknown_prefixes.extend(p for p in rabbi_prefixes if p not in known_rabbis)
+        for rabbi_prefix in sorted(known_rabbis & set(rabbi_prefixes)):
+            _, series_prefixes = self._list(rabbi_prefix, delimiter="/")
+            self.unknown_prefixes.extend(p for p in series_prefixes if p not in catalog)
+
+        changes: Dict[str, Dict[int, Any]] = defaultdict(dict)
+        prefixes = sorted(catalog)
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="reconcile") as pool:
+            listings = pool.map(lambda prefix: self._list(prefix)[0], prefixes)
+            for prefix, keys in zip(prefixes, listings):
+                stats["objects"] += len(keys)
+                self._reconcile_series(prefix, catalog[prefix], keys, changes, stats)
+
+        if not dry_run:
+            self._apply(changes)
+
+        result: Dict[str, Any] = dict(stats)
+        result.update({
+            "prefixes": len(prefixes),
+            "list_calls": self._list_calls,
+            "orphans": len(self.orphans),
+            "orphan_bytes": sum(size for _, size in self.orphans),
+            "unknown_prefixes": len(self.unknown_prefixes),
+        })
+        for key in ("objects", "ok", "adopted", "repointed", "cleared", "other_bucket", "outside_prefix"):
+            result.setdefault(key, 0)
+        logger.info(f"Reconciliation complete: {result}")
+        return result
@@ -0,0 +1,100 @@
+"""Ranked full-text search over lessons and their transcripts."""
+
+import logging
+from typing import Any, Dict, List
+
+from sqlalchemy import text
+
+from pipelines.utils import get_db_session
+
+logger = logging.getLogger(__name__)
+
+# Lessons matching on title/description, on transcript segments, or on a
+# misspelled or partial title word (trigram word similarity). The query
+# expressions are immutable, so Postgres folds them to constants and every
+# branch is answered from a GIN index: search_vector on both tables and
+# hebrew_normalize(title) gin_trgm_ops. Title and description matches
+# outweigh transcript matches, which add up per lesson.
+_TSQUERY = "websearch_to_tsquery('simple', sources.hebrew_normalize(:query))"
+
+_LESSONS_SQL = text(f"""
+    WITH meta AS (
+        SELECT v.id AS video_id,
+               ts_rank(v.search_vector, {_TSQUERY}) * 4
+               + word_similarity(sources.hebrew_normalize(:query), sources.hebrew_normalize(v.title)) AS rank
+        FROM sources.youtube_videos v
+        WHERE v.search_vector @@ {_TSQUERY}
+           OR sources.hebrew_normalize(:query) <% sources.hebrew_normalize(v.title)
+    ),
+    spoken AS (
+        SELECT s.video_id, sum(ts_rank(s.search_vector, {_TSQUERY})) AS rank, count(*) AS hits
+        FROM sources.transcript_segments s
+        WHERE s.search_vector @@ {_TSQUERY}
+        GROUP BY s.video_id
+    )
+    SELECT v.id, v.video_id, v.title, v.url, v.publish_date,
+           coalesce(meta.rank, 0) + coalesce(spoken.rank, 0) AS rank,
+           coalesce(spoken.hits, 0) AS segment_hits
+    FROM meta
+    FULL JOIN spoken ON spoken.video_id = meta.video_id
+    JOIN sources.youtube_videos v ON v.id = coalesce(meta.video_id, spoken.video_id)
+    ORDER BY rank DESC, v.publish_date DESC
+    LIMIT :limit
+""")
+
+# Best-ranked matching segments of the given lessons
+_SEGMENTS_SQL = text(f"""
+    SELECT video_id, start_seconds, end_seconds, text
+    FROM (
+        SELECT s.video_id, s.start_seconds, s.end_seconds, s.text,
+               row_number() OVER (
+                   PARTITION BY s.video_id
+                   ORDER BY ts_rank(s.search_vector, {_TSQUERY}) DESC, s.start_seconds
+               ) AS position
+        FROM sources.transcript_segments s
+        WHERE s.video_id = ANY(:video_ids) AND s.search_vector @@ {_TSQUERY}
+    ) ranked
+    WHERE position <= :per_lesson
+    ORDER BY video_id, start_seconds
+""")
+
+
+def search_lessons(query: str, limit: int = 20, segments_per_lesson: int = 3) -> List[Dict[str, Any]]:
+    """Search lesson titles, descriptions and transcripts.
+
+    Niqqud, cantillation and acronym quotes are ignored on both sides (see
+    `sources.hebrew_normalize`), and the query accepts web-search syntax:
+    `"exact phrase"`, `or`, and `-word` to exclude.
+
+    Args:
+        query: Search text
+        limit: Maximum number of lessons
+        segments_per_lesson: Matching transcript segments returned per lesson
+
+    Returns:
+        Lessons ordered by rank, each with id, video_id, title, url,
+        publish_date, rank, segment_hits and segments (start, end, text)
+    """
+    with get_db_session() as session:
+        lessons = [dict(row._mapping) for row in session.execute(_LESSONS_SQL, {"query": query, "limit": limit})]
+        if not lessons:
+            return []
+
+        by_id = {lesson["id"]: lesson for lesson in lessons}
+        for lesson in lessons:
+            lesson["segments"] = []
+        if segments_per_lesson > 0:
+            rows = session.execute(_SEGMENTS_SQL, {
+                "query": query,
+                "video_ids": list(by_id),
+                "per_lesson": segments_per_lesson
+            })
+            for row in rows:
+                by_id[row.video_id]["segments"].append({
+                    "start": row.start_seconds,
+                    "end": row.end_seconds,
+                    "text": row.text
+                })
+
+    logger.info(f"Search {query!r}: {len(lessons)} lessons")
+    return lessons
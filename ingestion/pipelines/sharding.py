@@ -0,0 +1,102 @@
+"""Deterministic sharding of pipeline work across nodes."""
+
+import hashlib
+from typing import Optional
+
+from sqlalchemy import BigInteger, String, and_, cast, func, literal
+from sqlalchemy.dialects.postgresql import BIT
+
+
+class ShardFilter:
+    """Selects the items owned by one shard, without a coordinator.
+
+    An item belongs to shard `h % shard_count`, where `h` is the first 32
+    bits of the MD5 of its key (e.g. the YouTube video ID). The same hash is
+    computed in SQL and in Python, so nodes filter in the database and agree
+    on ownership.
+
+    Rebalance-safe mode: while nodes move from `previous_count` to
+    `shard_count` shards, a node only takes items it owns under both counts.
+    Two nodes can then never own the same item, whichever of the two counts
+    each of them runs with. Items that change owner are left for the first
+    run after every node has switched to the new count (without
+    `previous_count`).
+    """
+
+    def __init__(self, shard_index: int, shard_count: int, previous_count: Optional[int] = None):
+        """Initialize the filter.
+
+        Args:
+            shard_index: This node's shard (0-based)
+            shard_count: Total number of shards
+            previous_count: Shard count before a rebalance (enables rebalance-safe mode)
+        """
+        if shard_count < 1:
+            raise ValueError("Shard count must be at least 1")
+        if not 0 <= shard_index < shard_count:
+            raise ValueError(f"Shard index must be between 0 and {shard_count - 1}")
+        if previous_count is not None and previous_count < 1:
+            raise ValueError("Previous shard count must be at least 1")
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+        self.previous_count = previous_count
+
+    @staticmethod
+    def key_hash(key: str) -> int:
+        """Stable 32-bit hash of an item key (matches `sql_hash`).
+
+        Args:
+            key: Item key
+
+        Returns:
+            Unsigned 32-bit hash
+        """
+        return int(hashlib.md5(key.encode('utf-8')).hexdigest()[:8], 16)
+
+    @staticmethod
+    def sql_hash(key_column):
+        """SQL expression for the stable 32-bit hash of a key column.
+
+        Args:
+            key_column: Column holding the item key
+
+        Returns:
+            SQLAlchemy expression: ('x' || substr(md5(key), 1, 8))::bit(32)::bigint
+        """
+        hex_prefix = literal('x', String) + func.substr(func.md5(key_column), 1, 8)
+        return cast(cast(hex_prefix, BIT(32)), BigInteger)
+
+    def matches(self, key: str) -> bool:
+        """Check whether this shard owns an item.
+
+        Args:
+            key: Item key
+
+        Returns:
+            True if the item belongs to this shard
+        """
+        h = self.key_hash(key)
+        if h % self.shard_count != self.shard_index:
+            return False
+        return self.previous_count is None or h % self.previous_count == self.shard_index
+
+    def condition(self, key_column):
+        """SQL condition selecting the items this shard owns.
+
+        Args:
+            key_column: Column holding the item key (e.g. YoutubeVideo.video_id)
+
+        Returns:
+            SQLAlchemy boolean clause for use in `.filter()`
+        """
+        h = self.sql_hash(key_column)
+        clause = h % self.shard_count == self.shard_index
+        if self.previous_count is not None:
+            clause = and_(clause, h % self.previous_count == self.shard_index)
+        return clause
+
+    def __str__(self) -> str:
+        text = f"shard {self.shard_index}/{self.shard_count}"
+        if self.previous_count is not None:
+            text += f" (rebalancing from {self.previous_count})"
+        return text
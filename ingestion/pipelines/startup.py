@@ -0,0 +1,53 @@
+"""Measure CLI cold-start import time with `python -X importtime`."""
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional, Set, Tuple
+
+# Libraries that must only be imported by the commands that use them
+HEAVY_MODULES = ("sqlalchemy", "boto3", "botocore", "yt_dlp", "googleapiclient", "numpy", "psycopg2", "dotenv")
+
+CLI_PATH = Path(__file__).resolve().parent.parent / "cli.py"
+
+_LINE_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure_cold_start(runs: int = 3, cli_path: Optional[Path] = None) -> Tuple[float, Set[str]]:
+    """Run `cli.py --help` in fresh interpreters and add up its import time.
+
+    Args:
+        runs: Cold starts to measure; the fastest one is returned
+        cli_path: CLI script to start (defaults to ingestion/cli.py)
+
+    Returns:
+        Tuple of (cumulative import time of the fastest run in ms,
+        top-level packages imported by any run)
+
+    Raises:
+        RuntimeError: If `cli.py --help` fails
+    """
+    best_us = None
+    loaded: Set[str] = set()
+    for _ in range(max(1, runs)):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", str(cli_path or CLI_PATH), "--help"],
+            capture_output=True,
+            text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"`cli.py --help` failed:\n{result.stderr[-2000:]}")
+
+        total_us = 0
+        for line in result.stderr.splitlines():
+            match = _LINE_RE.match(line)
+            if not match:
+                continue
+            loaded.add(match.group(4).split(".")[0])
+            # Top-level imports (one space of indent) add up to the total
+            if len(match.group(3)) == 1:
+                total_us += int(match.group(2))
+        best_us = total_us if best_us is None else min(best_us, total_us)
+
+    return best_us / 1000, loaded
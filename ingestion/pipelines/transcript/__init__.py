@@ -1,5 +1,11 @@
 """Transcript pipeline module."""
 
-from pipelines.transcript.upload_existing_transcripts import TranscriptUploader
-
 __all__ = ["TranscriptUploader"]
+
+
+def __getattr__(name):
+    """Import TranscriptUploader on first use (it pulls in boto3 and the DB models)."""
+    if name == "TranscriptUploader":
+        from pipelines.transcript.upload_existing_transcripts import TranscriptUploader
+        return TranscriptUploader
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
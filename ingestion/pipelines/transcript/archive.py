@@ -0,0 +1,85 @@
+"""Stream transcript files out of tar and zip archives without extracting them."""
+
+import logging
+import posixpath
+import tarfile
+import zipfile
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Suffixes accepted by `transcript upload-existing` in place of a directory
+ARCHIVE_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".zip")
+
+
+def is_archive(path: Path) -> bool:
+    """Check whether a path names a supported transcript archive.
+
+    Args:
+        path: File path
+
+    Returns:
+        True for .tar, .tar.gz, .tgz and .zip files
+    """
+    return Path(path).is_file() and str(path).lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def member_video_id(name: str) -> Optional[str]:
+    """Map an archive member name to a video ID.
+
+    Directories inside the archive are ignored, so `batch-3/abc123.json`
+    maps to `abc123`. macOS resource forks (`__MACOSX/`, `._*`) and
+    non-JSON members map to None.
+
+    Args:
+        name: Member name as stored in the archive
+
+    Returns:
+        Video ID, or None if the member is not a transcript
+    """
+    base = posixpath.basename(name.replace("\\", "/"))
+    if not base.lower().endswith(".json") or base.startswith("._") or "__MACOSX/" in name:
+        return None
+    return base[:-len(".json")] or None
+
+
+def iter_archive_transcripts(
+    path: Path,
+    keep: Optional[Callable[[str], bool]] = None
+) -> Iterator[Tuple[str, str, bytes]]:
+    """Yield the transcript members of an archive one at a time.
+
+    Tar archives (plain or gzip) are read as a stream, front to back, so
+    nothing is extracted and only the current member is held in memory.
+    Zip archives are read member by member from their central directory.
+    Members rejected by `keep` are skipped without reading their data.
+
+    Args:
+        path: .tar, .tar.gz, .tgz or .zip file
+        keep: Predicate on the video ID (e.g. a shard filter)
+
+    Yields:
+        Tuples of (video_id, member name, member bytes)
+    """
+    path = Path(path)
+    if str(path).lower().endswith(".zip"):
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                video_id = member_video_id(info.filename)
+                if info.is_dir() or not video_id or (keep and not keep(video_id)):
+                    continue
+                with archive.open(info) as member:
+                    yield video_id, info.filename, member.read()
+        return
+
+    # "r|*": sequential stream with transparent decompression; members cannot be revisited
+    with tarfile.open(path, mode="r|*") as archive:
+        for info in archive:
+            video_id = member_video_id(info.name)
+            if not info.isfile() or not video_id or (keep and not keep(video_id)):
+                continue
+            member = archive.extractfile(info)
+            if member is None:
+                continue
+            yield video_id, info.name, member.read()
@@ -0,0 +1,65 @@
+"""Content encodings for transcript objects stored in S3."""
+
+import gzip
+from typing import Tuple
+
+# Values of the S3 Content-Encoding header (and the transcript_encoding column)
+IDENTITY = "identity"
+GZIP = "gzip"
+ZSTD = "zstd"
+ENCODINGS: Tuple[str, ...] = (IDENTITY, GZIP, ZSTD)
+
+# Transcripts are compressed once and downloaded many times, so favour ratio over speed
+_GZIP_LEVEL = 9
+_ZSTD_LEVEL = 19
+
+
+def _zstandard():
+    """Import the optional zstandard package."""
+    try:
+        import zstandard
+    except ImportError:
+        raise RuntimeError("zstd encoding requires the 'zstandard' package (poetry install -E zstd)")
+    return zstandard
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Encode transcript bytes for storage.
+
+    gzip output is written with a zero timestamp, so the same input always
+    gives the same bytes (and the same S3 ETag).
+
+    Args:
+        body: Raw transcript JSON
+        encoding: identity, gzip or zstd
+
+    Returns:
+        Encoded bytes
+    """
+    if encoding == IDENTITY:
+        return body
+    if encoding == GZIP:
+        return gzip.compress(body, compresslevel=_GZIP_LEVEL, mtime=0)
+    if encoding == ZSTD:
+        return _zstandard().ZstdCompressor(level=_ZSTD_LEVEL).compress(body)
+    raise ValueError(f"Unknown transcript encoding: {encoding}")
+
+
+def decompress(body: bytes, encoding: str) -> bytes:
+    """Decode stored transcript bytes.
+
+    Args:
+        body: Bytes as stored in S3
+        encoding: identity, gzip or zstd
+
+    Returns:
+        Raw transcript JSON
+    """
+    if encoding == IDENTITY:
+        return body
+    if encoding == GZIP:
+        return gzip.decompress(body)
+    if encoding == ZSTD:
+        # Frames written by compress() carry their content size, but stream-written ones may not
+        return _zstandard().ZstdDecompressor().decompressobj().decompress(body)
+    raise ValueError(f"Unknown transcript encoding: {encoding}")
@@ -0,0 +1,240 @@
+"""Bulk-load transcript segments from S3 into Postgres with COPY."""
+
+import io
+import logging
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
+import boto3
+from botocore.config import Config
+from sqlalchemy import select
+
+import config
+from kol_torah_db.models import YoutubeVideo
+from pipelines.ledger import RunLedger
+from pipelines.utils import get_db_session, get_db_engine
+from pipelines.transcript.compression import decompress, IDENTITY
+from pipelines.transcript.validate import validate_transcript
+
+logger = logging.getLogger(__name__)
+
+# Characters with a meaning in COPY's text format
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r", "\x00": ""})
+
+_COPY_SQL = (
+    "COPY sources.transcript_segments (video_id, segment_index, start_seconds, end_seconds, text) "
+    "FROM STDIN"
+)
+
+# (video database ID, transcript S3 path, [(start, end, text), ...]) tuples
+LoadedSegments = List[Tuple[int, str, List[Tuple[float, float, str]]]]
+
+
+def _copy_buffer(loaded: LoadedSegments) -> io.StringIO:
+    """Render segments as COPY text-format rows.
+
+    Args:
+        loaded: (video database ID, transcript path, segments) tuples
+
+    Returns:
+        Buffer positioned at the start
+    """
+    buffer = io.StringIO()
+    for video_db_id, _, segments in loaded:
+        for index, (start, end, text) in enumerate(segments):
+            buffer.write(f"{video_db_id}\t{index}\t{start!r}\t{end!r}\t{text.translate(_COPY_ESCAPES)}\n")
+    buffer.seek(0)
+    return buffer
+
+
+def replace_segments(loaded: LoadedSegments) -> None:
+    """Replace the segments of one or more videos in one transaction.
+
+    Existing rows of the videos are deleted and the new ones streamed in
+    with a single `COPY FROM STDIN`; readers see either the old or the new
+    segments of a video, never a mix. Each video's `segments_transcript_path`
+    is set to the transcript the segments came from, in the same
+    transaction, so transcripts without segments are not loaded again.
+
+    Args:
+        loaded: (video database ID, transcript path, segments) tuples
+    """
+    buffer = _copy_buffer(loaded)
+    # COPY needs the driver connection; it is returned to the shared pool on close
+    connection = get_db_engine().raw_connection()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "DELETE FROM sources.transcript_segments WHERE video_id = ANY(%s)",
+                ([video_db_id for video_db_id, _, _ in loaded],)
+            )
+            cursor.copy_expert(_COPY_SQL, buffer)
+            cursor.execute(
+                "UPDATE sources.youtube_videos AS v SET segments_transcript_path = u.path "
+                "FROM unnest(%s::integer[], %s::text[]) AS u(id, path) WHERE v.id = u.id",
+                ([video_db_id for video_db_id, _, _ in loaded], [path for _, path, _ in loaded])
+            )
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        connection.close()
+
+
+class TranscriptSegmentLoader:
+    """Loads the segments of uploaded transcripts into `sources.transcript_segments`.
+
+    Transcripts are fetched from S3 by a thread pool and parsed with the
+    streaming validator. Each batch of videos is then written in one
+    transaction: their existing rows are deleted and the new ones streamed
+    in with a single `COPY FROM STDIN`, so a video's segments are replaced
+    atomically and re-runs are idempotent.
+
+    A video is loaded again only when its `transcript_path` changes. Videos
+    whose transcript cannot be read are recorded in `self.ledger` and left
+    alone while they cool down, instead of being fetched on every run.
+    """
+
+    # Videos per database page (and per COPY transaction)
+    BATCH_SIZE = 200
+
+    def __init__(
+        self,
+        aws_access_key_id: Optional[str] = None,
+        aws_secret_access_key: Optional[str] = None,
+        aws_region: Optional[str] = None,
+        workers: Optional[int] = None
+    ):
+        """Initialize S3 client and configuration.
+
+        Args:
+            aws_access_key_id: AWS access key (uses config if not provided)
+            aws_secret_access_key: AWS secret key (uses config if not provided)
+            aws_region: AWS region (uses config if not provided)
+            workers: Concurrent transcript downloads (uses TRANSCRIPT_UPLOAD_WORKERS if not provided)
+        """
+        self.workers = max(1, workers or config.TRANSCRIPT_UPLOAD_WORKERS)
+        self.s3_client = boto3.client(
+            's3',
+            aws_access_key_id=aws_access_key_id or config.get_aws_access_key_id(),
+            aws_secret_access_key=aws_secret_access_key or config.get_aws_secret_access_key(),
+            region_name=aws_region or config.AWS_REGION,
+            config=Config(max_pool_connections=max(10, self.workers))
+        )
+        self.ledger = RunLedger("transcript-segments")
+        self.errors: Dict[str, str] = {}
+        self._errors_lock = threading.Lock()
+
+    def _load_batch(self, after_id: int, reload: bool) -> List[Any]:
+        """Get the next page of videos whose segments should be loaded.
+
+        Args:
+            after_id: Highest video database ID already seen
+            reload: Include videos whose current transcript is already loaded
+
+        Returns:
+            Rows of id, video_id, transcript_bucket and transcript_path
+        """
+        query = (
+            select(
+                YoutubeVideo.id,
+                YoutubeVideo.video_id,
+                YoutubeVideo.transcript_bucket,
+                YoutubeVideo.transcript_path
+            )
+            .where(YoutubeVideo.id > after_id, YoutubeVideo.transcript_path.isnot(None))
+            .order_by(YoutubeVideo.id)
+            .limit(self.BATCH_SIZE)
+        )
+        if not reload:
+            query = query.where(
+                YoutubeVideo.segments_transcript_path.is_distinct_from(YoutubeVideo.transcript_path),
+                self.ledger.eligible(YoutubeVideo.video_id)
+            )
+        with get_db_session() as session:
+            return session.execute(query).all()
+
+    def _fetch_segments(self, row: Any) -> Optional[List[Tuple[float, float, str]]]:
+        """Download and parse one transcript.
+
+        Args:
+            row: Video row from `_load_batch`
+
+        Returns:
+            List of (start, end, text) in file order, or None if it failed
+        """
+        segments: List[Tuple[float, float, str]] = []
+        try:
+            response = self.s3_client.get_object(
+                Bucket=row.transcript_bucket or config.S3_BUCKET_NAME,
+                Key=row.transcript_path
+            )
+            body = decompress(response['Body'].read(), response.get('ContentEncoding') or IDENTITY)
+            validate_transcript(
+                io.BytesIO(body),
+                on_segment=lambda s: segments.append((float(s["start"]), float(s["end"]), s["text"]))
+            )
+            return segments
+        except Exception as e:
+            logger.error(f"Failed to read transcript of video {row.video_id}: {e}")
+            with self._errors_lock:
+                self.errors[row.video_id] = f"{type(e).__name__}: {e}"
+            try:
+                self.ledger.record_failure(row.video_id, "fetch", e)
+            except Exception as ledger_error:
+                logger.error(f"Failed to record the failure of video {row.video_id}: {ledger_error}")
+            return None
+
+    def run(self, limit: Optional[int] = None, reload: bool = False) -> Dict[str, Any]:
+        """Load the segments of every transcript that has none yet (or of all, with `reload`).
+
+        Args:
+            limit: Maximum number of videos to process
+            reload: Also replace the segments of videos that already have them
+
+        Returns:
+            Stats with videos, segments, failed and seconds
+        """
+        stats: Counter = Counter(videos=0, segments=0, failed=0)
+        started = time.monotonic()
+        after_id = 0
+
+        self.ledger.start()
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="segments") as pool:
+                while limit is None or stats["videos"] + stats["failed"] < limit:
+                    rows = self._load_batch(after_id, reload)
+                    if not rows:
+                        break
+                    if limit is not None:
+                        rows = rows[:limit - stats["videos"] - stats["failed"]]
+                    after_id = rows[-1].id
+
+                    loaded: LoadedSegments = []
+                    video_ids: List[str] = []
+                    for row, segments in zip(rows, pool.map(self._fetch_segments, rows)):
+                        if segments is None:
+                            # Keep whatever was loaded before for this video
+                            stats["failed"] += 1
+                            continue
+                        loaded.append((int(row.id), row.transcript_path, segments))
+                        video_ids.append(row.video_id)
+
+                    if loaded:
+                        replace_segments(loaded)
+                        self.ledger.record_successes(video_ids)
+                        stats["videos"] += len(loaded)
+                        stats["segments"] += sum(len(segments) for _, _, segments in loaded)
+                    logger.info(f"Loaded {stats['segments']} segments of {stats['videos']} videos")
+        except BaseException:
+            # Close the run record instead of leaving it "running" forever
+            self.ledger.abort(dict(stats))
+            raise
+        self.ledger.finish(dict(stats))
+
+        result: Dict[str, Any] = dict(stats)
+        result["seconds"] = round(time.monotonic() - started, 1)
+        return result
@@ -0,0 +1,190 @@
+"""Local manifest of uploaded transcript files for incremental re-runs."""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Dict, Any, Generator
+
+logger = logging.getLogger(__name__)
+
+
+def file_md5(path: Path) -> str:
+    """MD5 hex digest of a file (equals the S3 ETag of a single-part upload).
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Lowercase hex digest
+    """
+    digest = hashlib.md5()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class UploadManifest:
+    """SQLite record of the transcript files of one directory and their uploads.
+
+    Each file is stored with its size, mtime, MD5, upload status, S3 key
+    and the ETag expected in S3 (which differs from the file's MD5 when the
+    uploaded JSON was normalized). A re-run skips files whose size and mtime are unchanged since a
+    successful upload, without touching the database or S3, and re-uploads
+    files whose content changed to their recorded key.
+
+    Statuses:
+        uploaded - uploaded to `s3_key` with content `md5`
+        stale    - `--verify` found S3 out of sync; re-uploaded on the next run
+        failed   - last attempt failed (kept for inspection; retried normally)
+    """
+
+    def __init__(self, path: Path):
+        """Open (and create if needed) the manifest.
+
+        Args:
+            path: SQLite file of the manifest
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS files (
+                    name TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    md5 TEXT,
+                    status TEXT NOT NULL,
+                    s3_key TEXT,
+                    etag TEXT,
+                    error TEXT,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(files)")}
+            if "etag" not in columns:
+                conn.execute("ALTER TABLE files ADD COLUMN etag TEXT")
+
+    @classmethod
+    def for_directory(cls, manifest_dir: Path, transcript_dir: Path) -> "UploadManifest":
+        """Open the manifest of a transcript directory.
+
+        Manifests are named after the directory and a hash of its absolute
+        path, so different directories with the same name do not collide.
+
+        Args:
+            manifest_dir: Directory holding manifests
+            transcript_dir: Transcript directory the manifest describes
+
+        Returns:
+            The manifest
+        """
+        resolved = Path(transcript_dir).resolve()
+        key = hashlib.md5(str(resolved).encode('utf-8')).hexdigest()[:8]
+        return cls(Path(manifest_dir) / f"{resolved.name or 'root'}-{key}.sqlite3")
+
+    @contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection, None, None]:
+        """Context manager for manifest connections (committed on success)."""
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """Get all entries keyed by file name.
+
+        Returns:
+            Mapping of file name to size, mtime_ns, md5, status, s3_key, etag and error
+        """
+        with self._lock, self._connect() as conn:
+            rows = conn.execute(
+                "SELECT name, size, mtime_ns, md5, status, s3_key, etag, error FROM files"
+            ).fetchall()
+        return {
+            name: {
+                "size": size, "mtime_ns": mtime_ns, "md5": md5, "status": status,
+                "s3_key": s3_key, "etag": etag, "error": error
+            }
+            for name, size, mtime_ns, md5, status, s3_key, etag, error in rows
+        }
+
+    def record(
+        self,
+        file_path: Path,
+        status: str,
+        md5: Optional[str] = None,
+        s3_key: Optional[str] = None,
+        error: Optional[str] = None,
+        etag: Optional[str] = None
+    ) -> None:
+        """Record the outcome for a file (replacing any earlier entry).
+
+        Args:
+            file_path: Transcript file
+            status: uploaded or failed
+            md5: Content hash of what was uploaded
+            s3_key: S3 key the file was uploaded to
+            error: Error message of a failed attempt
+            etag: ETag expected in S3 (None when it equals `md5`)
+        """
+        stat = file_path.stat()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO files (name, size, mtime_ns, md5, status, s3_key, etag, error, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (file_path.name, stat.st_size, stat.st_mtime_ns, md5, status, s3_key, etag, error, time.time())
+            )
+
+    def touch(self, file_path: Path) -> None:
+        """Store a file's current size and mtime (content verified unchanged).
+
+        Args:
+            file_path: Transcript file
+        """
+        stat = file_path.stat()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "UPDATE files SET size = ?, mtime_ns = ?, updated_at = ? WHERE name = ?",
+                (stat.st_size, stat.st_mtime_ns, time.time(), file_path.name)
+            )
+
+    def mark_stale(self, name: str, reason: str) -> None:
+        """Flag an uploaded file for re-upload on the next run.
+
+        Args:
+            name: File name
+            reason: Why the upload is out of sync
+        """
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "UPDATE files SET status = 'stale', error = ?, updated_at = ? WHERE name = ?",
+                (reason, time.time(), name)
+            )
+
+    @staticmethod
+    def is_unchanged(entry: Dict[str, Any], file_path: Path) -> bool:
+        """Check whether a file still has the size and mtime recorded in an entry.
+
+        Args:
+            entry: Manifest entry
+            file_path: Transcript file
+
+        Returns:
+            True if size and mtime match
+        """
+        stat = file_path.stat()
+        return entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns
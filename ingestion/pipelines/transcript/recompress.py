@@ -0,0 +1,164 @@
+"""Re-encode transcripts already stored in S3 with a different Content-Encoding."""
+
+import logging
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
+import boto3
+from botocore.config import Config
+from sqlalchemy import select, update, func
+
+import config
+from kol_torah_db.models import YoutubeVideo
+from pipelines.utils import get_db_session
+from pipelines.transcript.compression import compress, decompress, IDENTITY, ENCODINGS
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptRecompressor:
+    """Rewrites uploaded transcripts in place with a new Content-Encoding.
+
+    Each object is downloaded, decoded with the encoding S3 reports for it,
+    re-encoded and written back to the same key, so the database paths do
+    not change; only `transcript_encoding` and `transcript_size` are
+    updated, one bulk UPDATE per batch.
+    """
+
+    # Videos per database page (and per bulk UPDATE)
+    BATCH_SIZE = 200
+
+    def __init__(
+        self,
+        encoding: str,
+        aws_access_key_id: Optional[str] = None,
+        aws_secret_access_key: Optional[str] = None,
+        aws_region: Optional[str] = None,
+        workers: Optional[int] = None
+    ):
+        """Initialize S3 client and configuration.
+
+        Args:
+            encoding: Target encoding: identity, gzip or zstd
+            aws_access_key_id: AWS access key (uses config if not provided)
+            aws_secret_access_key: AWS secret key (uses config if not provided)
+            aws_region: AWS region (uses config if not provided)
+            workers: Concurrent objects (uses TRANSCRIPT_UPLOAD_WORKERS if not provided)
+        """
+        if encoding not in ENCODINGS:
+            raise ValueError(f"Unknown transcript encoding: {encoding} (expected one of {', '.join(ENCODINGS)})")
+        self.encoding = encoding
+        self.workers = max(1, workers or config.TRANSCRIPT_UPLOAD_WORKERS)
+        self.s3_client = boto3.client(
+            's3',
+            aws_access_key_id=aws_access_key_id or config.get_aws_access_key_id(),
+            aws_secret_access_key=aws_secret_access_key or config.get_aws_secret_access_key(),
+            region_name=aws_region or config.AWS_REGION,
+            config=Config(max_pool_connections=max(10, self.workers))
+        )
+        self.errors: Dict[str, str] = {}
+        self._stats_lock = threading.Lock()
+
+    def _load_batch(self, after_id: int) -> List[Any]:
+        """Get the next page of transcripts not yet in the target encoding.
+
+        Args:
+            after_id: Highest video database ID already seen
+
+        Returns:
+            Rows of id, video_id, transcript_bucket and transcript_path
+        """
+        with get_db_session() as session:
+            return session.execute(
+                select(
+                    YoutubeVideo.id,
+                    YoutubeVideo.video_id,
+                    YoutubeVideo.transcript_bucket,
+                    YoutubeVideo.transcript_path
+                )
+                .where(
+                    YoutubeVideo.id > after_id,
+                    YoutubeVideo.transcript_path.isnot(None),
+                    func.coalesce(YoutubeVideo.transcript_encoding, IDENTITY) != self.encoding
+                )
+                .order_by(YoutubeVideo.id)
+                .limit(self.BATCH_SIZE)
+            ).all()
+
+    def _recompress_one(self, row: Any, dry_run: bool) -> Optional[Tuple[int, int]]:
+        """Re-encode one stored transcript.
+
+        Args:
+            row: Video row from `_load_batch`
+            dry_run: Compute the new size without writing anything
+
+        Returns:
+            Tuple of (old size, new size) in bytes, or None if it failed
+        """
+        bucket = row.transcript_bucket or config.S3_BUCKET_NAME
+        try:
+            response = self.s3_client.get_object(Bucket=bucket, Key=row.transcript_path)
+            stored = response['Body'].read()
+            # Trust the object's header over the column, which is empty for older uploads
+            current = response.get('ContentEncoding') or IDENTITY
+            body = compress(decompress(stored, current), self.encoding)
+
+            if not dry_run and current != self.encoding:
+                extra_args = {'ContentType': 'application/json'}
+                if self.encoding != IDENTITY:
+                    extra_args['ContentEncoding'] = self.encoding
+                self.s3_client.put_object(Bucket=bucket, Key=row.transcript_path, Body=body, **extra_args)
+            return len(stored), len(body)
+        except Exception as e:
+            logger.error(f"Failed to recompress transcript of video {row.video_id}: {e}")
+            with self._stats_lock:
+                self.errors[row.video_id] = f"{type(e).__name__}: {e}"
+            return None
+
+    def run(self, limit: Optional[int] = None, dry_run: bool = False) -> Dict[str, int]:
+        """Re-encode every transcript whose recorded encoding differs from the target.
+
+        Args:
+            limit: Maximum number of transcripts to process
+            dry_run: Report the size change without writing to S3 or the database
+
+        Returns:
+            Stats with processed, failed, bytes_before and bytes_after
+        """
+        stats: Counter = Counter(processed=0, failed=0, bytes_before=0, bytes_after=0)
+        after_id = 0
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="recompress") as pool:
+            while limit is None or stats["processed"] + stats["failed"] < limit:
+                rows = self._load_batch(after_id)
+                if not rows:
+                    break
+                if limit is not None:
+                    rows = rows[:limit - stats["processed"] - stats["failed"]]
+                after_id = rows[-1].id
+
+                updates = []
+                for row, result in zip(rows, pool.map(lambda r: self._recompress_one(r, dry_run), rows)):
+                    if result is None:
+                        stats["failed"] += 1
+                        continue
+                    old_size, new_size = result
+                    stats["processed"] += 1
+                    stats["bytes_before"] += old_size
+                    stats["bytes_after"] += new_size
+                    updates.append({
+                        "id": row.id,
+                        "transcript_encoding": self.encoding,
+                        "transcript_size": new_size
+                    })
+
+                if updates and not dry_run:
+                    with get_db_session() as session:
+                        session.execute(update(YoutubeVideo), updates)
+                logger.info(
+                    f"Recompressed {stats['processed']} transcripts "
+                    f"({stats['bytes_before'] / 1024**2:.1f} MB -> {stats['bytes_after'] / 1024**2:.1f} MB)"
+                )
+
+        return dict(stats)
@@ -0,0 +1,191 @@
+"""Columnar segment index sidecar for time-offset lookups in transcripts."""
+
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+
+# Binary layout (little endian):
+#   header:  magic "KTSI", version u16, reserved u16, segment count u32, duration ms u32,
+#            text offset u32, text size u32
+#   starts:  `segment count` u32 start times in ms (ascending)
+#   ends:    `segment count` u32 end times in ms
+#   offsets: `segment count + 1` u32 byte offsets of each segment's text in the text blob
+#   text:    UTF-8 text of all segments, concatenated
+# Everything before `text offset` is the index a reader binary-searches; the
+# text of one segment is then a single ranged read.
+MAGIC = b"KTSI"
+VERSION = 1
+_HEADER = struct.Struct("<4sHHIIII")
+
+# Bytes fetched by the first ranged GET: the header plus the index of
+# transcripts up to ~5,400 segments (about 4.5 hours of speech)
+PREFETCH_BYTES = 64 * 1024
+
+
+def _le(values: array) -> bytes:
+    """Serialize a u32 array as little endian."""
+    if sys.byteorder != "little":
+        values = array("I", values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_le(data: bytes, offset: int, count: int) -> array:
+    """Read `count` little-endian u32 values at `offset`."""
+    values = array("I")
+    values.frombytes(data[offset:offset + count * 4])
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+class SegmentIndexBuilder:
+    """Collects segments (e.g. from `validate_transcript(on_segment=...)`) and encodes the index.
+
+    Usage:
+        builder = SegmentIndexBuilder()
+        validate_transcript(path, on_segment=builder.add)
+        sidecar = builder.encode()
+    """
+
+    def __init__(self):
+        self._segments: List[Tuple[int, int, bytes]] = []
+
+    def add(self, segment: Dict[str, Any]) -> None:
+        """Add one validated segment.
+
+        Args:
+            segment: Segment with numeric start and end (seconds) and text
+        """
+        self._segments.append((
+            int(round(segment["start"] * 1000)),
+            int(round(segment["end"] * 1000)),
+            segment["text"].encode("utf-8")
+        ))
+
+    def encode(self) -> bytes:
+        """Serialize the collected segments (sorted by start time).
+
+        Returns:
+            Encoded sidecar
+        """
+        segments = sorted(self._segments, key=lambda s: s[0])
+        starts, ends, offsets = array("I"), array("I"), array("I", [0])
+        for start, end, text in segments:
+            starts.append(start)
+            ends.append(end)
+            offsets.append(offsets[-1] + len(text))
+
+        count = len(segments)
+        text_offset = _HEADER.size + (3 * count + 1) * 4
+        duration_ms = max(ends) if count else 0
+        header = _HEADER.pack(MAGIC, VERSION, 0, count, duration_ms, text_offset, offsets[-1])
+        return header + _le(starts) + _le(ends) + _le(offsets) + b"".join(text for _, _, text in segments)
+
+
+class SegmentIndex:
+    """Parsed index part of a sidecar (everything but the text blob)."""
+
+    def __init__(self, data: bytes):
+        """Parse the header and arrays.
+
+        Args:
+            data: At least the first `text_offset` bytes of a sidecar
+
+        Raises:
+            ValueError: If the data is not a segment index or is too short
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Segment index too short")
+        magic, version, _, count, duration_ms, text_offset, text_size = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a segment index or unsupported version")
+        self.count = count
+        self.duration = duration_ms / 1000
+        self.text_offset = text_offset
+        self.text_size = text_size
+        if len(data) < text_offset:
+            raise ValueError(f"Segment index needs {text_offset} bytes, got {len(data)}")
+
+        self.starts = _from_le(data, _HEADER.size, count)
+        self.ends = _from_le(data, _HEADER.size + count * 4, count)
+        self.offsets = _from_le(data, _HEADER.size + count * 8, count + 1)
+
+    @staticmethod
+    def index_size(header: bytes) -> int:
+        """Bytes a reader needs to parse the index, from the first header bytes."""
+        return _HEADER.unpack_from(header, 0)[5]
+
+    def find(self, seconds: float) -> Optional[int]:
+        """Find the segment spoken at a time offset.
+
+        Args:
+            seconds: Offset from the start of the recording
+
+        Returns:
+            Index of the last segment starting at or before the offset, or None
+            if the offset is before the first segment
+        """
+        position = bisect_right(self.starts, int(seconds * 1000)) - 1
+        return position if position >= 0 else None
+
+    def text_range(self, position: int) -> Tuple[int, int]:
+        """Absolute byte range (inclusive, as in an HTTP Range header) of a segment's text."""
+        start = self.text_offset + self.offsets[position]
+        return start, self.text_offset + self.offsets[position + 1] - 1
+
+
+def segment_at(data: bytes, seconds: float) -> Optional[Tuple[float, float, str]]:
+    """Look up the segment at a time offset in a whole sidecar held in memory.
+
+    Args:
+        data: Encoded sidecar
+        seconds: Offset from the start of the recording
+
+    Returns:
+        Tuple of (start, end, text), or None before the first segment
+    """
+    index = SegmentIndex(data)
+    position = index.find(seconds)
+    if position is None:
+        return None
+    first, last = index.text_range(position)
+    return index.starts[position] / 1000, index.ends[position] / 1000, data[first:last + 1].decode("utf-8")
+
+
+def fetch_segment_at(s3_client, bucket: str, key: str, seconds: float) -> Optional[Tuple[float, float, str]]:
+    """Look up the segment at a time offset with S3 ranged GETs.
+
+    One GET of `PREFETCH_BYTES` returns the header and, for all but very long
+    transcripts, the whole index; the segment is found by binary search and
+    its text is read with a second small ranged GET (unless it came with the
+    first one).
+
+    Args:
+        s3_client: boto3 S3 client
+        bucket: S3 bucket
+        key: Key of the sidecar
+        seconds: Offset from the start of the recording
+
+    Returns:
+        Tuple of (start, end, text), or None before the first segment
+    """
+    def read_range(first: int, last: int) -> bytes:
+        response = s3_client.get_object(Bucket=bucket, Key=key, Range=f"bytes={first}-{last}")
+        return response['Body'].read()
+
+    data = read_range(0, PREFETCH_BYTES - 1)
+    needed = SegmentIndex.index_size(data)
+    if len(data) < needed:
+        data += read_range(len(data), needed - 1)
+    index = SegmentIndex(data)
+
+    position = index.find(seconds)
+    if position is None:
+        return None
+    first, last = index.text_range(position)
+    # Small sidecars arrive whole with the first GET
+    text = (data[first:last + 1] if last < len(data) else read_range(first, last)).decode("utf-8")
+    return index.starts[position] / 1000, index.ends[position] / 1000, text
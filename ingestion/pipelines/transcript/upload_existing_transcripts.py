@@ -1,16 +1,32 @@
 """Upload existing transcripts from local directory to S3."""
 
 import os
-import json
+import io
+import hashlib
 import logging
+import threading
+from collections import Counter
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, Set, List, Callable
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from sqlalchemy import String, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
 
 import config
 from kol_torah_db.models import YoutubeVideo, Series, Rabbi
 from pipelines.utils import get_db_session
+from pipelines.ledger import RunLedger
+from pipelines.sharding import ShardFilter
+from pipelines.transcript.manifest import UploadManifest, file_md5
+from pipelines.transcript.validate import validate_transcript, TranscriptFormatError
+from pipelines.transcript.compression import compress, IDENTITY, ENCODINGS
+from pipelines.transcript.archive import iter_archive_transcripts
+from pipelines.transcript.segment_index import SegmentIndexBuilder
+from pipelines.transcript.load_segments import replace_segments
 
 logger = logging.getLogger(__name__)
 
@@ -18,12 +34,25 @@ logger = logging.getLogger(__name__)
 class TranscriptUploader:
     """Uploads existing transcript files to S3 and updates database."""
     
+    # Video IDs per lookup query
+    LOOKUP_CHUNK_SIZE = 1000
+    
+    # Archive members read (and held in memory) per batch
+    ARCHIVE_BATCH_SIZE = 500
+    
     def __init__(
         self,
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
         aws_region: Optional[str] = None,
-        s3_bucket: Optional[str] = None
+        s3_bucket: Optional[str] = None,
+        workers: Optional[int] = None,
+        use_manifest: bool = True,
+        manifest_dir: Optional[Path] = None,
+        normalize: Optional[bool] = None,
+        encoding: Optional[str] = None,
+        segment_index: Optional[bool] = None,
+        load_segments: Optional[bool] = None
     ):
         """Initialize S3 client and configuration.
         
@@ -32,18 +61,48 @@ class TranscriptUploader:
             aws_secret_access_key: AWS secret key (uses config if not provided)
             aws_region: AWS region (uses config if not provided)
             s3_bucket: S3 bucket name (uses config if not provided)
+            workers: Concurrent uploads in upload_from_directory (uses config if not provided)
+            use_manifest: Keep a local manifest of uploaded files for incremental re-runs
+            manifest_dir: Directory for manifests (uses config if not provided)
+            normalize: Upload transcripts rewritten as compact JSON (uses config if not provided)
+            encoding: Content-Encoding of uploaded objects: identity, gzip or zstd (uses config if not provided)
+            segment_index: Upload a segment index sidecar with each transcript (uses config if not provided)
+            load_segments: Replace the video's rows in sources.transcript_segments on upload
+                (uses config if not provided)
         """
         self.aws_access_key_id = aws_access_key_id or config.get_aws_access_key_id()
         self.aws_secret_access_key = aws_secret_access_key or config.get_aws_secret_access_key()
         self.aws_region = aws_region or config.AWS_REGION
         self.s3_bucket = s3_bucket or config.S3_BUCKET_NAME
+        self.workers = max(1, workers or config.TRANSCRIPT_UPLOAD_WORKERS)
+        self.normalize = config.TRANSCRIPT_NORMALIZE if normalize is None else normalize
+        self.encoding = encoding or config.TRANSCRIPT_CONTENT_ENCODING
+        if self.encoding not in ENCODINGS:
+            raise ValueError(f"Unknown transcript encoding: {self.encoding} (expected one of {', '.join(ENCODINGS)})")
+        self.segment_index = config.TRANSCRIPT_INDEX_ENABLED if segment_index is None else segment_index
+        self.load_segments = config.TRANSCRIPT_SEGMENTS_ON_UPLOAD if load_segments is None else load_segments
         
+        # One client shared by all workers (boto3 clients are thread-safe);
+        # its connection pool must hold one connection per worker
         self.s3_client = boto3.client(
             's3',
             aws_access_key_id=self.aws_access_key_id,
             aws_secret_access_key=self.aws_secret_access_key,
-            region_name=self.aws_region
+            region_name=self.aws_region,
+            config=Config(max_pool_connections=max(10, self.workers))
         )
+        self.ledger = RunLedger("transcript-upload")
+        self.errors: Dict[str, str] = {}
+        # Uploaded transcripts whose segments could not be loaded (video ID -> message)
+        self.segment_warnings: Dict[str, str] = {}
+        self._stats_lock = threading.Lock()
+        
+        self.manifest_dir: Optional[Path] = None
+        if use_manifest:
+            self.manifest_dir = Path(
+                manifest_dir or config.TRANSCRIPT_MANIFEST_DIR or config.WORK_DIR / "transcript-manifests"
+            )
+        self.manifest: Optional[UploadManifest] = None
     
     def _generate_transcript_s3_path(self, audio_path: str) -> str:
         """Generate S3 path for transcript based on audio path.
@@ -57,6 +116,17 @@ class TranscriptUploader:
         # Replace .mp3 extension with .json
         return audio_path.rsplit('.', 1)[0] + '.json'
     
+    def _generate_index_s3_path(self, transcript_path: str) -> str:
+        """Generate the S3 path of a transcript's segment index sidecar.
+        
+        Args:
+            transcript_path: S3 path of the transcript
+            
+        Returns:
+            Path next to the transcript (e.g., rabbi/series/2024-01-01-videoid.idx)
+        """
+        return transcript_path.rsplit('.', 1)[0] + '.idx'
+    
     def _check_s3_exists(self, s3_path: str) -> bool:
         """Check if a file exists in S3.
         
@@ -74,53 +144,476 @@ class TranscriptUploader:
                 return False
             raise
     
-    def _validate_transcript_file(self, file_path: Path) -> bool:
-        """Validate that the transcript file is valid JSON.
+    def _validate_transcript_file(
+        self,
+        file_path: Path,
+        data: Optional[bytes] = None,
+        on_segment: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Optional[bytes]:
+        """Validate a transcript file's structure in one streaming pass.
+        
+        Checks the segments (start, end and text) without building the whole
+        document in memory; see `validate_transcript`.
         
         Args:
             file_path: Path to transcript file
+            data: Content of the file if already read (e.g. from an archive)
+            on_segment: Called with each segment as it is validated
             
         Returns:
-            True if valid, False otherwise
+            Compact JSON to upload when `self.normalize` is set, otherwise None
+            (upload the file as it is)
+            
+        Raises:
+            TranscriptFormatError: If the file is invalid
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                json.load(f)
-            return True
-        except (json.JSONDecodeError, Exception) as e:
+            source = io.BytesIO(data) if data is not None else file_path
+            return validate_transcript(source, normalize=self.normalize, on_segment=on_segment)
+        except TranscriptFormatError as e:
             logger.warning(f"Invalid transcript file {file_path}: {e}")
-            return False
+            raise
     
-    def _upload_to_s3(self, local_path: Path, s3_path: str) -> None:
+    def _prepare_body(
+        self,
+        file_path: Path,
+        data: Optional[bytes] = None
+    ) -> Tuple[Optional[bytes], Optional[bytes], Optional[List[Tuple[float, float, str]]]]:
+        """Validate a transcript file and build the bytes to store in S3.
+        
+        The segment index sidecar and the segment rows, if enabled, are
+        collected in the same validation pass.
+        
+        Args:
+            file_path: Path to transcript file
+            data: Content of the file if already read (e.g. from an archive)
+            
+        Returns:
+            Tuple of (normalized and/or compressed bytes, or None to upload the
+            file as it is (never None when `data` is given); segment index or None;
+            (start, end, text) segments or None)
+            
+        Raises:
+            TranscriptFormatError: If the file is invalid
+        """
+        builder = SegmentIndexBuilder() if self.segment_index else None
+        segments: Optional[List[Tuple[float, float, str]]] = [] if self.load_segments else None
+        
+        def on_segment(segment: Dict[str, Any]) -> None:
+            if builder is not None:
+                builder.add(segment)
+            if segments is not None:
+                segments.append((float(segment["start"]), float(segment["end"]), segment["text"]))
+        
+        body = self._validate_transcript_file(file_path, data, on_segment)
+        index = builder.encode() if builder else None
+        if body is None:
+            body = data
+        if self.encoding == IDENTITY:
+            return body, index, segments
+        if body is None:
+            body = file_path.read_bytes()
+        return compress(body, self.encoding), index, segments
+    
+    def _upload_index(self, transcript_s3_path: str, index: Optional[bytes]) -> Optional[str]:
+        """Upload a segment index sidecar next to its transcript.
+        
+        Args:
+            transcript_s3_path: S3 path of the transcript
+            index: Encoded sidecar (None if disabled)
+            
+        Returns:
+            S3 path of the sidecar, or None if there is none
+        """
+        if index is None:
+            return None
+        index_s3_path = self._generate_index_s3_path(transcript_s3_path)
+        # Stored uncompressed: readers fetch byte ranges of it
+        self.s3_client.put_object(
+            Bucket=self.s3_bucket,
+            Key=index_s3_path,
+            Body=index,
+            ContentType='application/octet-stream'
+        )
+        return index_s3_path
+    
+    def _upload_to_s3(self, local_path: Path, s3_path: str, body: Optional[bytes] = None) -> None:
         """Upload file to S3 with progress indication.
         
         Args:
             local_path: Local file path
             s3_path: S3 destination path
+            body: Bytes to upload instead of the file (normalized and/or compressed)
         """
-        file_size = local_path.stat().st_size
-        logger.info(f"Uploading to s3://{self.s3_bucket}/{s3_path} ({file_size / 1024:.2f} KB)")
+        file_size = len(body) if body is not None else local_path.stat().st_size
+        logger.info(f"Uploading to s3://{self.s3_bucket}/{s3_path} ({file_size / 1024:.2f} KB, {self.encoding})")
+        extra_args = {'ContentType': 'application/json'}
+        if self.encoding != IDENTITY:
+            extra_args['ContentEncoding'] = self.encoding
+        
+        if self.workers > 1:
+            # Concurrent mode: one PUT per file, no per-file transfer threads or progress output
+            with (io.BytesIO(body) if body is not None else open(local_path, 'rb')) as f:
+                self.s3_client.put_object(
+                    Bucket=self.s3_bucket,
+                    Key=s3_path,
+                    Body=f,
+                    **extra_args
+                )
+            return
         
         # Upload with progress callback
-        self.s3_client.upload_file(
-            str(local_path),
-            self.s3_bucket,
-            s3_path,
-            ExtraArgs={'ContentType': 'application/json'},
-            Callback=lambda bytes_transferred: print(
-                f"\rUploading to S3: {(bytes_transferred / file_size) * 100:.1f}%",
-                end='',
-                flush=True
-            ) if file_size > 0 else None
-        )
+        with (io.BytesIO(body) if body is not None else open(local_path, 'rb')) as f:
+            self.s3_client.upload_fileobj(
+                f,
+                self.s3_bucket,
+                s3_path,
+                ExtraArgs=extra_args,
+                Callback=lambda bytes_transferred: print(
+                    f"\rUploading to S3: {(bytes_transferred / file_size) * 100:.1f}%",
+                    end='',
+                    flush=True
+                ) if file_size > 0 else None
+            )
         print()  # New line after upload completes
         logger.info(f"Successfully uploaded to S3")
     
-    def upload_from_directory(self, transcript_dir: str) -> Dict[str, int]:
+    def _upload_and_record(
+        self,
+        video_db_id: int,
+        video_id: str,
+        audio_path: str,
+        transcript_file: Path,
+        body: Optional[bytes] = None,
+        index: Optional[bytes] = None,
+        segments: Optional[List[Tuple[float, float, str]]] = None
+    ) -> str:
+        """Upload a transcript next to its audio and store its location.
+        
+        Args:
+            video_db_id: Database ID of the video
+            video_id: YouTube video ID
+            audio_path: S3 path of the video's audio
+            transcript_file: Local transcript file
+            body: Bytes to upload instead of the file (normalized and/or compressed)
+            index: Segment index sidecar to upload next to it
+            segments: Segments to store in sources.transcript_segments (None to leave them)
+            
+        Returns:
+            S3 path of the transcript
+        """
+        # Generate transcript S3 path based on audio path
+        transcript_s3_path = self._generate_transcript_s3_path(audio_path)
+        self._upload_to_s3(transcript_file, transcript_s3_path, body)
+        index_s3_path = self._upload_index(transcript_s3_path, index)
+        
+        # Update database
+        with get_db_session() as session:
+            video = session.query(YoutubeVideo).filter(
+                YoutubeVideo.id == video_db_id
+            ).first()
+            if video:
+                video.transcript_bucket = self.s3_bucket  # type: ignore
+                video.transcript_path = transcript_s3_path  # type: ignore
+                video.transcript_encoding = self.encoding  # type: ignore
+                video.transcript_size = self._stored_size(transcript_file, body)  # type: ignore
+                video.transcript_index_path = index_s3_path  # type: ignore
+                logger.info(f"Updated database record for video {video_id}")
+        if segments is not None:
+            # Keeps the search index current as transcripts are attached. The transcript
+            # is already recorded, so a failure here must not fail the upload (later runs
+            # would skip the file as attached); `transcript load-segments` backfills it.
+            try:
+                replace_segments([(video_db_id, transcript_s3_path, segments)])
+            except Exception as e:
+                logger.warning(
+                    f"Transcript of video {video_id} uploaded, but loading its segments failed: {e} "
+                    f"(run `transcript load-segments` to backfill)"
+                )
+                with self._stats_lock:
+                    self.segment_warnings[video_id] = f"{type(e).__name__}: {e}"
+        return transcript_s3_path
+    
+    def attach_transcript(self, video_id: str, transcript_file: Path) -> bool:
+        """Upload the transcript of a single video (used by `pipeline run`).
+        
+        The attempt is recorded in `self.ledger`; the caller starts and
+        finishes the run.
+        
+        Args:
+            video_id: YouTube video ID
+            transcript_file: Local transcript file
+            
+        Returns:
+            True if uploaded, False if skipped (no audio yet or transcript already attached)
+        """
+        with get_db_session() as session:
+            row = session.query(
+                YoutubeVideo.id,
+                YoutubeVideo.path,
+                YoutubeVideo.transcript_path
+            ).filter(YoutubeVideo.video_id == video_id).first()
+        
+        if not row or not row.path or row.transcript_path:
+            logger.info(f"Video {video_id} has no audio or already has a transcript, skipping")
+            return False
+        
+        try:
+            body, index, segments = self._prepare_body(transcript_file)
+        except TranscriptFormatError as e:
+            self.ledger.record_failure(video_id, "validate", e)
+            raise
+        
+        try:
+            self._upload_and_record(int(row.id), video_id, str(row.path), transcript_file, body, index, segments)
+        except Exception as e:
+            self.ledger.record_failure(video_id, "upload", e)
+            raise
+        self.ledger.record_success(video_id)
+        return True
+    
+    def _process_file(
+        self,
+        idx: int,
+        total: int,
+        transcript_file: Path,
+        video_map: Dict[str, Tuple[int, Optional[str]]],
+        blocked: Set[str],
+        data: Optional[bytes] = None,
+        video_id: Optional[str] = None
+    ) -> Tuple[str, Optional[str]]:
+        """Validate, upload and record one transcript file.
+        
+        Safe to call from several threads at once; errors are caught and
+        returned so that one bad file never stops the others.
+        
+        Args:
+            idx: Position of the file (for progress logging)
+            total: Number of files in the run
+            transcript_file: Transcript file named <video-id>.json (member name for archives)
+            video_map: Video ID to (database ID, audio path) for videos without transcripts
+            blocked: Video IDs that are cooling down or quarantined
+            data: Content of the file if already read (archive members)
+            video_id: Video ID, if already derived from the name (archive members);
+                defaults to the file name without extension
+            
+        Returns:
+            Tuple of (outcome, error message), outcome being uploaded, skipped or failed
+        """
+        video_id = video_id or transcript_file.stem
+        
+        logger.info(f"[{idx}/{total}] Processing transcript for video {video_id}")
+        
+        if video_id in blocked:
+            logger.info(f"Video {video_id} failed recently or is quarantined, skipping")
+            return "skipped", None
+        
+        # Check if video exists in our map
+        if video_id not in video_map:
+            logger.info(f"Video {video_id} not found in database or already has transcript, skipping")
+            return "skipped", None
+        
+        video_db_id, audio_path = video_map[video_id]
+        
+        # Check if video has audio path
+        if not audio_path:
+            logger.warning(f"Video {video_id} has no audio path in database, skipping")
+            return "skipped", None
+        
+        try:
+            # Validate transcript file (and normalize and compress it, if enabled)
+            try:
+                body, index, segments = self._prepare_body(transcript_file, data)
+            except TranscriptFormatError as error:
+                logger.error(f"Invalid transcript file for video {video_id}")
+                self.ledger.record_failure(video_id, "validate", error)
+                if self.manifest:
+                    self.manifest.record(transcript_file, "failed", error=str(error))
+                return "failed", str(error)
+            
+            # Upload to S3
+            try:
+                md5 = file_md5(transcript_file) if self.manifest else None
+                s3_key = self._upload_and_record(
+                    video_db_id, video_id, audio_path, transcript_file, body, index, segments
+                )
+            except Exception as e:
+                logger.error(f"Failed to upload transcript for video {video_id}: {e}")
+                self.ledger.record_failure(video_id, "upload", e)
+                if self.manifest:
+                    self.manifest.record(transcript_file, "failed", error=f"{type(e).__name__}: {e}")
+                return "failed", f"{type(e).__name__}: {e}"
+            
+            self.ledger.record_success(video_id)
+            if self.manifest:
+                self.manifest.record(transcript_file, "uploaded", md5=md5, s3_key=s3_key, etag=self._etag(md5, body))
+            return "uploaded", None
+        except Exception as e:
+            # Ledger (database) errors
+            logger.error(f"Failed to record transcript for video {video_id}: {e}")
+            return "failed", f"{type(e).__name__}: {e}"
+    
+    @staticmethod
+    def _stored_size(transcript_file: Path, body: Optional[bytes]) -> int:
+        """Size in bytes of the object stored in S3."""
+        return len(body) if body is not None else transcript_file.stat().st_size
+    
+    @staticmethod
+    def _etag(file_md5_hex: Optional[str], body: Optional[bytes]) -> Optional[str]:
+        """Expected S3 ETag of an upload: MD5 of the uploaded bytes."""
+        return hashlib.md5(body).hexdigest() if body is not None else file_md5_hex
+    
+    def _reupload(self, transcript_file: Path, s3_key: str) -> Tuple[str, Optional[str]]:
+        """Upload a changed (or stale) transcript again to its recorded S3 key.
+        
+        The database already points at the key, so only S3, the stored
+        encoding, size and index path, the video's segments and the manifest
+        are updated.
+        
+        Args:
+            transcript_file: Transcript file
+            s3_key: S3 key recorded in the manifest
+            
+        Returns:
+            Tuple of (outcome, error message)
+        """
+        assert self.manifest is not None
+        try:
+            md5 = file_md5(transcript_file)
+            body, index, segments = self._prepare_body(transcript_file)
+            logger.info(f"Transcript {transcript_file.name} changed, uploading it again")
+            self._upload_to_s3(transcript_file, s3_key, body)
+            index_s3_path = self._upload_index(s3_key, index)
+            with get_db_session() as session:
+                fields = {
+                    YoutubeVideo.transcript_encoding: self.encoding,
+                    YoutubeVideo.transcript_size: self._stored_size(transcript_file, body),
+                    YoutubeVideo.transcript_index_path: index_s3_path
+                }
+                if segments is None:
+                    # The loaded segments are stale; `transcript load-segments` picks the video up again
+                    fields[YoutubeVideo.segments_transcript_path] = None
+                session.query(YoutubeVideo).filter(YoutubeVideo.transcript_path == s3_key).update(
+                    fields, synchronize_session=False
+                )
+                video_db_id = session.query(YoutubeVideo.id).filter(YoutubeVideo.transcript_path == s3_key).scalar()
+            if segments is not None and video_db_id is not None:
+                replace_segments([(int(video_db_id), s3_key, segments)])
+        except Exception as e:
+            logger.error(f"Failed to re-upload {transcript_file.name}: {e}")
+            # Stay stale so the next run tries again
+            self.manifest.mark_stale(transcript_file.name, f"{type(e).__name__}: {e}")
+            return "failed", f"{type(e).__name__}: {e}"
+        self.manifest.record(transcript_file, "uploaded", md5=md5, s3_key=s3_key, etag=self._etag(md5, body))
+        return "uploaded", None
+    
+    def _verify_manifest(self, transcript_path: Path, entries: Dict[str, Dict[str, Any]]) -> Dict[str, int]:
+        """Re-check uploaded files against their local content and S3 ETags.
+        
+        Files whose local content or S3 object no longer match the recorded
+        MD5 are marked stale and uploaded again by the run. ETags of multipart
+        uploads are not MD5s; those objects are compared by size instead.
+        
+        Args:
+            transcript_path: Transcript directory
+            entries: Manifest entries (statuses are updated in place)
+            
+        Returns:
+            Dictionary with verified and stale counts
+        """
+        assert self.manifest is not None
+        
+        def check(name: str, entry: Dict[str, Any]) -> Optional[str]:
+            local = transcript_path / name
+            if local.exists() and file_md5(local) != entry["md5"]:
+                return "local content changed"
+            try:
+                head = self.s3_client.head_object(Bucket=self.s3_bucket, Key=entry["s3_key"])
+            except ClientError as e:
+                if e.response['Error']['Code'] in ('404', 'NoSuchKey'):
+                    return "missing in S3"
+                raise
+            etag = head.get('ETag', '').strip('"')
+            if '-' in etag:
+                if head.get('ContentLength') != entry["size"]:
+                    return "S3 size differs"
+            elif etag != (entry["etag"] or entry["md5"]):
+                return "S3 ETag differs"
+            return None
+        
+        uploaded = {name: entry for name, entry in entries.items() if entry["status"] == "uploaded" and entry["s3_key"]}
+        logger.info(f"Verifying {len(uploaded)} uploaded transcripts against S3")
+        stale = 0
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="verify") as pool:
+            futures = {pool.submit(check, name, entry): name for name, entry in uploaded.items()}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    reason = future.result()
+                except Exception as e:
+                    logger.error(f"Could not verify {name}: {e}")
+                    continue
+                if reason:
+                    logger.warning(f"{name}: {reason}, marking for re-upload")
+                    self.manifest.mark_stale(name, reason)
+                    entries[name]["status"] = "stale"
+                    stale += 1
+        return {"verified": len(uploaded), "stale": stale}
+    
+    def _load_video_map(self, video_ids: List[str]) -> Dict[str, Tuple[int, Optional[str]]]:
+        """Look up the videos without transcripts among the given video IDs.
+        
+        Queries in chunks with `video_id = ANY(:ids)` (one array parameter per
+        chunk) and selects only the columns needed, so time and memory scale
+        with the number of files rather than with the catalog.
+        
+        Args:
+            video_ids: YouTube video IDs (file stems)
+            
+        Returns:
+            Mapping of video_id to (db_id, audio_path)
+        """
+        video_map: Dict[str, Tuple[int, Optional[str]]] = {}
+        with get_db_session() as session:
+            for i in range(0, len(video_ids), self.LOOKUP_CHUNK_SIZE):
+                chunk = video_ids[i:i + self.LOOKUP_CHUNK_SIZE]
+                rows = session.query(
+                    YoutubeVideo.id,
+                    YoutubeVideo.video_id,
+                    YoutubeVideo.path
+                ).filter(
+                    YoutubeVideo.video_id == any_(bindparam("video_ids", chunk, type_=ARRAY(String))),
+                    YoutubeVideo.transcript_path.is_(None)
+                ).all()
+                for db_id, video_id, path in rows:
+                    video_map[str(video_id)] = (int(db_id), str(path) if path else None)
+        return video_map
+    
+    def upload_from_directory(
+        self,
+        transcript_dir: str,
+        shard: Optional[ShardFilter] = None,
+        verify: bool = False
+    ) -> Dict[str, int]:
         """Upload all transcripts from a directory.
         
+        With the manifest enabled, files unchanged (same size and mtime)
+        since their last successful upload are counted as `unchanged`
+        without any database or S3 call, and files whose content changed are
+        uploaded again to their recorded key.
+        
+        Files are processed by `self.workers` threads sharing one S3 client.
+        Statistics do not depend on completion order, and the error of each
+        failed file is kept in `self.errors` (file name -> message).
+        
+        The run and every attempt are recorded in `self.ledger`; files whose
+        earlier failures are still cooling down, or that are quarantined, are
+        skipped.
+        
         Args:
             transcript_dir: Directory containing transcript JSON files named <video-id>.json
+            shard: Only upload transcripts of videos owned by this shard (None for all)
+            verify: First re-check recorded uploads against S3 ETags (see `_verify_manifest`)
             
         Returns:
             Dictionary with processing statistics
@@ -134,90 +627,195 @@ class TranscriptUploader:
         
         # Find all JSON files
         transcript_files = list(transcript_path.glob("*.json"))
+        if shard:
+            transcript_files = [f for f in transcript_files if shard.matches(f.stem)]
+            logger.info(f"Keeping {len(transcript_files)} files for {shard}")
         total = len(transcript_files)
         
         logger.info(f"Found {total} transcript files")
         
         if total == 0:
-            return {"total": 0, "uploaded": 0, "skipped": 0, "failed": 0}
-        
-        # Load all videos without transcripts from database (single query)
-        logger.info("Loading videos without transcripts from database...")
-        with get_db_session() as session:
-            videos = session.query(YoutubeVideo).filter(
-                YoutubeVideo.transcript_path.is_(None)
-            ).all()
-            
-            # Create a mapping of video_id to (db_id, audio_path)
-            video_map = {
-                str(v.video_id): (int(v.id), str(v.path) if v.path else None)  # type: ignore
-                for v in videos
-            }
+            return {"total": 0, "uploaded": 0, "skipped": 0, "failed": 0, "unchanged": 0}
         
-        logger.info(f"Found {len(video_map)} videos in database without transcripts")
+        # Split files into new, changed and unchanged using the manifest
+        jobs: List[Tuple[Path, Optional[str]]] = []
+        unchanged = 0
+        verify_stats: Dict[str, int] = {}
+        self.manifest = UploadManifest.for_directory(self.manifest_dir, transcript_path) if self.manifest_dir else None
+        if self.manifest:
+            entries = self.manifest.entries()
+            if verify:
+                verify_stats = self._verify_manifest(transcript_path, entries)
+            for transcript_file in transcript_files:
+                entry = entries.get(transcript_file.name)
+                if entry and entry["status"] == "uploaded":
+                    if UploadManifest.is_unchanged(entry, transcript_file):
+                        unchanged += 1
+                        continue
+                    if file_md5(transcript_file) == entry["md5"]:
+                        self.manifest.touch(transcript_file)
+                        unchanged += 1
+                        continue
+                    jobs.append((transcript_file, entry["s3_key"]))
+                elif entry and entry["status"] == "stale" and entry["s3_key"]:
+                    jobs.append((transcript_file, entry["s3_key"]))
+                else:
+                    jobs.append((transcript_file, None))
+            logger.info(f"Manifest {self.manifest.path}: {unchanged} unchanged, {len(jobs)} new or changed")
+        else:
+            jobs = [(transcript_file, None) for transcript_file in transcript_files]
         
-        uploaded = 0
-        skipped = 0
-        failed = 0
+        if not jobs:
+            return {"total": total, "uploaded": 0, "skipped": 0, "failed": 0, "unchanged": unchanged, **verify_stats}
         
-        for idx, transcript_file in enumerate(transcript_files, 1):
-            # Extract video ID from filename
-            video_id = transcript_file.stem  # filename without extension
+        self.ledger.start()
+        outcomes: Counter = Counter()
+        try:
+            video_ids = [f.stem for f, s3_key in jobs if s3_key is None]
+            blocked = set()
+            for i in range(0, len(video_ids), self.LOOKUP_CHUNK_SIZE):
+                blocked |= self.ledger.blocked_keys(video_ids[i:i + self.LOOKUP_CHUNK_SIZE])
             
-            logger.info(f"\n[{idx}/{total}] Processing transcript for video {video_id}")
+            # Look up only the videos that have a file in this directory
+            logger.info("Loading videos without transcripts from database...")
+            video_map = self._load_video_map(video_ids)
             
-            # Check if video exists in our map
-            if video_id not in video_map:
-                logger.info(f"Video {video_id} not found in database or already has transcript, skipping")
-                skipped += 1
-                continue
+            logger.info(f"Found {len(video_map)} videos in database without transcripts")
             
-            video_db_id, audio_path = video_map[video_id]
+            self.errors = {}
+            self.segment_warnings = {}
             
-            # Check if video has audio path
-            if not audio_path:
-                logger.warning(f"Video {video_id} has no audio path in database, skipping")
-                skipped += 1
-                continue
+            def process(idx: int, transcript_file: Path, s3_key: Optional[str]) -> None:
+                if s3_key:
+                    outcome, error = self._reupload(transcript_file, s3_key)
+                else:
+                    outcome, error = self._process_file(idx, len(jobs), transcript_file, video_map, blocked)
+                with self._stats_lock:
+                    outcomes[outcome] += 1
+                    if error:
+                        self.errors[transcript_file.name] = error
             
-            # Validate transcript file
-            if not self._validate_transcript_file(transcript_file):
-                logger.error(f"Invalid transcript file for video {video_id}")
-                failed += 1
-                continue
+            if self.workers == 1:
+                for idx, (transcript_file, s3_key) in enumerate(jobs, 1):
+                    process(idx, transcript_file, s3_key)
+            else:
+                # Files are a few KB, so time goes to S3 and DB round trips: overlap them
+                logger.info(f"Uploading with {self.workers} concurrent workers")
+                with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="transcript") as pool:
+                    futures = [
+                        pool.submit(process, idx, transcript_file, s3_key)
+                        for idx, (transcript_file, s3_key) in enumerate(jobs, 1)
+                    ]
+                    for future in as_completed(futures):
+                        future.result()
+        except BaseException:
+            # Close the run record instead of leaving it "running" forever
+            self.ledger.abort({"total": total, **outcomes, "unchanged": unchanged})
+            raise
+        
+        stats = {
+            "total": total,
+            "uploaded": outcomes["uploaded"],
+            "skipped": outcomes["skipped"],
+            "failed": outcomes["failed"],
+            "unchanged": unchanged,
+            **verify_stats
+        }
+        
+        logger.info(f"\nProcessing complete: {stats}")
+        self.ledger.finish(stats)
+        return stats
+    
+    def upload_from_archive(self, archive_path: str, shard: Optional[ShardFilter] = None) -> Dict[str, int]:
+        """Upload all transcripts from a .tar, .tar.gz or .zip archive without extracting it.
+        
+        Members named <video-id>.json (at any depth) are read one at a time
+        and collected into batches of `ARCHIVE_BATCH_SIZE`. Each batch is
+        looked up in the database and uploaded straight from memory by
+        `self.workers` threads before the next batch is read, so memory is
+        bounded by the batch and nothing is written to disk.
+        
+        The manifest is not used: archive members have no stable size and
+        mtime to compare, and videos that already have a transcript are
+        skipped by the database lookup anyway.
+        
+        Args:
+            archive_path: Archive file
+            shard: Only upload transcripts of videos owned by this shard (None for all)
             
-            # Generate transcript S3 path based on audio path
-            transcript_s3_path = self._generate_transcript_s3_path(audio_path)
+        Returns:
+            Dictionary with processing statistics
+        """
+        self.manifest = None
+        self.errors = {}
+        self.segment_warnings = {}
+        outcomes: Counter = Counter()
+        total = 0
+        keep = shard.matches if shard else None
+        members = iter_archive_transcripts(Path(archive_path), keep)
+        
+        logger.info(f"Streaming transcripts from archive: {archive_path}")
+        self.ledger.start()
+        try:
+            def process(idx: int, seen: int, video_id: str, name: str, data: bytes, video_map, blocked) -> None:
+                outcome, error = self._process_file(idx, seen, Path(name), video_map, blocked, data, video_id)
+                with self._stats_lock:
+                    outcomes[outcome] += 1
+                    if error:
+                        self.errors[name] = error
             
-            # Upload to S3
-            try:
-                logger.info(f"Processing transcript for video: {video_id}")
-                self._upload_to_s3(transcript_file, transcript_s3_path)
-                
-                # Update database
-                with get_db_session() as session:
-                    video = session.query(YoutubeVideo).filter(
-                        YoutubeVideo.id == video_db_id
-                    ).first()
-                    if video:
-                        video.transcript_bucket = self.s3_bucket  # type: ignore
-                        video.transcript_path = transcript_s3_path  # type: ignore
-                        logger.info(f"Updated database record for video {video_id}")
-                
-                uploaded += 1
-                
-            except Exception as e:
-                logger.error(f"Failed to upload transcript for video {video_id}: {e}")
-                failed += 1
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="transcript") as pool:
+                while True:
+                    batch = list(islice(members, self.ARCHIVE_BATCH_SIZE))
+                    if not batch:
+                        break
+                    
+                    # Two members for one video (e.g. a/x.json and b/x.json) would race
+                    # to upload and record the same row, so only the first one is used
+                    members_by_id: Dict[str, Tuple[str, bytes]] = {}
+                    for video_id, name, data in batch:
+                        if video_id in members_by_id:
+                            logger.warning(
+                                f"Archive member {name} is a second transcript for video {video_id} "
+                                f"(first: {members_by_id[video_id][0]}), skipping it"
+                            )
+                            outcomes["skipped"] += 1
+                            continue
+                        members_by_id[video_id] = (name, data)
+                    
+                    video_ids = list(members_by_id)
+                    blocked = self.ledger.blocked_keys(video_ids)
+                    video_map = self._load_video_map(video_ids)
+                    
+                    futures = [
+                        pool.submit(
+                            process, total + i, total + len(batch), video_id, name, data, video_map, blocked
+                        )
+                        for i, (video_id, (name, data)) in enumerate(members_by_id.items(), 1)
+                    ]
+                    for future in as_completed(futures):
+                        future.result()
+                    
+                    total += len(batch)
+                    logger.info(
+                        f"Processed {total} archive members "
+                        f"({outcomes['uploaded']} uploaded, {outcomes['skipped']} skipped, {outcomes['failed']} failed)"
+                    )
+        except BaseException:
+            # Close the run record instead of leaving it "running" forever
+            self.ledger.abort({"total": total, **outcomes, "unchanged": 0})
+            raise
         
         stats = {
             "total": total,
-            "uploaded": uploaded,
-            "skipped": skipped,
-            "failed": failed
+            "uploaded": outcomes["uploaded"],
+            "skipped": outcomes["skipped"],
+            "failed": outcomes["failed"],
+            "unchanged": 0
         }
         
         logger.info(f"\nProcessing complete: {stats}")
+        self.ledger.finish(stats)
         return stats
 
 
@@ -0,0 +1,214 @@
+"""Streaming validation (and optional compaction) of transcript JSON files."""
+
+import codecs
+import json
+from pathlib import Path
+from contextlib import nullcontext
+from typing import Any, BinaryIO, Callable, Dict, Optional, Union
+
+# Compact separators used when normalizing
+_COMPACT = (',', ':')
+_WHITESPACE = ' \t\n\r'
+
+# Latest accepted time (~49.7 days): segment indexes store times as u32 milliseconds
+MAX_TIME_SECONDS = (2**32 - 1) / 1000
+
+
+class TranscriptFormatError(ValueError):
+    """Raised when a transcript file is not valid JSON or has the wrong structure."""
+
+
+class _StreamReader:
+    """Incremental JSON tokenizer over a binary file.
+
+    Decodes the file chunk by chunk and parses one value at a time with
+    `json.JSONDecoder.raw_decode`, so only the value being parsed (e.g. a
+    single segment) is held in memory. When a value runs past the end of
+    the buffer, the next read is as large as the buffer so far, which keeps
+    re-parsing of large values linear overall.
+    """
+
+    def __init__(self, f: BinaryIO, chunk_size: int):
+        self._file = f
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._json = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: int) -> bool:
+        """Read more text into the buffer; False at end of file."""
+        if self._eof:
+            return False
+        data = self._file.read(size)
+        try:
+            text = self._decoder.decode(data, final=not data)
+        except UnicodeDecodeError as e:
+            raise TranscriptFormatError(f"Not valid UTF-8: {e}")
+        if not data:
+            self._eof = True
+        # Drop consumed text so the buffer only holds what is still needed
+        self._buf = self._buf[self._pos:] + text
+        self._pos = 0
+        return bool(data) or bool(text)
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at end of file)."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill(self._chunk_size):
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consume the next non-whitespace character, which must be one of `chars`."""
+        ch = self.peek()
+        if not ch or ch not in chars:
+            found = repr(ch) if ch else "end of file"
+            raise TranscriptFormatError(f"Expected one of {chars!r}, found {found}")
+        self._pos += 1
+        return ch
+
+    def value(self) -> Any:
+        """Parse the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buf, self._pos)
+                # A value ending exactly at the buffer end may be cut short (e.g. a number)
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError as e:
+                if self._eof:
+                    raise TranscriptFormatError(f"Invalid JSON: {e.msg} (at character {e.pos})")
+            self._fill(max(self._chunk_size, len(self._buf) - self._pos))
+
+
+def _check_segment(index: int, segment: Any) -> None:
+    """Validate one segment: an object with numeric start <= end and string text."""
+    if not isinstance(segment, dict):
+        raise TranscriptFormatError(f"Segment {index} is not an object")
+    for key in ("start", "end"):
+        value = segment.get(key)
+        # json accepts NaN and Infinity: a two-sided range check rejects both (NaN
+        # compares false), and unlike math.isfinite it cannot overflow on huge ints
+        if (isinstance(value, bool) or not isinstance(value, (int, float))
+                or not 0 <= value <= MAX_TIME_SECONDS):
+            raise TranscriptFormatError(f"Segment {index} has no valid '{key}' time")
+    if segment["end"] < segment["start"]:
+        raise TranscriptFormatError(f"Segment {index} ends before it starts")
+    if not isinstance(segment.get("text"), str):
+        raise TranscriptFormatError(f"Segment {index} has no 'text' string")
+
+
+def _dump(value: Any) -> str:
+    """Serialize a value compactly, keeping Hebrew text unescaped."""
+    return json.dumps(value, ensure_ascii=False, separators=_COMPACT)
+
+
+def _read_segments(
+    reader: _StreamReader,
+    out: Optional[list],
+    on_segment: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> int:
+    """Validate a segments array, appending its compact form to `out`."""
+    reader.expect('[')
+    if out is not None:
+        out.append('[')
+    count = 0
+    if reader.peek() == ']':
+        reader.expect(']')
+    else:
+        while True:
+            segment = reader.value()
+            _check_segment(count, segment)
+            if on_segment is not None:
+                on_segment(segment)
+            if out is not None:
+                out.append((',' if count else '') + _dump(segment))
+            count += 1
+            if reader.expect(',]') == ']':
+                break
+    if out is not None:
+        out.append(']')
+    return count
+
+
+def validate_transcript(
+    source: Union[Path, BinaryIO],
+    normalize: bool = False,
+    chunk_size: int = 64 * 1024,
+    on_segment: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Optional[bytes]:
+    """Validate a transcript file in one streaming pass, optionally producing compact JSON.
+
+    Accepted layouts are an object with a "segments" array (other keys,
+    such as "text" or "language", are kept as they are) or a bare array of
+    segments. Each segment must be an object with numeric "start" and
+    "end" (0 <= start <= end <= MAX_TIME_SECONDS) and a string "text".
+
+    Args:
+        source: Transcript file, or a binary file object (e.g. an archive member)
+        normalize: Also build compact JSON (no insignificant whitespace,
+            UTF-8 instead of \\u escapes) in the same pass
+        chunk_size: Bytes read at a time
+        on_segment: Called with each valid segment as it is read (e.g. to build
+            a segment index in the same pass)
+
+    Returns:
+        Compact JSON bytes when `normalize` is set, otherwise None (the file
+        is valid and can be uploaded as it is)
+
+    Raises:
+        TranscriptFormatError: If the file is not valid JSON or has the wrong structure
+    """
+    with (nullcontext(source) if hasattr(source, 'read') else open(source, 'rb')) as f:
+        reader = _StreamReader(f, chunk_size)
+        out: Optional[list] = [] if normalize else None
+
+        first = reader.peek()
+        if first == '[':
+            _read_segments(reader, out, on_segment)
+        elif first == '{':
+            reader.expect('{')
+            if out is not None:
+                out.append('{')
+            has_segments = False
+            if reader.peek() != '}':
+                index = 0
+                while True:
+                    key = reader.value()
+                    if not isinstance(key, str):
+                        raise TranscriptFormatError("Object keys must be strings")
+                    reader.expect(':')
+                    if out is not None:
+                        out.append((',' if index else '') + _dump(key) + ':')
+                    if key == "segments":
+                        _read_segments(reader, out, on_segment)
+                        has_segments = True
+                    else:
+                        value = reader.value()
+                        if out is not None:
+                            out.append(_dump(value))
+                    index += 1
+                    if reader.expect(',}') == '}':
+                        break
+            else:
+                reader.expect('}')
+            if out is not None:
+                out.append('}')
+            if not has_segments:
+                raise TranscriptFormatError("Transcript has no 'segments' array")
+        else:
+            raise TranscriptFormatError("Transcript must be a JSON object or array")
+
+        if reader.peek():
+            raise TranscriptFormatError("Unexpected data after the transcript")
+
+    if out is not None:
+        return "".join(out).encode('utf-8')
+    return None
@@ -3,6 +3,7 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Generator
 import config
 
@@ -15,13 +16,20 @@ def get_database_url() -> str:
 def create_db_engine():
     """Create SQLAlchemy engine."""
     database_url = get_database_url()
-    return create_engine(database_url, echo=False)
+    # Pre-ping so long-lived processes survive connections dropped by Neon
+    return create_engine(database_url, echo=False, pool_pre_ping=True)
 
 
+@lru_cache(maxsize=None)
+def get_db_engine():
+    """Get the process-wide SQLAlchemy engine (created on first use)."""
+    return create_db_engine()
+
+
+@lru_cache(maxsize=None)
 def get_session_factory():
-    """Get SQLAlchemy session factory."""
-    engine = create_db_engine()
-    return sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    """Get SQLAlchemy session factory bound to the shared engine."""
+    return sessionmaker(bind=get_db_engine(), autocommit=False, autoflush=False)
 
 
 @contextmanager
@@ -0,0 +1,126 @@
+"""Disk- and memory-budget admission control for concurrent downloads."""
+
+import logging
+import shutil
+import threading
+from pathlib import Path
+from typing import Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionController:
+    """Reserves scratch disk and RAM for each video before it starts.
+
+    Scratch usage is estimated from the stored duration: the source
+    stream, the MP3 and (optionally) the 16 kHz speech WAV plus its chunk
+    copies all sit in the work directory at the same time. A video is
+    admitted only if its estimate fits both the configured budgets and the
+    space actually free on the scratch filesystem, counting everything
+    already reserved as not yet written.
+    """
+
+    # Scratch bytes per second of audio
+    SOURCE_BYTES_PER_SECOND = 20_000   # bestaudio stream (~160 kbps opus/m4a)
+    MP3_BYTES_PER_SECOND = 24_000      # 192 kbps MP3
+    SPEECH_BYTES_PER_SECOND = 64_000   # 16 kHz mono s16 WAV and its chunk copies
+    SAFETY_FACTOR = 1.25
+
+    # Resident memory per running video (FFmpeg + decode buffers)
+    RAM_PER_VIDEO = 256 * 1024 * 1024
+
+    def __init__(
+        self,
+        scratch_dir: Path,
+        disk_budget_bytes: int,
+        ram_budget_bytes: int,
+        min_free_bytes: int = 0
+    ):
+        """Initialize the controller.
+
+        Args:
+            scratch_dir: Directory on the scratch filesystem (work directory root)
+            disk_budget_bytes: Maximum scratch bytes reserved at once
+            ram_budget_bytes: Maximum RAM reserved at once
+            min_free_bytes: Free space to always leave on the scratch filesystem
+        """
+        self.scratch_dir = Path(scratch_dir)
+        self.scratch_dir.mkdir(parents=True, exist_ok=True)
+        self.disk_budget_bytes = disk_budget_bytes
+        self.ram_budget_bytes = ram_budget_bytes
+        self.min_free_bytes = min_free_bytes
+
+        self._reservations: Dict[str, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def reserved(self) -> Tuple[int, int]:
+        """Currently reserved (disk bytes, RAM bytes)."""
+        with self._lock:
+            return (
+                sum(disk for disk, _ in self._reservations.values()),
+                sum(ram for _, ram in self._reservations.values()),
+            )
+
+    def estimate(self, duration: int, speech_chunks: bool = False) -> Tuple[int, int]:
+        """Estimate the scratch disk and RAM a video needs.
+
+        Args:
+            duration: Video duration in seconds
+            speech_chunks: Whether speech chunks will be produced
+
+        Returns:
+            Tuple of (disk bytes, RAM bytes)
+        """
+        per_second = self.SOURCE_BYTES_PER_SECOND + self.MP3_BYTES_PER_SECOND
+        if speech_chunks:
+            per_second += self.SPEECH_BYTES_PER_SECOND
+        disk = int(max(duration, 60) * per_second * self.SAFETY_FACTOR)
+        return disk, self.RAM_PER_VIDEO
+
+    def try_reserve(self, video_id: str, disk: int, ram: int) -> bool:
+        """Reserve budget for a video if it fits.
+
+        A video larger than the whole budget is still admitted when nothing
+        else is running, so it cannot be starved forever.
+
+        Args:
+            video_id: YouTube video ID
+            disk: Scratch bytes needed
+            ram: RAM bytes needed
+
+        Returns:
+            True if reserved (the caller must release it), False otherwise
+        """
+        free = shutil.disk_usage(self.scratch_dir).free
+
+        with self._lock:
+            reserved_disk = sum(d for d, _ in self._reservations.values())
+            reserved_ram = sum(r for _, r in self._reservations.values())
+
+            if not self._reservations:
+                fits = disk <= free - self.min_free_bytes
+                if fits and (disk > self.disk_budget_bytes or ram > self.ram_budget_bytes):
+                    logger.warning(
+                        f"Video {video_id} needs more than the scratch budget "
+                        f"({disk / 1024**3:.1f} GB disk), running it alone"
+                    )
+            else:
+                fits = (
+                    reserved_disk + disk <= self.disk_budget_bytes
+                    and reserved_ram + ram <= self.ram_budget_bytes
+                    and reserved_disk + disk <= free - self.min_free_bytes
+                )
+
+            if fits:
+                self._reservations[video_id] = (disk, ram)
+            return fits
+
+    def release(self, video_id: str) -> None:
+        """Release a video's reservation.
+
+        Args:
+            video_id: YouTube video ID
+        """
+        with self._lock:
+            self._reservations.pop(video_id, None)
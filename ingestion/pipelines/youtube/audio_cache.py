@@ -0,0 +1,172 @@
+"""Size-bounded on-disk LRU cache of original YouTube audio streams."""
+
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Generator
+
+logger = logging.getLogger(__name__)
+
+
+class AudioCache:
+    """On-disk cache of source audio streams, bounded by total size.
+
+    Files are stored as {root}/{video_id}.{ext} and indexed in a SQLite
+    database mapping video_id to file name, format, size and last access
+    time. When a new file would exceed the size budget, the least recently
+    used entries are evicted first.
+    """
+
+    INDEX_FILE = "index.sqlite3"
+
+    def __init__(self, root: Path, max_bytes: int):
+        """Open (and create if needed) the cache.
+
+        Args:
+            root: Directory holding cached files and the index
+            max_bytes: Maximum total size of cached files in bytes
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    video_id TEXT PRIMARY KEY,
+                    file_name TEXT NOT NULL,
+                    format TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_accessed REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_entries_last_accessed ON entries (last_accessed)")
+
+    @contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection, None, None]:
+        """Context manager for index connections (committed on success)."""
+        conn = sqlite3.connect(str(self.root / self.INDEX_FILE), timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get(self, video_id: str) -> Optional[Path]:
+        """Look up the cached source audio for a video.
+
+        Args:
+            video_id: YouTube video ID
+
+        Returns:
+            Path to the cached file, or None on a cache miss
+        """
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT file_name FROM entries WHERE video_id = ?", (video_id,)
+            ).fetchone()
+            if not row:
+                return None
+
+            path = self.root / row[0]
+            if not path.exists():
+                logger.warning(f"Cached file {path} is missing, dropping index entry")
+                conn.execute("DELETE FROM entries WHERE video_id = ?", (video_id,))
+                return None
+
+            conn.execute(
+                "UPDATE entries SET last_accessed = ? WHERE video_id = ?",
+                (time.time(), video_id)
+            )
+            logger.info(f"Audio cache hit for video {video_id}")
+            return path
+
+    def put(self, video_id: str, source_path: Path) -> Optional[Path]:
+        """Add a downloaded source audio file to the cache.
+
+        The file is hard-linked into the cache when possible and copied
+        otherwise. Least recently used entries are evicted to make room.
+
+        Args:
+            video_id: YouTube video ID
+            source_path: Downloaded source audio file
+
+        Returns:
+            Path to the cached file, or None if the file is larger than the cache
+        """
+        size = source_path.stat().st_size
+        if size > self.max_bytes:
+            logger.info(f"Not caching {source_path.name}: larger than cache budget")
+            return None
+
+        fmt = source_path.suffix.lstrip('.') or 'bin'
+        file_name = f"{video_id}.{fmt}"
+        cached_path = self.root / file_name
+
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM entries WHERE video_id = ?", (video_id,))
+            self._evict(conn, size)
+
+            tmp_path = cached_path.with_name(file_name + '.tmp')
+            try:
+                os.link(source_path, tmp_path)
+            except OSError:
+                shutil.copyfile(source_path, tmp_path)
+            os.replace(tmp_path, cached_path)
+
+            conn.execute(
+                "INSERT INTO entries (video_id, file_name, format, size, last_accessed) VALUES (?, ?, ?, ?, ?)",
+                (video_id, file_name, fmt, size, time.time())
+            )
+
+        logger.info(f"Cached source audio for video {video_id} ({size / (1024*1024):.2f} MB)")
+        return cached_path
+
+    def _evict(self, conn: sqlite3.Connection, incoming: int) -> None:
+        """Evict least recently used entries until `incoming` bytes fit.
+
+        Args:
+            conn: Open index connection
+            incoming: Size of the file about to be added
+        """
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total + incoming <= self.max_bytes:
+            return
+
+        rows = conn.execute(
+            "SELECT video_id, file_name, size FROM entries ORDER BY last_accessed"
+        ).fetchall()
+        for video_id, file_name, size in rows:
+            if total + incoming <= self.max_bytes:
+                break
+            try:
+                (self.root / file_name).unlink()
+            except FileNotFoundError:
+                pass
+            conn.execute("DELETE FROM entries WHERE video_id = ?", (video_id,))
+            total -= size
+            logger.info(f"Evicted video {video_id} from audio cache")
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """List cache entries, most recently used first.
+
+        Returns:
+            List of entry dictionaries (video_id, file_name, format, size, last_accessed)
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT video_id, file_name, format, size, last_accessed FROM entries ORDER BY last_accessed DESC"
+            ).fetchall()
+        return [
+            {"video_id": r[0], "file_name": r[1], "format": r[2], "size": r[3], "last_accessed": r[4]}
+            for r in rows
+        ]
@@ -1,31 +1,65 @@
 """Download YouTube video audio and upload to S3."""
 
 import os
+import json
 import logging
-import tempfile
+import subprocess
 from pathlib import Path
-from typing import Optional, List
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Optional, List, Dict, NamedTuple
 from datetime import date
 import boto3
 from botocore.exceptions import ClientError
-import yt_dlp
 
 import config
 from kol_torah_db.models import YoutubeVideo, Series, Rabbi
 from pipelines.utils import get_db_session
+from pipelines.metrics import RunMetrics
+from pipelines.ledger import RunLedger
+from pipelines.sharding import ShardFilter
+from pipelines.youtube.work_dir import VideoWorkDir
+from pipelines.youtube.audio_cache import AudioCache
+from pipelines.youtube.throttle import AdaptiveThrottle, is_throttle_error
+from pipelines.youtube.scheduler import VideoScheduler
+from pipelines.youtube.admission import AdmissionController
 
 logger = logging.getLogger(__name__)
 
 
+class VideoWorkItem(NamedTuple):
+    """Detached video data needed to process one video outside a DB session."""
+    
+    db_id: int
+    video_id: str
+    title: str
+    publish_date: date
+    duration: int
+    series_slug: str
+    rabbi_slug: str
+
+
 class YouTubeAudioDownloader:
     """Downloads YouTube video audio and uploads to S3."""
     
+    # How often a throttled video is put back on the queue before counting as failed
+    MAX_REQUEUES = 3
+    
     def __init__(
         self, 
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
         aws_region: Optional[str] = None,
-        s3_bucket: Optional[str] = None
+        s3_bucket: Optional[str] = None,
+        work_dir: Optional[Path] = None,
+        audio_cache: Optional[AudioCache] = None,
+        workers: Optional[int] = None,
+        scheduler: Optional[VideoScheduler] = None,
+        speech_chunks: Optional[bool] = None,
+        trim_silence: Optional[bool] = None,
+        waveform_peaks: Optional[bool] = None,
+        shard: Optional[ShardFilter] = None
     ):
         """Initialize S3 client and configuration.
         
@@ -34,11 +68,42 @@ class YouTubeAudioDownloader:
             aws_secret_access_key: AWS secret key (uses config if not provided)
             aws_region: AWS region (uses config if not provided)
             s3_bucket: S3 bucket name (uses config if not provided)
+            work_dir: Root of the persistent per-video scratch directories (uses config if not provided)
+            audio_cache: Cache of original audio streams (uses config if not provided;
+                disabled when AUDIO_CACHE_DIR is not set)
+            workers: Maximum number of videos processed concurrently (uses config if not provided)
+            scheduler: Backlog scheduling policy (uses config if not provided)
+            speech_chunks: Also upload 16 kHz mono chunks for transcription (uses config if not provided)
+            trim_silence: Cut silence out of the stored MP3 (uses config if not provided)
+            waveform_peaks: Upload a waveform peaks sidecar with each MP3 (uses config if not provided)
+            shard: Only process videos owned by this shard (None for all videos)
         """
         self.aws_access_key_id = aws_access_key_id or config.get_aws_access_key_id()
         self.aws_secret_access_key = aws_secret_access_key or config.get_aws_secret_access_key()
         self.aws_region = aws_region or config.AWS_REGION
         self.s3_bucket = s3_bucket or config.S3_BUCKET_NAME
+        self.work_root = Path(work_dir or config.WORK_DIR)
+        
+        if audio_cache is None and config.AUDIO_CACHE_DIR:
+            audio_cache = AudioCache(config.AUDIO_CACHE_DIR, config.AUDIO_CACHE_MAX_BYTES)
+        self.audio_cache = audio_cache
+        self.metrics = RunMetrics("youtube-audio")
+        self.workers = workers or config.DOWNLOAD_WORKERS
+        self.throttle = AdaptiveThrottle(self.workers)
+        self.scheduler = scheduler or VideoScheduler(config.SCHEDULER_POLICY)
+        self.speech_chunks = config.SPEECH_CHUNKS_ENABLED if speech_chunks is None else speech_chunks
+        self.trim_silence = config.TRIM_SILENCE_ENABLED if trim_silence is None else trim_silence
+        self.waveform_peaks = config.WAVEFORM_PEAKS_ENABLED if waveform_peaks is None else waveform_peaks
+        self.shard = shard
+        self.admission = AdmissionController(
+            self.work_root,
+            config.SCRATCH_DISK_BUDGET_BYTES,
+            config.SCRATCH_RAM_BUDGET_BYTES,
+            config.SCRATCH_MIN_FREE_BYTES
+        )
+        self._retries: Dict[str, int] = {}
+        self._failed_stage: Dict[str, Optional[str]] = {}
+        self.ledger = RunLedger("youtube-audio")
         
         self.s3_client = boto3.client(
             's3',
@@ -85,31 +150,59 @@ class YouTubeAudioDownloader:
                 return False
             raise
     
-    def _download_audio(self, video_id: str, output_path: Path) -> None:
-        """Download audio from YouTube video.
+    def _download_audio(self, video_id: str, work_dir: VideoWorkDir) -> Path:
+        """Download the original audio stream from a YouTube video.
+        
+        Partial downloads are left in the work directory as .part files and
+        resumed by yt-dlp on the next attempt.
         
         Args:
             video_id: YouTube video ID
-            output_path: Local path to save audio file
+            work_dir: Work directory to download into
+            
+        Returns:
+            Path to the downloaded source audio file
         """
         ydl_opts = {
             'format': 'bestaudio/best',
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': '192',
-            }],
-            'outtmpl': str(output_path.with_suffix('')),  # yt-dlp adds .mp3
+            'outtmpl': str(work_dir.path / 'source.%(ext)s'),
+            'continuedl': True,
+            'nopart': False,
             'quiet': False,
             'no_warnings': False,
-            'progress_hooks': [self._progress_hook],
+            'progress_hooks': [self._progress_hook, self.throttle.make_speed_watchdog()],
         }
         
         video_url = f"https://www.youtube.com/watch?v={video_id}"
         
         logger.info(f"Downloading audio from {video_url}")
+        import yt_dlp  # deferred: slow to import and only needed for actual downloads
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            ydl.download([video_url])
+            info = ydl.extract_info(video_url, download=True)
+            return Path(ydl.prepare_filename(info))
+    
+    def _transcode_to_mp3(self, source_path: Path, output_path: Path) -> None:
+        """Transcode a source audio file to MP3 with FFmpeg.
+        
+        Writes to a temporary file first so an interrupted transcode never
+        leaves a truncated output behind.
+        
+        Args:
+            source_path: Downloaded source audio file
+            output_path: Destination MP3 path
+        """
+        tmp_path = output_path.with_name(output_path.stem + '.tmp.mp3')
+        logger.info(f"Converting {source_path.name} to MP3")
+        subprocess.run(
+            [
+                'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
+                '-i', str(source_path),
+                '-vn', '-codec:a', 'libmp3lame', '-b:a', '192k',
+                str(tmp_path),
+            ],
+            check=True
+        )
+        os.replace(tmp_path, output_path)
     
     def _progress_hook(self, d):
         """Progress hook for yt-dlp."""
@@ -120,7 +213,7 @@ class YouTubeAudioDownloader:
             elif '_percent_str' in d:
                 print(f"\rDownloading: {d['_percent_str']}", end='', flush=True)
         elif d['status'] == 'finished':
-            print("\rDownload complete, converting to MP3...", flush=True)
+            print("\rDownload complete", flush=True)
     
     def _upload_to_s3(self, local_path: Path, s3_path: str) -> None:
         """Upload file to S3 with progress indication.
@@ -146,6 +239,104 @@ class YouTubeAudioDownloader:
         print()  # New line after upload completes
         logger.info(f"Successfully uploaded to S3")
     
+    def _generate_speech_prefix(self, s3_path: str) -> str:
+        """Generate the S3 prefix for a video's speech chunks.
+        
+        Args:
+            s3_path: S3 path of the MP3 (e.g., rabbi/series/2024-01-01-videoid.mp3)
+            
+        Returns:
+            Prefix next to the MP3 (e.g., rabbi/series/2024-01-01-videoid.speech)
+        """
+        return s3_path.rsplit('.', 1)[0] + '.speech'
+    
+    def _generate_trim_map_path(self, s3_path: str) -> str:
+        """Generate the S3 path of a video's silence-trim map.
+        
+        Args:
+            s3_path: S3 path of the MP3 (e.g., rabbi/series/2024-01-01-videoid.mp3)
+            
+        Returns:
+            Path next to the MP3 (e.g., rabbi/series/2024-01-01-videoid.trim.json)
+        """
+        return s3_path.rsplit('.', 1)[0] + '.trim.json'
+    
+    def _generate_peaks_path(self, s3_path: str) -> str:
+        """Generate the S3 path of a video's waveform peaks sidecar.
+        
+        Args:
+            s3_path: S3 path of the MP3 (e.g., rabbi/series/2024-01-01-videoid.mp3)
+            
+        Returns:
+            Path next to the MP3 (e.g., rabbi/series/2024-01-01-videoid.peaks)
+        """
+        return s3_path.rsplit('.', 1)[0] + '.peaks'
+    
+    def _upload_speech_chunks(
+        self,
+        video_id: str,
+        source_path: Path,
+        work_dir: VideoWorkDir,
+        s3_path: str,
+        trim_map_key: Optional[str] = None
+    ) -> int:
+        """Build 16 kHz mono speech chunks and upload them with a manifest.
+        
+        Chunks go to {prefix}/NNNN.wav and the manifest to {prefix}/manifest.json,
+        where prefix is the MP3 path with `.speech` instead of `.mp3`.
+        
+        Args:
+            video_id: YouTube video ID
+            source_path: Audio to derive the chunks from
+            work_dir: Work directory for intermediate files
+            s3_path: S3 path of the MP3
+            trim_map_key: S3 path of the trim map when the chunks are cut from
+                silence-trimmed audio (chunk times are then on the trimmed timeline)
+            
+        Returns:
+            Total bytes uploaded
+        """
+        prefix = self._generate_speech_prefix(s3_path)
+        speech_dir = work_dir.path / "speech"
+        from pipelines.audio.speech_chunks import build_speech_chunks
+        manifest = build_speech_chunks(
+            source_path,
+            speech_dir,
+            config.SPEECH_CHUNK_SECONDS,
+            config.SPEECH_CHUNK_OVERLAP_SECONDS
+        )
+        
+        def upload_chunk(chunk):
+            key = f"{prefix}/{chunk['file']}"
+            self.s3_client.upload_file(
+                str(speech_dir / "chunks" / chunk["file"]),
+                self.s3_bucket,
+                key,
+                ExtraArgs={'ContentType': 'audio/wav'}
+            )
+            return key
+        
+        logger.info(f"Uploading {len(manifest['chunks'])} speech chunks to s3://{self.s3_bucket}/{prefix}/")
+        with ThreadPoolExecutor(max_workers=8, thread_name_prefix="speech-upload") as pool:
+            keys = list(pool.map(upload_chunk, manifest["chunks"]))
+        for chunk, key in zip(manifest["chunks"], keys):
+            chunk["key"] = key
+        
+        manifest.update({
+            "video_id": video_id,
+            "audio_key": s3_path,
+            "timeline": "trimmed" if trim_map_key else "original",
+            "trim_map_key": trim_map_key,
+        })
+        body = json.dumps(manifest, indent=2).encode('utf-8')
+        self.s3_client.put_object(
+            Bucket=self.s3_bucket,
+            Key=f"{prefix}/manifest.json",
+            Body=body,
+            ContentType='application/json'
+        )
+        return sum(chunk["bytes"] for chunk in manifest["chunks"]) + len(body)
+    
     def process_video(self, video: YoutubeVideo, rabbi_slug: str, series_slug: str) -> bool:
         """Download audio and upload to S3 for a single video.
         
@@ -165,127 +356,457 @@ class YouTubeAudioDownloader:
         # Generate S3 path
         s3_path = self._generate_s3_path(rabbi_slug, series_slug, video.publish_date, video.video_id)
         
+        # A checkpointed upload means a previous run stopped before the sidecars
+        # (peaks, speech chunks) and the DB record; resume it instead
+        work_dir = VideoWorkDir(self.work_root, video.video_id)
+        if work_dir.is_done("upload"):
+            return self._run_stages(video.id, video.video_id, video.title, s3_path)
+
         # Double-check S3 in case DB is out of sync
         if self._check_s3_exists(s3_path):
             logger.warning(f"File exists in S3 but not in DB, updating DB record")
-            with get_db_session() as session:
-                db_video = session.query(YoutubeVideo).filter(YoutubeVideo.id == video.id).first()
-                if db_video:
-                    db_video.bucket = self.s3_bucket
-                    db_video.path = s3_path
+            self._record_upload(video.id, s3_path)
+            VideoWorkDir(self.work_root, video.video_id).cleanup()
             return False
         
-        # Download and upload
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir) / f"{video.video_id}.mp3"
+        # Download, transcode and upload, resuming from the last checkpoint
+        return self._run_stages(video.id, video.video_id, video.title, s3_path)
+    
+    def _run_stages(self, video_db_id: int, video_id: str, title: str, s3_path: str) -> bool:
+        """Run the download, transcode, upload and record stages for a video.
+        
+        Stages already checkpointed in the video's work directory are skipped.
+        
+        Args:
+            video_db_id: Database ID of the video
+            video_id: YouTube video ID
+            title: Video title (for logging)
+            s3_path: S3 destination path for the MP3
+            
+        Returns:
+            True once the audio is uploaded and recorded
+        """
+        work_dir = VideoWorkDir(self.work_root, video_id)
+        
+        try:
+            logger.info(
+                f"Processing video: {title} ({video_id}), "
+                f"starting at stage '{work_dir.first_incomplete_stage()}'"
+            )
+            
+            # Download audio (or take it from the cache)
+            if not work_dir.is_done("download"):
+                source_path = self._fetch_source(video_id, work_dir)
+                work_dir.mark_done("download", path=str(source_path), size=source_path.stat().st_size)
+            source_path = Path(work_dir.info("download")["path"])
             
+            # Convert to MP3
+            if not work_dir.is_done("transcode"):
+                if not source_path.exists():
+                    logger.warning(f"Source file {source_path} missing, downloading again")
+                    work_dir.invalidate("download")
+                    return self._run_stages(video_db_id, video_id, title, s3_path)
+                with self.metrics.stage(video_id, "transcode") as rec:
+                    if self.trim_silence:
+                        from pipelines.audio.vad import trim_silence
+                        trim_map = trim_silence(source_path, work_dir.output_path)
+                        work_dir.trim_map_path.write_text(json.dumps(trim_map), encoding='utf-8')
+                    else:
+                        self._transcode_to_mp3(source_path, work_dir.output_path)
+                    rec.bytes = source_path.stat().st_size
+                work_dir.mark_done(
+                    "transcode",
+                    size=work_dir.output_path.stat().st_size,
+                    trimmed=self.trim_silence
+                )
+            trimmed = work_dir.info("transcode").get("trimmed", False)
+            
+            # Upload to S3
+            if not work_dir.is_done("upload"):
+                if not work_dir.output_path.exists():
+                    logger.warning(f"Output file {work_dir.output_path} missing, converting again")
+                    work_dir.invalidate("transcode")
+                    return self._run_stages(video_db_id, video_id, title, s3_path)
+                trim_map_key = None
+                with self.metrics.stage(video_id, "upload") as rec:
+                    self._upload_to_s3(work_dir.output_path, s3_path)
+                    rec.bytes = work_dir.output_path.stat().st_size
+                    if trimmed:
+                        trim_map_key = self._generate_trim_map_path(s3_path)
+                        self.s3_client.upload_file(
+                            str(work_dir.trim_map_path),
+                            self.s3_bucket,
+                            trim_map_key,
+                            ExtraArgs={'ContentType': 'application/json'}
+                        )
+                        rec.bytes += work_dir.trim_map_path.stat().st_size
+                work_dir.mark_done("upload", bucket=self.s3_bucket, key=s3_path, trim_map_key=trim_map_key)
+            trim_map_key = work_dir.info("upload").get("trim_map_key")
+            
+            # Waveform peaks of the stored MP3 for players and previews
+            if not work_dir.is_done("peaks"):
+                if self.waveform_peaks:
+                    peaks_key = self._generate_peaks_path(s3_path)
+                    with self.metrics.stage(video_id, "peaks") as rec:
+                        from pipelines.audio.peaks import build_peaks
+                        body = build_peaks(work_dir.output_path)
+                        self.s3_client.put_object(
+                            Bucket=self.s3_bucket,
+                            Key=peaks_key,
+                            Body=body,
+                            ContentType='application/octet-stream'
+                        )
+                        rec.bytes = len(body)
+                    work_dir.mark_done("peaks", key=peaks_key, size=len(body))
+                else:
+                    work_dir.mark_done("peaks", skipped=True)
+            peaks_key = work_dir.info("peaks").get("key")
+            
+            # Speech chunks for transcription. Trimmed audio is chunked from the
+            # stored MP3 so chunk times match it; otherwise from the source if still available.
+            if not work_dir.is_done("speech"):
+                if self.speech_chunks:
+                    if trimmed or not source_path.exists():
+                        speech_source = work_dir.output_path
+                    else:
+                        speech_source = source_path
+                    with self.metrics.stage(video_id, "speech") as rec:
+                        rec.bytes = self._upload_speech_chunks(
+                            video_id, speech_source, work_dir, s3_path, trim_map_key
+                        )
+                    work_dir.mark_done("speech", prefix=self._generate_speech_prefix(s3_path))
+                else:
+                    work_dir.mark_done("speech", skipped=True)
+            
+            # Update database
+            self._record_upload(video_db_id, s3_path, trim_map_path=trim_map_key, peaks_path=peaks_key)
+            work_dir.mark_done("record")
+            
+            # Everything is durable in S3 and the DB, drop the local bytes
+            work_dir.cleanup()
+            return True
+            
+        except Exception as e:
+            self._failed_stage[video_id] = work_dir.first_incomplete_stage()
+            logger.error(
+                f"Error processing video {video_id}: {e} "
+                f"(work kept in {work_dir.path} for the next run)"
+            )
+            raise
+    
+    def _fetch_source(self, video_id: str, work_dir: VideoWorkDir) -> Path:
+        """Get the original audio stream, reading from the cache first.
+        
+        Args:
+            video_id: YouTube video ID
+            work_dir: Work directory to download into on a cache miss
+            
+        Returns:
+            Path to the source audio file
+        """
+        if self.audio_cache:
+            started = time.perf_counter()
+            cached_path = self.audio_cache.get(video_id)
+            if cached_path:
+                # Recorded on hits only: a miss is followed by a "download" record
+                self.metrics.add(video_id, "cache", time.perf_counter() - started, cached_path.stat().st_size)
+                return cached_path
+        
+        with self.metrics.stage(video_id, "download") as rec:
+            rec.retries = self._retries.get(video_id, 0)
+            source_path = self._download_audio(video_id, work_dir)
+            # Bytes already on disk from an earlier partial attempt are included
+            rec.bytes = source_path.stat().st_size
+        
+        if self.audio_cache:
             try:
-                # Download audio
-                logger.info(f"Processing video: {video.title} ({video.video_id})")
-                self._download_audio(video.video_id, temp_path)
-                
-                # Upload to S3
-                self._upload_to_s3(temp_path, s3_path)
-                
-                # Update database
-                with get_db_session() as session:
-                    db_video = session.query(YoutubeVideo).filter(YoutubeVideo.id == video.id).first()
-                    if db_video:
-                        db_video.bucket = self.s3_bucket
-                        db_video.path = s3_path
-                        logger.info(f"Updated database record for video {video.video_id}")
-                
-                return True
-                
-            except Exception as e:
-                logger.error(f"Error processing video {video.video_id}: {e}")
-                raise
+                self.audio_cache.put(video_id, source_path)
+            except OSError as e:
+                logger.warning(f"Failed to cache source audio for video {video_id}: {e}")
+        
+        return source_path
     
-    def process_all_videos(self, limit: Optional[int] = None) -> dict:
-        """Process all unprocessed videos across all series.
+    def reprocess_video(self, video_id: str) -> bool:
+        """Transcode and upload a video's audio again, overwriting the S3 object.
+        
+        Uses the cached source audio when available, so recovering from a bad
+        upload or changing the output format does not hit YouTube.
         
         Args:
-            limit: Maximum number of videos to process (None for all)
+            video_id: YouTube video ID
             
         Returns:
-            Dictionary with processing statistics
+            True if reprocessed successfully
         """
-        logger.info("Starting audio download for all unprocessed videos")
+        with get_db_session() as session:
+            row = session.query(YoutubeVideo, Series, Rabbi).join(
+                Series, YoutubeVideo.series_id == Series.id
+            ).join(
+                Rabbi, Series.rabbi_id == Rabbi.id
+            ).filter(
+                YoutubeVideo.video_id == video_id
+            ).first()
+            
+            if not row:
+                raise ValueError(f"Video {video_id} not found in database")
+            
+            video, series, rabbi = row
+            video_db_id: int = video.id  # type: ignore
+            title: str = video.title  # type: ignore
+            s3_path = self._generate_s3_path(rabbi.slug, series.slug, video.publish_date, video_id)  # type: ignore
+        
+        # Start from a clean slate; only the source stream is reused (via the cache)
+        VideoWorkDir(self.work_root, video_id).cleanup()
+        return self._run_stages(video_db_id, video_id, title, s3_path)
+    
+    def _record_upload(self, video_db_id: int, s3_path: str, **fields) -> None:
+        """Store the S3 location of a video's audio in the database.
+        
+        Args:
+            video_db_id: Database ID of the video
+            s3_path: S3 path of the uploaded audio
+            **fields: Additional YoutubeVideo columns to set (e.g. trim_map_path)
+        """
+        with get_db_session() as session:
+            db_video = session.query(YoutubeVideo).filter(YoutubeVideo.id == video_db_id).first()
+            if db_video:
+                db_video.bucket = self.s3_bucket
+                db_video.path = s3_path
+                for name, value in fields.items():
+                    setattr(db_video, name, value)
+                logger.info(f"Updated database record for video {db_video.video_id}")
+    
+    def begin_run(self, metrics: Optional[RunMetrics] = None) -> None:
+        """Reset per-run state and open a run record in `self.ledger`.
+        
+        Args:
+            metrics: Collector for this run's stage metrics (a new one if not provided)
+        """
+        self.metrics = metrics or RunMetrics("youtube-audio")
+        self._retries = {}
+        self._failed_stage = {}
+        self.ledger.start()
+    
+    def process_item(self, item: VideoWorkItem) -> bool:
+        """Process one queued video with a fresh DB session.
+        
+        Call `record_item_success` or `record_item_failure` with the outcome.
+        
+        Args:
+            item: Video to process
+            
+        Returns:
+            True if processed, False if skipped
+        """
+        # Open fresh connection for each video to avoid Neon timeout
+        with get_db_session() as session:
+            video = session.query(YoutubeVideo).filter(YoutubeVideo.id == item.db_id).first()
+            if not video:
+                raise ValueError(f"Video {item.video_id} not found in database")
+            
+            return self.process_video(video, item.rabbi_slug, item.series_slug)
+    
+    def record_item_success(self, item: VideoWorkItem, processed: bool) -> None:
+        """Record a video that went through `process_item` without an error.
+        
+        Args:
+            item: The video
+            processed: Result of `process_item` (False if it was skipped)
+        """
+        self.throttle.record_success()
+        self.ledger.record_success(item.video_id, "succeeded" if processed else "skipped")
+    
+    def record_item_failure(self, item: VideoWorkItem, error: Exception) -> bool:
+        """Record a video whose `process_item` raised.
+        
+        Throttling errors are reported to the throttle and allowed up to
+        MAX_REQUEUES retries; any other error, or one retry too many, is
+        recorded in `self.ledger` with the stage that failed.
         
+        Args:
+            item: The video
+            error: The exception raised
+            
+        Returns:
+            True if the video should be retried once the throttle allows it
+        """
+        attempts = self._retries.get(item.video_id, 0)
+        if is_throttle_error(error) and attempts < self.MAX_REQUEUES:
+            self.throttle.record_throttle(error)
+            self._retries[item.video_id] = attempts + 1
+            return True
+        self.ledger.record_failure(item.video_id, self._failed_stage.get(item.video_id), error)
+        return False
+    
+    def load_backlog(self, limit: Optional[int] = None) -> List[VideoWorkItem]:
+        """Load the unprocessed videos this node may work on, in scheduling order.
+        
+        Skips videos that are cooling down or quarantined in `self.ledger`
+        and, when sharding, videos owned by other shards.
+        
+        Args:
+            limit: Maximum number of videos to return (None for all)
+            
+        Returns:
+            Ordered list of work items
+        """
         # Get all unprocessed videos with their series information
         with get_db_session() as session:
             query = session.query(
-                YoutubeVideo, 
-                Series, 
-                Rabbi
+                YoutubeVideo.id,
+                YoutubeVideo.video_id,
+                YoutubeVideo.title,
+                YoutubeVideo.publish_date,
+                YoutubeVideo.duration,
+                Series.slug,
+                Rabbi.slug
             ).join(
                 Series, YoutubeVideo.series_id == Series.id
             ).join(
                 Rabbi, Series.rabbi_id == Rabbi.id
             ).filter(
                 YoutubeVideo.bucket.is_(None),
-                YoutubeVideo.path.is_(None)
+                YoutubeVideo.path.is_(None),
+                self.ledger.eligible(YoutubeVideo.video_id)
             ).order_by(
                 Rabbi.slug, 
                 Series.slug, 
                 YoutubeVideo.publish_date
             )
             
-            if limit:
-                query = query.limit(limit)
+            if self.shard:
+                query = query.filter(self.shard.condition(YoutubeVideo.video_id))
             
-            results = query.all()
+            # Other policies need the whole backlog to pick the top `limit` videos
+            if limit and self.scheduler.policy == "catalog":
+                query = query.limit(limit)
             
             # Detach from session to use in processing
-            video_data = [
-                (
-                    v.id, 
-                    v.video_id, 
-                    v.title, 
-                    v.publish_date,
-                    s.slug,  # series_slug
-                    r.slug   # rabbi_slug
-                ) 
-                for v, s, r in results
-            ]
-        
-        total = len(video_data)
-        logger.info(f"Found {total} unprocessed videos across all series")
-        
-        if total == 0:
-            return {"total": 0, "processed": 0, "skipped": 0, "failed": 0}
+            video_data = [VideoWorkItem(*row) for row in query.all()]
+        
+        video_data = self.scheduler.order(video_data)
+        if limit:
+            video_data = video_data[:limit]
+        return video_data
+    
+    def process_all_videos(self, limit: Optional[int] = None, metrics_dir: Optional[Path] = None) -> dict:
+        """Process all unprocessed videos across all series.
+        
+        The backlog is ordered by `self.scheduler`, which also decides which
+        queued video each free worker picks up next.
+        
+        Videos are processed by up to `self.workers` threads, and only once
+        `self.admission` has reserved their estimated scratch disk and RAM. The adaptive
+        throttle lowers concurrency and pauses new extractions when YouTube
+        throttles; affected videos are requeued up to MAX_REQUEUES times.
+        
+        Per-stage metrics are collected in `self.metrics` and, if `metrics_dir`
+        is given, written there as JSON lines and a Prometheus textfile.
+        
+        The run and every attempt are recorded in `self.ledger`; videos whose
+        earlier failures are still cooling down, or that are quarantined, are
+        not selected.
+        
+        Args:
+            limit: Maximum number of videos to process (None for all)
+            metrics_dir: Directory for metrics files (None to skip writing)
+            
+        Returns:
+            Dictionary with processing statistics
+        """
+        logger.info("Starting audio download for all unprocessed videos")
+        self.begin_run()
         
         processed = 0
         skipped = 0
         failed = 0
+        too_large = 0
+        requeued = 0
+        started = 0
+        total = 0
+        
+        def current_stats() -> dict:
+            return {
+                "total": total,
+                "processed": processed,
+                "skipped": skipped,
+                "failed": failed,
+                "too_large": too_large,
+                "requeued": requeued
+            }
         
-        for idx, (vid_id, video_id, title, publish_date, series_slug, rabbi_slug) in enumerate(video_data, 1):
-            logger.info(f"\n[{idx}/{total}] Processing video {video_id} ({rabbi_slug}/{series_slug})")
+        try:
+            video_data = self.load_backlog(limit)
             
-            try:
-                # Open fresh connection for each video to avoid Neon timeout
-                with get_db_session() as session:
-                    video = session.query(YoutubeVideo).filter(YoutubeVideo.id == vid_id).first()
-                    if not video:
-                        logger.error(f"Video {video_id} not found in database")
-                        failed += 1
+            total = len(video_data)
+            logger.info(
+                f"Found {total} unprocessed videos across all series"
+                + (f" for {self.shard}" if self.shard else "")
+            )
+            
+            queue = deque(video_data)
+            running: Dict = {}
+            
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="audio") as pool:
+                while queue or running:
+                    # Start as many videos as the throttle and the scratch budget allow
+                    while queue and self.throttle.can_start(len(running)):
+                        item = self.scheduler.next_item(queue, running.values(), self.throttle.limit)
+                        disk, ram = self.admission.estimate(item.duration, self.speech_chunks)
+                        if not self.admission.try_reserve(item.video_id, disk, ram):
+                            if not running:
+                                # Not attempted, so neither a failure nor a ledger attempt
+                                logger.error(
+                                    f"Not enough scratch space for video {item.video_id} "
+                                    f"(needs ~{disk / 1024**3:.1f} GB), skipping it this run"
+                                )
+                                queue.remove(item)
+                                too_large += 1
+                                continue
+                            logger.debug(f"Scratch budget full, waiting before starting {item.video_id}")
+                            break
+                        queue.remove(item)
+                        started += 1
+                        logger.info(
+                            f"\n[{started}/{total + requeued}] Processing video {item.video_id} "
+                            f"({item.rabbi_slug}/{item.series_slug})"
+                        )
+                        running[pool.submit(self.process_item, item)] = item
+                    
+                    if not running:
+                        # Backing off with nothing in flight
+                        time.sleep(min(self.throttle.paused_for, 5.0) or 0.1)
                         continue
                     
-                    result = self.process_video(video, rabbi_slug, series_slug)
-                    if result:
-                        processed += 1
-                    else:
-                        skipped += 1
-            except Exception as e:
-                logger.error(f"Failed to process video {video_id}: {e}")
-                failed += 1
-        
-        stats = {
-            "total": total,
-            "processed": processed,
-            "skipped": skipped,
-            "failed": failed
-        }
+                    done, _ = wait(list(running), timeout=5.0, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        item = running.pop(future)
+                        self.admission.release(item.video_id)
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            if self.record_item_failure(item, e):
+                                queue.append(item)
+                                requeued += 1
+                                logger.info(f"Requeued video {item.video_id} (attempt {self._retries[item.video_id] + 1})")
+                            else:
+                                logger.error(f"Failed to process video {item.video_id}: {e}")
+                                failed += 1
+                            continue
+                        
+                        self.record_item_success(item, result)
+                        if result:
+                            processed += 1
+                        else:
+                            skipped += 1
+        except BaseException:
+            # Close the run record instead of leaving it "running" forever
+            self.ledger.abort(current_stats())
+            raise
         
+        stats = current_stats()
         logger.info(f"\nProcessing complete: {stats}")
+        self.ledger.finish(stats)
+        if metrics_dir:
+            self.metrics.write(metrics_dir)
         return stats
@@ -2,7 +2,7 @@
 
 import logging
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Iterator
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from isodate import parse_duration
@@ -121,11 +121,21 @@ class YouTubeVideoFetcher:
         Returns:
             List of video metadata dictionaries
         """
-        videos = []
+        return [video for batch in self._iter_video_details(video_ids) for video in batch]
+    
+    def _iter_video_details(self, video_ids: List[str]) -> Iterator[List[Dict[str, Any]]]:
+        """Get detailed information for videos, one API batch at a time.
         
+        Args:
+            video_ids: List of YouTube video IDs
+            
+        Yields:
+            Lists of video metadata dictionaries (up to 50 per batch)
+        """
         # YouTube API allows max 50 IDs per request
         for i in range(0, len(video_ids), 50):
             batch_ids = video_ids[i:i+50]
+            videos = []
             
             try:
                 request = self.youtube.videos().list(
@@ -162,8 +172,8 @@ class YouTubeVideoFetcher:
             except HttpError as e:
                 logger.error(f"YouTube API error fetching video details: {e}")
                 raise
-        
-        return videos
+            
+            yield videos
     
     def _filter_existing_videos(self, video_ids: List[str]) -> List[str]:
         """Filter out video IDs that already exist in the database.
@@ -186,12 +196,91 @@ class YouTubeVideoFetcher:
             logger.info(f"Filtered: {len(video_ids)} total, {len(existing_video_ids)} existing, {len(new_video_ids)} new")
             return new_video_ids
     
-    def fetch_butbul_halacha_yomit(self, series_id: int, max_duration_minutes: float = 10.0) -> int:
+    def _store_videos(
+        self,
+        series_id: int,
+        video_ids: List[str],
+        max_duration_minutes: Optional[float] = None,
+        on_inserted: Optional[Callable[[int, Dict[str, Any]], None]] = None
+    ) -> int:
+        """Fetch details for new videos and insert them, committing per API batch.
+        
+        Each batch of up to 50 videos is committed as soon as its details
+        arrive, so downstream stages (the NOTIFY-driven daemon, `pipeline run`)
+        can start on the first videos while later batches are still being fetched.
+        
+        Args:
+            series_id: Database ID of the series the videos belong to
+            video_ids: IDs of videos not yet in the database
+            max_duration_minutes: Skip videos longer than this (None for no limit)
+            on_inserted: Called with (database ID, video metadata) after each batch commits
+            
+        Returns:
+            Number of new videos added to database
+        """
+        # Verify series exists
+        with get_db_session() as session:
+            series = session.query(Series).filter(Series.id == series_id).first()
+            if not series:
+                raise ValueError(f"Series with id {series_id} not found")
+        
+        added_count = 0
+        skipped_duration_count = 0
+        
+        for video_details in self._iter_video_details(video_ids):
+            inserted = []
+            with get_db_session() as session:
+                for video in video_details:
+                    if max_duration_minutes is not None and video["duration_minutes"] > max_duration_minutes:
+                        logger.debug(
+                            f"Skipping video {video['video_id']} - duration {video['duration_minutes']:.1f} min exceeds {max_duration_minutes} min"
+                        )
+                        skipped_duration_count += 1
+                        continue
+                    
+                    new_video = YoutubeVideo(
+                        video_id=video["video_id"],
+                        series_id=series_id,
+                        title=video["title"],
+                        description=video["description"],
+                        publish_date=video["publish_date"],
+                        url=video["url"],
+                        duration=video["duration"]
+                    )
+                    session.add(new_video)
+                    inserted.append((new_video, video))
+                    logger.info(
+                        f"Added video: {video['video_id']} - {video['title']} ({video['duration_minutes']:.1f} min)"
+                    )
+                session.flush()
+                inserted = [(int(new_video.id), video) for new_video, video in inserted]  # type: ignore
+            
+            added_count += len(inserted)
+            if on_inserted:
+                for db_id, video in inserted:
+                    on_inserted(db_id, video)
+        
+        if max_duration_minutes is not None:
+            logger.info(
+                f"Processing complete: {added_count} videos added, "
+                f"{skipped_duration_count} skipped (too long)"
+            )
+        else:
+            logger.info(f"Processing complete: {added_count} videos added")
+        return added_count
+    
+    def fetch_butbul_halacha_yomit(
+        self,
+        series_id: int,
+        max_duration_minutes: float = 10.0,
+        on_inserted: Optional[Callable[[int, Dict[str, Any]], None]] = None
+    ) -> int:
         """Fetch videos for Butbul Halacha Yomit series.
         
         Args:
             series_id: Database ID for the Butbul Halacha Yomit series
             max_duration_minutes: Maximum video duration in minutes (default: 10)
+            on_inserted: Called with (database ID, video metadata) for each added video
             
         Returns:
             Number of new videos added to database
@@ -227,53 +316,19 @@ class YouTubeVideoFetcher:
             logger.info("No new videos to add")
             return 0
         
-        # Get detailed information for new videos
-        video_details = self._get_video_details(new_video_ids)
-        
-        # Filter by duration and save to database
-        added_count = 0
-        skipped_duration_count = 0
-        
-        with get_db_session() as session:
-            # Verify series exists
-            series = session.query(Series).filter(Series.id == series_id).first()
-            if not series:
-                raise ValueError(f"Series with id {series_id} not found")
-            
-            for video in video_details:
-                if video["duration_minutes"] > max_duration_minutes:
-                    logger.debug(
-                        f"Skipping video {video['video_id']} - duration {video['duration_minutes']:.1f} min exceeds {max_duration_minutes} min"
-                    )
-                    skipped_duration_count += 1
-                    continue
-                
-                new_video = YoutubeVideo(
-                    video_id=video["video_id"],
-                    series_id=series_id,
-                    title=video["title"],
-                    description=video["description"],
-                    publish_date=video["publish_date"],
-                    url=video["url"],
-                    duration=video["duration"]
-                )
-                session.add(new_video)
-                added_count += 1
-                logger.info(
-                    f"Added video: {video['video_id']} - {video['title']} ({video['duration_minutes']:.1f} min)"
-                )
-        
-        logger.info(
-            f"Processing complete: {added_count} videos added, "
-            f"{skipped_duration_count} skipped (too long)"
-        )
-        return added_count
+        # Fetch details, filter by duration and save to database
+        return self._store_videos(series_id, new_video_ids, max_duration_minutes, on_inserted)
     
-    def fetch_halichot_olam(self, series_id: int) -> int:
+    def fetch_halichot_olam(
+        self,
+        series_id: int,
+        on_inserted: Optional[Callable[[int, Dict[str, Any]], None]] = None
+    ) -> int:
         """Fetch videos for Halichot Olam series.
         
         Args:
             series_id: Database ID for the Halichot Olam series
+            on_inserted: Called with (database ID, video metadata) for each added video
             
         Returns:
             Number of new videos added to database
@@ -292,42 +347,19 @@ class YouTubeVideoFetcher:
             logger.info("No new videos to add")
             return 0
         
-        # Get detailed information for new videos
-        video_details = self._get_video_details(new_video_ids)
-        
-        # Save to database (no duration filter for Halichot Olam)
-        added_count = 0
-        
-        with get_db_session() as session:
-            # Verify series exists
-            series = session.query(Series).filter(Series.id == series_id).first()
-            if not series:
-                raise ValueError(f"Series with id {series_id} not found")
-            
-            for video in video_details:
-                new_video = YoutubeVideo(
-                    video_id=video["video_id"],
-                    series_id=series_id,
-                    title=video["title"],
-                    description=video["description"],
-                    publish_date=video["publish_date"],
-                    url=video["url"],
-                    duration=video["duration"]
-                )
-                session.add(new_video)
-                added_count += 1
-                logger.info(
-                    f"Added video: {video['video_id']} - {video['title']} ({video['duration_minutes']:.1f} min)"
-                )
-        
-        logger.info(f"Processing complete: {added_count} videos added")
-        return added_count
+        # Fetch details and save to database (no duration filter for Halichot Olam)
+        return self._store_videos(series_id, new_video_ids, on_inserted=on_inserted)
     
-    def fetch_rabinovitch_sample(self, series_id: int) -> int:
+    def fetch_rabinovitch_sample(
+        self,
+        series_id: int,
+        on_inserted: Optional[Callable[[int, Dict[str, Any]], None]] = None
+    ) -> int:
         """Fetch videos for Rabbi Rabinovitch Sample Lessons series.
         
         Args:
             series_id: Database ID for the Rabinovitch Sample series
+            on_inserted: Called with (database ID, video metadata) for each added video
             
         Returns:
             Number of new videos added to database
@@ -346,33 +378,5 @@ class YouTubeVideoFetcher:
             logger.info("No new videos to add")
             return 0
         
-        # Get detailed information for new videos
-        video_details = self._get_video_details(new_video_ids)
-        
-        # Save to database (no duration filter)
-        added_count = 0
-        
-        with get_db_session() as session:
-            # Verify series exists
-            series = session.query(Series).filter(Series.id == series_id).first()
-            if not series:
-                raise ValueError(f"Series with id {series_id} not found")
-            
-            for video in video_details:
-                new_video = YoutubeVideo(
-                    video_id=video["video_id"],
-                    series_id=series_id,
-                    title=video["title"],
-                    description=video["description"],
-                    publish_date=video["publish_date"],
-                    url=video["url"],
-                    duration=video["duration"]
-                )
-                session.add(new_video)
-                added_count += 1
-                logger.info(
-                    f"Added video: {video['video_id']} - {video['title']} ({video['duration_minutes']:.1f} min)"
-                )
-        
-        logger.info(f"Processing complete: {added_count} videos added")
-        return added_count
+        # Fetch details and save to database (no duration filter)
+        return self._store_videos(series_id, new_video_ids, on_inserted=on_inserted)
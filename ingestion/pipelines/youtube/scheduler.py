@@ -0,0 +1,142 @@
+"""Priority scheduling policies for the audio download backlog."""
+
+import logging
+from collections import OrderedDict
+from typing import Optional, Dict, List, Iterable, Sequence, Any
+
+logger = logging.getLogger(__name__)
+
+
+class VideoScheduler:
+    """Orders the backlog and picks the next video for a free worker.
+
+    Policies:
+        catalog      - rabbi, series, publish date (the original ordering)
+        newest       - most recently published first
+        shortest     - shortest stored duration first, newest breaking ties
+        weighted     - highest series weight first, newest breaking ties
+        round-robin  - interleave series (newest first within each series);
+                       a series with weight N gets N turns per round
+
+    Independently of the policy, long videos are limited to a share of the
+    worker capacity so that a few multi-hour lessons never occupy every
+    worker while short clips are waiting.
+    """
+
+    POLICIES = ("catalog", "newest", "shortest", "weighted", "round-robin")
+
+    def __init__(
+        self,
+        policy: str = "catalog",
+        series_weights: Optional[Dict[str, int]] = None,
+        long_video_seconds: int = 3600,
+        max_long_share: float = 0.5
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            policy: One of POLICIES
+            series_weights: Priority weight per series slug (default weight is 1)
+            long_video_seconds: Duration from which a video counts as long
+            max_long_share: Fraction of workers that may run long videos at once
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown scheduling policy '{policy}', expected one of {', '.join(self.POLICIES)}")
+        self.policy = policy
+        self.series_weights = series_weights or {}
+        self.long_video_seconds = long_video_seconds
+        self.max_long_share = max_long_share
+
+    def _weight(self, item: Any) -> int:
+        """Get the priority weight of an item's series."""
+        return self.series_weights.get(item.series_slug, 1)
+
+    def is_long(self, item: Any) -> bool:
+        """Check whether an item counts as a long video."""
+        return (item.duration or 0) >= self.long_video_seconds
+
+    def order(self, items: Iterable[Any]) -> List[Any]:
+        """Order work items according to the policy.
+
+        Args:
+            items: Work items with video_id, publish_date, duration, series_slug and rabbi_slug
+
+        Returns:
+            Ordered list of work items
+        """
+        items = list(items)
+
+        if self.policy == "catalog":
+            return sorted(items, key=lambda i: (i.rabbi_slug, i.series_slug, i.publish_date))
+        if self.policy == "newest":
+            return sorted(items, key=lambda i: i.publish_date, reverse=True)
+        if self.policy == "shortest":
+            return sorted(items, key=lambda i: (i.duration or 0, -i.publish_date.toordinal()))
+        if self.policy == "weighted":
+            return sorted(items, key=lambda i: (-self._weight(i), -i.publish_date.toordinal()))
+
+        # Weighted round-robin across series
+        by_series: "OrderedDict[str, List[Any]]" = OrderedDict()
+        for item in sorted(items, key=lambda i: i.publish_date, reverse=True):
+            by_series.setdefault(item.series_slug, []).append(item)
+
+        ordered = []
+        queues = {slug: list(reversed(series_items)) for slug, series_items in by_series.items()}
+        while queues:
+            for slug in list(queues):
+                for _ in range(max(1, self.series_weights.get(slug, 1))):
+                    if not queues[slug]:
+                        break
+                    ordered.append(queues[slug].pop())
+                if not queues[slug]:
+                    del queues[slug]
+        return ordered
+
+    def next_item(self, queue: Sequence[Any], running: Iterable[Any], capacity: int) -> Optional[Any]:
+        """Pick the next item to start on a free worker.
+
+        Takes the first queued item, except that a long video is passed over
+        while the long-video share of `capacity` is in use and a short
+        video is waiting.
+
+        Args:
+            queue: Ordered pending items
+            running: Items currently being processed
+            capacity: Number of workers currently allowed to run
+
+        Returns:
+            Item to start, or None if the queue is empty
+        """
+        if not queue:
+            return None
+
+        long_slots = max(1, int(capacity * self.max_long_share))
+        long_running = sum(1 for item in running if self.is_long(item))
+
+        if long_running < long_slots:
+            return queue[0]
+
+        for item in queue:
+            if not self.is_long(item):
+                return item
+
+        # Only long videos are left; keep workers busy
+        return queue[0]
+
+
+def parse_series_weights(values: Iterable[str]) -> Dict[str, int]:
+    """Parse `slug=weight` strings into a weight mapping.
+
+    Args:
+        values: Strings such as "daily-halacha=5"
+
+    Returns:
+        Mapping of series slug to weight
+    """
+    weights = {}
+    for value in values:
+        slug, sep, weight = value.partition("=")
+        if not sep or not slug or not weight.strip().isdigit():
+            raise ValueError(f"Invalid series weight '{value}', expected <series-slug>=<weight>")
+        weights[slug.strip()] = int(weight)
+    return weights
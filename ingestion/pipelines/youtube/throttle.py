@@ -0,0 +1,170 @@
+"""Adaptive throttling and backoff for yt-dlp extraction."""
+
+import logging
+import random
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ThrottledError(Exception):
+    """Raised when YouTube throttles a download (e.g. sustained slow speed)."""
+
+
+# Substrings of yt-dlp error messages that indicate throttling or bot checks
+THROTTLE_SIGNALS = (
+    "http error 429",
+    "too many requests",
+    "sign in to confirm",
+    "confirm you're not a bot",
+    "confirm you’re not a bot",
+    "rate-limited",
+    "rate limited",
+    "http error 403",
+)
+
+
+def is_throttle_error(error: BaseException) -> bool:
+    """Check whether an exception (or anything it wraps) is a throttling signal.
+
+    Args:
+        error: Exception raised while processing a video
+
+    Returns:
+        True if the error indicates YouTube throttling
+    """
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, ThrottledError):
+            return True
+        message = str(current).lower()
+        if any(signal in message for signal in THROTTLE_SIGNALS):
+            return True
+        # yt-dlp's DownloadError keeps the original exception in exc_info
+        exc_info = getattr(current, "exc_info", None)
+        wrapped = exc_info[1] if isinstance(exc_info, tuple) and len(exc_info) > 1 else None
+        current = wrapped or current.__cause__ or current.__context__
+    return False
+
+
+class AdaptiveThrottle:
+    """AIMD concurrency controller with a global, jittered backoff.
+
+    Every throttling signal halves the allowed concurrency and pauses new
+    extractions for an exponentially growing, jittered interval. A run of
+    successes without new signals raises concurrency by one again, up to
+    the configured maximum.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+        base_backoff: float = 30.0,
+        max_backoff: float = 900.0,
+        min_speed: float = 50 * 1024,
+        slow_grace: float = 60.0
+    ):
+        """Initialize the controller.
+
+        Args:
+            max_concurrency: Upper bound on concurrent extractions
+            min_concurrency: Lower bound on concurrent extractions
+            base_backoff: Pause after the first throttling signal, in seconds
+            max_backoff: Longest pause, in seconds
+            min_speed: Download speed (bytes/s) below which a download counts as throttled
+            slow_grace: How long a download may stay below `min_speed` before it is aborted
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.min_speed = min_speed
+        self.slow_grace = slow_grace
+
+        self.limit = self.max_concurrency
+        self._strikes = 0
+        self._successes = 0
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def paused_for(self) -> float:
+        """Seconds remaining in the current backoff (0 if not paused)."""
+        return max(0.0, self._paused_until - time.monotonic())
+
+    def can_start(self, running: int) -> bool:
+        """Check whether a new extraction may start.
+
+        Args:
+            running: Number of extractions currently in flight
+
+        Returns:
+            True if not backing off and below the current concurrency limit
+        """
+        return self.paused_for == 0 and running < self.limit
+
+    def record_success(self) -> None:
+        """Record a completed video; raises concurrency after a clean streak."""
+        with self._lock:
+            self._successes += 1
+            if self._successes >= self.limit * 2:
+                self._successes = 0
+                self._strikes = max(0, self._strikes - 1)
+                if self.limit < self.max_concurrency:
+                    self.limit += 1
+                    logger.info(f"No recent throttling, raising concurrency to {self.limit}")
+
+    def record_throttle(self, error: BaseException) -> float:
+        """Record a throttling signal; lowers concurrency and starts a backoff.
+
+        Args:
+            error: The throttling error
+
+        Returns:
+            Length of the backoff in seconds
+        """
+        with self._lock:
+            self._successes = 0
+            self.limit = max(self.min_concurrency, self.limit // 2)
+            backoff = min(self.max_backoff, self.base_backoff * (2 ** self._strikes))
+            backoff *= random.uniform(0.5, 1.5)
+            self._strikes += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + backoff)
+
+        logger.warning(
+            f"Throttled by YouTube ({error}); concurrency now {self.limit}, "
+            f"backing off {backoff:.0f}s"
+        )
+        return backoff
+
+    def make_speed_watchdog(self):
+        """Create a yt-dlp progress hook that aborts persistently slow downloads.
+
+        Returns:
+            Progress hook raising ThrottledError once the download speed has
+            stayed below `min_speed` for longer than `slow_grace` seconds
+        """
+        state = {"slow_since": None}
+
+        def hook(d):
+            if d.get("status") != "downloading":
+                return
+            speed = d.get("speed")
+            if speed is None or speed >= self.min_speed:
+                state["slow_since"] = None
+                return
+            now = time.monotonic()
+            if state["slow_since"] is None:
+                state["slow_since"] = now
+            elif now - state["slow_since"] > self.slow_grace:
+                raise ThrottledError(
+                    f"download speed {speed / 1024:.0f} KB/s below "
+                    f"{self.min_speed / 1024:.0f} KB/s for {self.slow_grace:.0f}s"
+                )
+
+        return hook
@@ -0,0 +1,140 @@
+"""Persistent per-video scratch directories with stage checkpoints."""
+
+import json
+import logging
+import os
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+
+class VideoWorkDir:
+    """Persistent scratch directory for a single video, keyed by video ID.
+
+    Survives process restarts so that partial downloads can be resumed and
+    finished files can be uploaded again without re-downloading.
+
+    Layout:
+        {root}/{video_id}/
+            source.<ext>[.part]   original audio stream fetched by yt-dlp
+            audio.mp3             transcoded output uploaded to S3
+            trim.json             silence-trim map (when silence trimming is enabled)
+            speech/               16 kHz mono chunks for transcription
+            checkpoint.json       completed stages and their metadata
+    """
+
+    # Stages in execution order
+    STAGES = ("download", "transcode", "upload", "peaks", "speech", "record")
+
+    CHECKPOINT_FILE = "checkpoint.json"
+    OUTPUT_FILE = "audio.mp3"
+    TRIM_MAP_FILE = "trim.json"
+
+    def __init__(self, root: Path, video_id: str):
+        """Open (and create if needed) the work directory for a video.
+
+        Args:
+            root: Root directory holding all per-video work directories
+            video_id: YouTube video ID
+        """
+        self.video_id = video_id
+        self.path = Path(root) / video_id
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._checkpoint = self._load_checkpoint()
+
+    @property
+    def checkpoint_path(self) -> Path:
+        """Path of the checkpoint file."""
+        return self.path / self.CHECKPOINT_FILE
+
+    @property
+    def output_path(self) -> Path:
+        """Path of the transcoded MP3 file."""
+        return self.path / self.OUTPUT_FILE
+
+    @property
+    def trim_map_path(self) -> Path:
+        """Path of the silence-trim map."""
+        return self.path / self.TRIM_MAP_FILE
+
+    def _load_checkpoint(self) -> Dict[str, Any]:
+        """Load the checkpoint file, tolerating a missing or corrupt file."""
+        try:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {self.checkpoint_path}: {e}")
+            return {}
+
+    def _save_checkpoint(self) -> None:
+        """Atomically write the checkpoint file."""
+        tmp_path = self.checkpoint_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._checkpoint, f, indent=2)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def is_done(self, stage: str) -> bool:
+        """Check whether a stage has completed.
+
+        Args:
+            stage: Stage name (one of STAGES)
+
+        Returns:
+            True if the stage is recorded as complete
+        """
+        return stage in self._checkpoint
+
+    def info(self, stage: str) -> Dict[str, Any]:
+        """Get the metadata recorded when a stage completed.
+
+        Args:
+            stage: Stage name (one of STAGES)
+
+        Returns:
+            Metadata dictionary (empty if the stage has not completed)
+        """
+        return dict(self._checkpoint.get(stage, {}))
+
+    def mark_done(self, stage: str, **info: Any) -> None:
+        """Record a stage as complete.
+
+        Args:
+            stage: Stage name (one of STAGES)
+            **info: JSON-serializable metadata to store with the checkpoint
+        """
+        if stage not in self.STAGES:
+            raise ValueError(f"Unknown stage: {stage}")
+        info["completed_at"] = datetime.now(timezone.utc).isoformat()
+        self._checkpoint[stage] = info
+        self._save_checkpoint()
+
+    def invalidate(self, stage: str) -> None:
+        """Forget a stage and every stage after it.
+
+        Args:
+            stage: First stage to invalidate
+        """
+        for later in self.STAGES[self.STAGES.index(stage):]:
+            self._checkpoint.pop(later, None)
+        self._save_checkpoint()
+
+    def first_incomplete_stage(self) -> Optional[str]:
+        """Get the first stage that has not completed.
+
+        Returns:
+            Stage name, or None if all stages are complete
+        """
+        for stage in self.STAGES:
+            if not self.is_done(stage):
+                return stage
+        return None
+
+    def cleanup(self) -> None:
+        """Remove the work directory and everything in it."""
+        shutil.rmtree(self.path, ignore_errors=True)
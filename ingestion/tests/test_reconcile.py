@@ -0,0 +1,149 @@
+"""Tests for matching S3 listings against video pointers."""
+
+import threading
+from collections import Counter, defaultdict
+
+import pytest
+
+from pipelines.reconcile import S3Reconciler, parse_key
+
+PREFIX = "butbul/daily-halacha/"
+BUCKET = "kol-torah-media"
+
+
+class StubS3:
+    """Answers head_object from a map of key to Content-Encoding."""
+
+    def __init__(self, encodings):
+        self.encodings = encodings
+
+    def head_object(self, Bucket, Key):
+        if Key not in self.encodings:
+            raise RuntimeError(f"HeadObject failed for {Key}")
+        encoding = self.encodings[Key]
+        return {"ContentEncoding": encoding} if encoding else {}
+
+
+def _reconciler(encodings=None):
+    reconciler = S3Reconciler.__new__(S3Reconciler)
+    reconciler.s3_bucket = BUCKET
+    reconciler.s3_client = StubS3(encodings or {})
+    reconciler.orphans = []
+    reconciler.unknown_prefixes = []
+    reconciler._lock = threading.Lock()
+    return reconciler
+
+
+def _video(**pointers):
+    video = {
+        "id": 7, "video_id": "abc", "bucket": BUCKET, "path": f"{PREFIX}2024-01-01-abc.mp3",
+        "trim_map_path": None, "peaks_path": None,
+        "transcript_bucket": None, "transcript_path": None, "transcript_index_path": None,
+    }
+    video.update(pointers)
+    return video
+
+
+def _reconcile(reconciler, video, keys):
+    changes = defaultdict(dict)
+    stats = Counter()
+    reconciler._reconcile_series(PREFIX, [video], keys, changes, stats)
+    return {column: values[video["id"]] for column, values in changes.items()}, stats
+
+
+def test_adopted_transcript_gets_its_encoding_and_size():
+    """An unclaimed transcript is adopted with its stored encoding and listed size."""
+    key = f"{PREFIX}2024-01-01-abc.json"
+    reconciler = _reconciler({key: "gzip"})
+    keys = {f"{PREFIX}2024-01-01-abc.mp3": 5000, key: 321}
+
+    changes, stats = _reconcile(reconciler, _video(), keys)
+
+    assert changes == {
+        "transcript_path": key,
+        "transcript_bucket": BUCKET,
+        "transcript_encoding": "gzip",
+        "transcript_size": 321,
+    }
+    assert stats["adopted"] == 1
+
+
+@pytest.mark.parametrize("head_succeeds, expected", [
+    # No Content-Encoding header: stored as is
+    (True, "identity"),
+    # Unknown rather than the old object's encoding
+    (False, None),
+])
+def test_repointed_transcript_replaces_the_old_encoding_and_size(head_succeeds, expected):
+    """Moving a dangling pointer refreshes the columns describing the object."""
+    new_key = f"{PREFIX}2024-01-02-abc.json"
+    reconciler = _reconciler({new_key: None} if head_succeeds else {})
+    video = _video(
+        transcript_bucket=BUCKET,
+        transcript_path=f"{PREFIX}2024-01-01-abc.json",
+        transcript_encoding="gzip",
+        transcript_size=99,
+    )
+
+    changes, stats = _reconcile(reconciler, video, {f"{PREFIX}2024-01-01-abc.mp3": 5000, new_key: 1234})
+
+    assert changes == {
+        "transcript_path": new_key,
+        "transcript_bucket": BUCKET,
+        "transcript_encoding": expected,
+        "transcript_size": 1234,
+    }
+    assert stats["repointed"] == 1
+
+
+def test_cleared_transcript_clears_its_details():
+    """A pointer whose object is gone is cleared with its bucket, encoding and size."""
+    video = _video(
+        transcript_bucket=BUCKET,
+        transcript_path=f"{PREFIX}2024-01-01-abc.json",
+        transcript_encoding="zstd",
+        transcript_size=99,
+    )
+
+    changes, stats = _reconcile(_reconciler(), video, {f"{PREFIX}2024-01-01-abc.mp3": 5000})
+
+    assert changes == {
+        "transcript_path": None,
+        "transcript_bucket": None,
+        "transcript_encoding": None,
+        "transcript_size": None,
+    }
+    assert stats["cleared"] == 1
+
+
+def test_repointed_audio_keeps_transcript_details():
+    """Only transcript pointers carry encoding and size."""
+    new_key = f"{PREFIX}2024-01-02-abc.mp3"
+
+    changes, stats = _reconcile(_reconciler(), _video(), {new_key: 5000})
+
+    assert changes == {"path": new_key, "bucket": BUCKET}
+    assert stats["repointed"] == 1
+
+
+def test_matching_pointers_are_left_alone():
+    """Pointers whose objects exist produce no changes."""
+    video = _video(transcript_bucket=BUCKET, transcript_path=f"{PREFIX}2024-01-01-abc.json")
+    keys = {f"{PREFIX}2024-01-01-abc.mp3": 5000, f"{PREFIX}2024-01-01-abc.json": 10}
+
+    changes, stats = _reconcile(_reconciler(), video, keys)
+
+    assert changes == {}
+    assert stats["ok"] == 2
+
+
+@pytest.mark.parametrize("key, expected", [
+    ("2024-01-01-abc.mp3", ("abc", "audio")),
+    ("2024-01-01-abc.trim.json", ("abc", "trim_map")),
+    ("2024-01-01-abc.json", ("abc", "transcript")),
+    ("2024-01-01-abc.speech/0001.wav", ("abc", "speech")),
+    ("notes.txt", None),
+])
+def test_parse_key(key, expected):
+    """Keys map to their video ID and object kind."""
+    assert parse_key(key) == expected
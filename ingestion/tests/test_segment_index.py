@@ -0,0 +1,127 @@
+"""Tests for the KTSI segment index sidecar."""
+
+import io
+import re
+
+import pytest
+
+from pipelines.transcript.segment_index import (
+    PREFETCH_BYTES, SegmentIndex, SegmentIndexBuilder, fetch_segment_at, segment_at
+)
+
+SEGMENTS = [
+    {"start": 1.0, "end": 2.5, "text": "שלום עולם."},
+    {"start": 2.5, "end": 4.0, "text": " הלכה יומית"},
+    {"start": 4.0, "end": 7.25, "text": " Shabbat 23a"},
+]
+
+
+def _encode(segments):
+    builder = SegmentIndexBuilder()
+    for segment in segments:
+        builder.add(segment)
+    return builder.encode()
+
+
+class StubS3:
+    """Serves ranged GETs of one object and records the requested ranges."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.ranges = []
+
+    def get_object(self, Bucket, Key, Range):
+        first, last = map(int, re.fullmatch(r"bytes=(\d+)-(\d+)", Range).groups())
+        self.ranges.append((first, last))
+        return {"Body": io.BytesIO(self.data[first:last + 1])}
+
+
+@pytest.mark.parametrize("seconds, expected", [
+    (0.0, None),
+    (0.999, None),
+    (1.0, 0),
+    (2.4999, 0),
+    (2.5, 1),
+    (4.0, 2),
+    (7.25, 2),
+    (3600.0, 2),
+])
+def test_segment_at_round_trip(seconds, expected):
+    """Lookups return the last segment starting at or before the offset."""
+    result = segment_at(_encode(SEGMENTS), seconds)
+
+    if expected is None:
+        assert result is None
+    else:
+        segment = SEGMENTS[expected]
+        assert result == (segment["start"], segment["end"], segment["text"])
+
+
+def test_segments_are_sorted_by_start():
+    """Segments added out of order are encoded in start order."""
+    index = SegmentIndex(_encode(list(reversed(SEGMENTS))))
+
+    assert list(index.starts) == [1000, 2500, 4000]
+    assert list(index.ends) == [2500, 4000, 7250]
+    assert index.duration == 7.25
+
+
+def test_multibyte_text_offsets():
+    """Text ranges are UTF-8 byte offsets, not character offsets."""
+    data = _encode(SEGMENTS)
+    index = SegmentIndex(data)
+
+    first, last = index.text_range(1)
+    assert data[first:last + 1].decode("utf-8") == SEGMENTS[1]["text"]
+    assert index.text_size == sum(len(s["text"].encode("utf-8")) for s in SEGMENTS)
+
+
+def test_empty_index():
+    """A transcript without segments encodes to an index that finds nothing."""
+    data = _encode([])
+
+    assert SegmentIndex(data).count == 0
+    assert segment_at(data, 10.0) is None
+
+
+@pytest.mark.parametrize("data", [b"", b"KTSI", b"XXXX" + _encode(SEGMENTS)[4:], _encode(SEGMENTS)[:40]])
+def test_invalid_index_is_rejected(data):
+    """Short, truncated or foreign data raises ValueError."""
+    with pytest.raises(ValueError):
+        SegmentIndex(data)
+
+
+def test_fetch_small_index_in_one_get():
+    """A small sidecar, text included, arrives with the first ranged GET."""
+    data = _encode(SEGMENTS)
+    s3 = StubS3(data)
+
+    assert fetch_segment_at(s3, "bucket", "key", 5.0) == segment_at(data, 5.0)
+    assert s3.ranges == [(0, PREFETCH_BYTES - 1)]
+
+
+def test_fetch_large_index_reads_the_rest_then_the_text():
+    """An index past PREFETCH_BYTES takes a second GET, and the text a third."""
+    segments = [{"start": i, "end": i + 1, "text": f"קטע {i}"} for i in range(10000)]
+    data = _encode(segments)
+    index = SegmentIndex(data)
+    assert index.text_offset > PREFETCH_BYTES
+    s3 = StubS3(data)
+
+    assert fetch_segment_at(s3, "bucket", "key", 9876.5) == (9876.0, 9877.0, "קטע 9876")
+
+    first, last = index.text_range(9876)
+    assert s3.ranges == [
+        (0, PREFETCH_BYTES - 1),
+        (PREFETCH_BYTES, index.text_offset - 1),
+        (first, last),
+    ]
+
+
+def test_fetch_before_first_segment_skips_the_text_get():
+    """No text is fetched when the offset precedes every segment."""
+    segments = [{"start": i + 10, "end": i + 11, "text": "x"} for i in range(10000)]
+    s3 = StubS3(_encode(segments))
+
+    assert fetch_segment_at(s3, "bucket", "key", 5.0) is None
+    assert len(s3.ranges) == 2
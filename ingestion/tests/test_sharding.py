@@ -0,0 +1,68 @@
+"""Tests for deterministic shard ownership."""
+
+import pytest
+from sqlalchemy import column
+from sqlalchemy.dialects import postgresql
+
+from pipelines.sharding import ShardFilter
+
+KEYS = [f"video-{i}" for i in range(2000)]
+
+
+@pytest.mark.parametrize("key, expected", [
+    ("dQw4w9WgXcQ", 457324532),
+    ("video-1", 1437537611),
+    # Top bit set: the SQL side must read bit(32) as unsigned, like Python does
+    ("abc", 2416005272),
+    ("", 3558706393),
+])
+def test_key_hash_is_pinned(key, expected):
+    """key_hash is the first 32 bits of the MD5, read as an unsigned integer."""
+    assert ShardFilter.key_hash(key) == expected
+
+
+def test_sql_hash_casts_through_bit32_to_bigint():
+    """The SQL hash keeps 32 unsigned bits: bit(32)::bigint, not ::integer."""
+    sql = str(ShardFilter.sql_hash(column("video_id")).compile(dialect=postgresql.dialect()))
+
+    assert "md5(video_id)" in sql
+    assert "AS BIT(32)) AS BIGINT)" in sql
+
+
+def test_every_key_has_exactly_one_owner():
+    """Without a rebalance, each key belongs to exactly one shard."""
+    shards = [ShardFilter(i, 5) for i in range(5)]
+
+    for key in KEYS:
+        owners = [s.shard_index for s in shards if s.matches(key)]
+        assert owners == [ShardFilter.key_hash(key) % 5]
+
+
+@pytest.mark.parametrize("previous_count, shard_count", [(3, 4), (4, 3), (2, 5)])
+def test_rebalance_never_gives_a_key_two_owners(previous_count, shard_count):
+    """Mid-rebalance, nodes on either count never claim the same key."""
+    upgraded = [ShardFilter(i, shard_count, previous_count) for i in range(shard_count)]
+    pending = [ShardFilter(i, previous_count, shard_count) for i in range(previous_count)]
+
+    for key in KEYS:
+        h = ShardFilter.key_hash(key)
+        owners = {s.shard_index for s in upgraded + pending if s.matches(key)}
+        if h % shard_count == h % previous_count:
+            assert owners == {h % shard_count}
+        else:
+            # Changes owner: left for the first run after the rebalance
+            assert owners == set()
+
+
+def test_rebalance_only_narrows_ownership():
+    """Rebalance-safe mode takes a subset of what the new count alone would."""
+    for i in range(4):
+        plain, safe = ShardFilter(i, 4), ShardFilter(i, 4, previous_count=3)
+        assert all(plain.matches(key) for key in KEYS if safe.matches(key))
+
+
+@pytest.mark.parametrize("args", [(0, 0), (4, 4), (-1, 4), (0, 4, 0)])
+def test_invalid_shard_arguments_are_rejected(args):
+    """Out-of-range indexes and counts raise ValueError."""
+    with pytest.raises(ValueError):
+        ShardFilter(*args)
@@ -0,0 +1,16 @@
+"""Cold-start regression test for `cli.py --help`."""
+
+import config
+from pipelines.startup import HEAVY_MODULES, measure_cold_start
+
+
+def test_cli_cold_start_within_budget():
+    """`cli.py --help` stays under STARTUP_BUDGET_MS and imports no heavy library."""
+    elapsed_ms, loaded = measure_cold_start(runs=3)
+
+    assert not loaded.intersection(HEAVY_MODULES), (
+        f"Heavy modules imported at startup: {', '.join(sorted(loaded.intersection(HEAVY_MODULES)))}"
+    )
+    assert elapsed_ms <= config.STARTUP_BUDGET_MS, (
+        f"Cold start imports take {elapsed_ms:.1f} ms, budget is {config.STARTUP_BUDGET_MS:.0f} ms"
+    )
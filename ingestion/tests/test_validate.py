@@ -0,0 +1,126 @@
+"""Tests for streaming transcript validation and normalization."""
+
+import io
+import json
+
+import pytest
+
+from pipelines.transcript.validate import MAX_TIME_SECONDS, TranscriptFormatError, validate_transcript
+
+TRANSCRIPT = {
+    "text": "שלום עולם. הלכה יומית",
+    "language": "he",
+    "segments": [
+        {"start": 0, "end": 1.5, "text": "שלום עולם."},
+        {"start": 1.5, "end": 4.25, "text": " הלכה יומית", "words": [{"w": "הלכה", "p": 0.98}]},
+    ],
+}
+
+
+def _validate(data, **kwargs):
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return validate_transcript(io.BytesIO(data), **kwargs)
+
+
+@pytest.mark.parametrize("data", [
+    "",
+    "{",
+    '{"segments": [',
+    '{"segments": [{"start": 0, "end": 1, "text": "a"}',
+    '{"segments": [{"start": 0, "end": 1, "text": "a"},]}',
+    '[{"start": 0 "end": 1, "text": "a"}]',
+    '[] []',
+    b'[{"start": 0, "end": 1, "text": "\xff"}]',
+])
+def test_malformed_json_is_rejected(data):
+    """Truncated, invalid or non-UTF-8 input raises TranscriptFormatError."""
+    with pytest.raises(TranscriptFormatError):
+        _validate(data)
+
+
+@pytest.mark.parametrize("data", [
+    '"segments"',
+    '{"text": "no segments"}',
+    '{"segments": {}}',
+    '[1]',
+    '[{"start": "0", "end": 1, "text": "a"}]',
+    '[{"start": 0, "end": null, "text": "a"}]',
+    '[{"start": true, "end": 1, "text": "a"}]',
+    '[{"start": 0, "end": 1}]',
+    '[{"start": 0, "end": 1, "text": 5}]',
+])
+def test_wrong_types_are_rejected(data):
+    """Valid JSON with the wrong structure raises TranscriptFormatError."""
+    with pytest.raises(TranscriptFormatError):
+        _validate(data)
+
+
+@pytest.mark.parametrize("start, end", [
+    ("NaN", "1"),
+    ("0", "NaN"),
+    ("Infinity", "Infinity"),
+    ("0", "Infinity"),
+    ("-Infinity", "1"),
+])
+def test_non_finite_times_are_rejected(start, end):
+    """json accepts NaN and Infinity; the validator must not."""
+    with pytest.raises(TranscriptFormatError, match="valid"):
+        _validate(f'[{{"start": {start}, "end": {end}, "text": "a"}}]')
+
+
+@pytest.mark.parametrize("start, end", [
+    ("-1", "1"),
+    ("-0.001", "0"),
+    ("0", "4294967.296"),
+    ("0", "1" + "0" * 400),
+])
+def test_out_of_range_times_are_rejected(start, end):
+    """Negative times and times past the u32 millisecond range are rejected."""
+    with pytest.raises(TranscriptFormatError, match="valid"):
+        _validate(f'[{{"start": {start}, "end": {end}, "text": "a"}}]')
+
+
+def test_times_up_to_the_index_limit_are_accepted():
+    """MAX_TIME_SECONDS itself is a valid time."""
+    assert _validate(f'[{{"start": 0, "end": {MAX_TIME_SECONDS}, "text": "a"}}]') is None
+
+
+def test_start_after_end_is_rejected():
+    """A segment may not end before it starts."""
+    with pytest.raises(TranscriptFormatError, match="ends before it starts"):
+        _validate('[{"start": 0, "end": 1, "text": "a"}, {"start": 3, "end": 2.5, "text": "b"}]')
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+@pytest.mark.parametrize("indent, ensure_ascii", [(None, True), (2, True), (2, False)])
+def test_normalize_matches_compact_json_dumps(chunk_size, indent, ensure_ascii):
+    """Normalized output is byte-identical to a compact, unescaped json.dumps."""
+    source = json.dumps(TRANSCRIPT, indent=indent, ensure_ascii=ensure_ascii)
+    expected = json.dumps(TRANSCRIPT, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    assert _validate(source, normalize=True, chunk_size=chunk_size) == expected
+
+
+def test_normalize_keeps_a_bare_segment_array():
+    """A bare array of segments is compacted as an array."""
+    segments = TRANSCRIPT["segments"]
+    expected = json.dumps(segments, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    assert _validate(json.dumps(segments, indent=4), normalize=True) == expected
+
+
+def test_on_segment_sees_every_segment_in_order():
+    """on_segment is called once per segment, across chunk boundaries."""
+    seen = []
+    _validate(json.dumps(TRANSCRIPT), on_segment=seen.append, chunk_size=5)
+
+    assert seen == TRANSCRIPT["segments"]
+
+
+def test_path_source(tmp_path):
+    """A path is opened and validated like a file object."""
+    path = tmp_path / "abc.json"
+    path.write_text(json.dumps(TRANSCRIPT, indent=2), encoding='utf-8')
+
+    assert validate_transcript(path) is None
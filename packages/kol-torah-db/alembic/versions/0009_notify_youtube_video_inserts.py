@@ -0,0 +1,47 @@
+"""notify on youtube video inserts
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009'
+down_revision: Union[str, Sequence[str], None] = '0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Wake up the ingestion daemon (LISTEN youtube_video_inserted) whenever videos are added.
+    # Statement-level so a bulk insert raises a single notification.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION sources.notify_youtube_video_inserted()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            PERFORM pg_notify('youtube_video_inserted', '');
+            RETURN NULL;
+        END;
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER youtube_video_inserted
+        AFTER INSERT ON sources.youtube_videos
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION sources.notify_youtube_video_inserted()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS youtube_video_inserted ON sources.youtube_videos")
+    op.execute("DROP FUNCTION IF EXISTS sources.notify_youtube_video_inserted()")
@@ -0,0 +1,28 @@
+"""add peaks path to youtube videos
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-19 00:00:02.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0011'
+down_revision: Union[str, Sequence[str], None] = '0010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('youtube_videos', sa.Column('peaks_path', sa.String(length=1000), nullable=True), schema='sources')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('youtube_videos', 'peaks_path', schema='sources')
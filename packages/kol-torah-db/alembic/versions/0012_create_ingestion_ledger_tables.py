@@ -0,0 +1,94 @@
+"""create ingestion ledger tables
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-19 00:00:03.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0012'
+down_revision: Union[str, Sequence[str], None] = '0011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Create ingestion_runs table
+    op.create_table(
+        'ingestion_runs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('pipeline', sa.String(length=100), nullable=False),
+        sa.Column('status', sa.String(length=50), nullable=False),
+        sa.Column('hostname', sa.String(length=255), nullable=True),
+        sa.Column('stats', postgresql.JSONB(), nullable=True),
+        sa.Column('started_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        schema='sources'
+    )
+    op.create_index(op.f('ix_sources_ingestion_runs_id'), 'ingestion_runs', ['id'], unique=False, schema='sources')
+    op.create_index(op.f('ix_sources_ingestion_runs_pipeline'), 'ingestion_runs', ['pipeline'], unique=False, schema='sources')
+    
+    # Create ingestion_attempts table
+    op.create_table(
+        'ingestion_attempts',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('run_id', sa.Integer(), nullable=False),
+        sa.Column('pipeline', sa.String(length=100), nullable=False),
+        sa.Column('item_key', sa.String(length=255), nullable=False),
+        sa.Column('status', sa.String(length=50), nullable=False),
+        sa.Column('stage', sa.String(length=100), nullable=True),
+        sa.Column('error_class', sa.String(length=255), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('attempt', sa.Integer(), nullable=False),
+        sa.Column('next_eligible_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['run_id'], ['sources.ingestion_runs.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        schema='sources'
+    )
+    op.create_index(op.f('ix_sources_ingestion_attempts_id'), 'ingestion_attempts', ['id'], unique=False, schema='sources')
+    op.create_index(op.f('ix_sources_ingestion_attempts_run_id'), 'ingestion_attempts', ['run_id'], unique=False, schema='sources')
+    op.create_index(op.f('ix_sources_ingestion_attempts_item_key'), 'ingestion_attempts', ['item_key'], unique=False, schema='sources')
+    
+    # Create ingestion_item_states table
+    op.create_table(
+        'ingestion_item_states',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('pipeline', sa.String(length=100), nullable=False),
+        sa.Column('item_key', sa.String(length=255), nullable=False),
+        sa.Column('failures', sa.Integer(), nullable=False),
+        sa.Column('last_stage', sa.String(length=100), nullable=True),
+        sa.Column('last_error_class', sa.String(length=255), nullable=True),
+        sa.Column('next_eligible_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('quarantined', sa.Boolean(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('pipeline', 'item_key', name='uq_ingestion_item_states_pipeline_item_key'),
+        schema='sources'
+    )
+    op.create_index(op.f('ix_sources_ingestion_item_states_id'), 'ingestion_item_states', ['id'], unique=False, schema='sources')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_sources_ingestion_item_states_id'), table_name='ingestion_item_states', schema='sources')
+    op.drop_table('ingestion_item_states', schema='sources')
+    
+    op.drop_index(op.f('ix_sources_ingestion_attempts_item_key'), table_name='ingestion_attempts', schema='sources')
+    op.drop_index(op.f('ix_sources_ingestion_attempts_run_id'), table_name='ingestion_attempts', schema='sources')
+    op.drop_index(op.f('ix_sources_ingestion_attempts_id'), table_name='ingestion_attempts', schema='sources')
+    op.drop_table('ingestion_attempts', schema='sources')
+    
+    op.drop_index(op.f('ix_sources_ingestion_runs_pipeline'), table_name='ingestion_runs', schema='sources')
+    op.drop_index(op.f('ix_sources_ingestion_runs_id'), table_name='ingestion_runs', schema='sources')
+    op.drop_table('ingestion_runs', schema='sources')
@@ -0,0 +1,30 @@
+"""add transcript encoding and size to youtube videos
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-19 00:00:04.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0013'
+down_revision: Union[str, Sequence[str], None] = '0012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('youtube_videos', sa.Column('transcript_encoding', sa.String(length=20), nullable=True), schema='sources')
+    op.add_column('youtube_videos', sa.Column('transcript_size', sa.Integer(), nullable=True), schema='sources')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('youtube_videos', 'transcript_size', schema='sources')
+    op.drop_column('youtube_videos', 'transcript_encoding', schema='sources')
@@ -0,0 +1,28 @@
+"""add transcript index path to youtube videos
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-19 00:00:05.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0014'
+down_revision: Union[str, Sequence[str], None] = '0013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('youtube_videos', sa.Column('transcript_index_path', sa.String(length=1000), nullable=True), schema='sources')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('youtube_videos', 'transcript_index_path', schema='sources')
@@ -0,0 +1,39 @@
+"""create transcript segments table
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-19 00:00:06.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0015'
+down_revision: Union[str, Sequence[str], None] = '0014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Create transcript_segments table; the primary key doubles as the per-video index
+    op.create_table(
+        'transcript_segments',
+        sa.Column('video_id', sa.Integer(), nullable=False),
+        sa.Column('segment_index', sa.Integer(), nullable=False),
+        sa.Column('start_seconds', sa.Float(), nullable=False),
+        sa.Column('end_seconds', sa.Float(), nullable=False),
+        sa.Column('text', sa.Text(), nullable=False),
+        sa.ForeignKeyConstraint(['video_id'], ['sources.youtube_videos.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('video_id', 'segment_index'),
+        schema='sources'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('transcript_segments', schema='sources')
@@ -0,0 +1,87 @@
+"""add full-text and trigram search over videos and transcript segments
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-19 00:00:07.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0016'
+down_revision: Union[str, Sequence[str], None] = '0015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Postgres has no Hebrew dictionary; the 'simple' configuration is used on
+    # text normalized so that pointed and unpointed spellings match: niqqud and
+    # cantillation marks are removed, maqaf splits words and the gershayim of
+    # acronyms are dropped (רמב"ם -> רמבם). IMMUTABLE so it can feed generated
+    # columns and expression indexes.
+    op.execute(r"""
+        CREATE OR REPLACE FUNCTION sources.hebrew_normalize(value text)
+        RETURNS text
+        LANGUAGE sql
+        IMMUTABLE
+        PARALLEL SAFE
+        AS $$
+            SELECT lower(
+                regexp_replace(
+                    regexp_replace(
+                        translate(coalesce(value, ''), E'\u05BE', ' '),
+                        E'[\u0591-\u05BD\u05BF\u05C1\u05C2\u05C4\u05C5\u05C7]', '', 'g'
+                    ),
+                    E'([\u05D0-\u05EA])["''\u05F3\u05F4]+(?=[\u05D0-\u05EA])', '\1', 'g'
+                )
+            )
+        $$
+    """)
+
+    # Kept current by Postgres on every insert/update of the source columns
+    op.execute("""
+        ALTER TABLE sources.youtube_videos
+        ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple'::regconfig, sources.hebrew_normalize(title)), 'A') ||
+            setweight(to_tsvector('simple'::regconfig, sources.hebrew_normalize(description)), 'B')
+        ) STORED
+    """)
+    op.execute("""
+        ALTER TABLE sources.transcript_segments
+        ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            to_tsvector('simple'::regconfig, sources.hebrew_normalize(text))
+        ) STORED
+    """)
+
+    op.create_index(
+        'ix_sources_youtube_videos_search_vector', 'youtube_videos', ['search_vector'],
+        unique=False, schema='sources', postgresql_using='gin'
+    )
+    op.create_index(
+        'ix_sources_transcript_segments_search_vector', 'transcript_segments', ['search_vector'],
+        unique=False, schema='sources', postgresql_using='gin'
+    )
+    # Partial-word and misspelling matches on titles (word_similarity / <% operator)
+    op.execute("""
+        CREATE INDEX ix_sources_youtube_videos_title_trgm
+        ON sources.youtube_videos
+        USING gin (sources.hebrew_normalize(title) gin_trgm_ops)
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS sources.ix_sources_youtube_videos_title_trgm")
+    op.drop_index('ix_sources_transcript_segments_search_vector', table_name='transcript_segments', schema='sources')
+    op.drop_index('ix_sources_youtube_videos_search_vector', table_name='youtube_videos', schema='sources')
+    op.drop_column('transcript_segments', 'search_vector', schema='sources')
+    op.drop_column('youtube_videos', 'search_vector', schema='sources')
+    op.execute("DROP FUNCTION IF EXISTS sources.hebrew_normalize(text)")
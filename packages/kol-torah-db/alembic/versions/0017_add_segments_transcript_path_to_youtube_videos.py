@@ -0,0 +1,34 @@
+"""add segments transcript path to youtube videos
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-10-19 00:00:08.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0017'
+down_revision: Union[str, Sequence[str], None] = '0016'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('youtube_videos', sa.Column('segments_transcript_path', sa.String(length=1000), nullable=True), schema='sources')
+    # Videos whose segments are already loaded need not be loaded again
+    op.execute("""
+        UPDATE sources.youtube_videos v
+        SET segments_transcript_path = v.transcript_path
+        WHERE EXISTS (SELECT 1 FROM sources.transcript_segments s WHERE s.video_id = v.id)
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('youtube_videos', 'segments_transcript_path', schema='sources')
@@ -2,7 +2,14 @@
 
 __version__ = "0.1.0"
 
-from kol_torah_db.database import Base, engine, SessionLocal, get_db
+from kol_torah_db import database
+from kol_torah_db.database import Base, get_db, get_engine
 
-__all__ = ["Base", "engine", "SessionLocal", "get_db"]
+__all__ = ["Base", "engine", "SessionLocal", "get_db", "get_engine"]
 
+
+def __getattr__(name):
+    """Resolve `engine` and `SessionLocal` lazily (see kol_torah_db.database)."""
+    if name in ("engine", "SessionLocal"):
+        return getattr(database, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,32 +1,56 @@
 """Database connection and configuration."""
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
-from dotenv import load_dotenv
+from functools import lru_cache
 import os
 
-# Load environment variables
-load_dotenv()
+from sqlalchemy.orm import declarative_base
 
-# Get database URL from environment
-DATABASE_URL = os.getenv("DATABASE_URL")
+# Create declarative base for models
+Base = declarative_base()
 
-if not DATABASE_URL:
-    raise ValueError("DATABASE_URL environment variable is not set")
 
-# Create engine
-engine = create_engine(DATABASE_URL, echo=False)
+@lru_cache(maxsize=1)
+def get_engine():
+    """Get the database engine (created on first use).
+    
+    The engine is not created at import time, so importing the models does
+    not require DATABASE_URL and does not load a database driver.
+    """
+    from sqlalchemy import create_engine
+    from dotenv import load_dotenv
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    # Load environment variables
+    load_dotenv()
 
-# Create declarative base for models
-Base = declarative_base()
+    # Get database URL from environment
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        raise ValueError("DATABASE_URL environment variable is not set")
+
+    return create_engine(database_url, echo=False)
+
+
+@lru_cache(maxsize=1)
+def get_session_local():
+    """Get the session factory bound to the engine (created on first use)."""
+    from sqlalchemy.orm import sessionmaker
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+
+
+def __getattr__(name):
+    """Resolve `engine`, `SessionLocal` and `DATABASE_URL` lazily."""
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_session_local()
+    if name == "DATABASE_URL":
+        return get_engine().url.render_as_string(hide_password=False)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_db():
     """Get database session."""
-    db = SessionLocal()
+    db = get_session_local()()
     try:
         yield db
     finally:
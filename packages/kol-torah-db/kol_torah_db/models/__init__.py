@@ -1,7 +1,11 @@
 """SQLAlchemy models for Kol Torah database."""
 
 from kol_torah_db.models.main import Rabbi, Series
-from kol_torah_db.models.sources import YoutubeVideo
+from kol_torah_db.models.sources import (
+    YoutubeVideo, TranscriptSegment, IngestionRun, IngestionAttempt, IngestionItemState
+)
 
-__all__ = ["Rabbi", "Series", "YoutubeVideo"]
+__all__ = [
+    "Rabbi", "Series", "YoutubeVideo", "TranscriptSegment", "IngestionRun", "IngestionAttempt", "IngestionItemState"
+]
 
@@ -1,7 +1,8 @@
 """SQLAlchemy models for the sources schema."""
 
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Date
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, Float, ForeignKey, DateTime, Date, Boolean, UniqueConstraint, Computed
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 from kol_torah_db.database import Base
 
@@ -22,8 +23,25 @@ class YoutubeVideo(Base):
     duration = Column(Integer, nullable=False)
     bucket = Column(String(255), nullable=True)
     path = Column(String(1000), nullable=True)
+    trim_map_path = Column(String(1000), nullable=True)
+    peaks_path = Column(String(1000), nullable=True)
     transcript_bucket = Column(String(255), nullable=True)
     transcript_path = Column(String(1000), nullable=True)
+    transcript_encoding = Column(String(20), nullable=True)
+    transcript_size = Column(Integer, nullable=True)
+    transcript_index_path = Column(String(1000), nullable=True)
+    # transcript_path whose segments are in transcript_segments (set even when it has none)
+    segments_transcript_path = Column(String(1000), nullable=True)
+    
+    # Full-text search over title (weight A) and description (weight B); see migration 0016
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple'::regconfig, sources.hebrew_normalize(title)), 'A') || "
+            "setweight(to_tsvector('simple'::regconfig, sources.hebrew_normalize(description)), 'B')",
+            persisted=True
+        )
+    ))
     
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -33,3 +51,102 @@ class YoutubeVideo(Base):
     
     def __repr__(self):
         return f"<YoutubeVideo(id={self.id}, video_id='{self.video_id}', title='{self.title}')>"
+
+
+class TranscriptSegment(Base):
+    """Transcript Segment model - one row per segment of a video's transcript.
+    
+    Rows are bulk-loaded from the transcript in S3 (see the ingestion
+    `transcript load-segments` command) and replaced as a whole per video.
+    """
+    
+    __tablename__ = "transcript_segments"
+    __table_args__ = {"schema": "sources"}
+    
+    video_id = Column(Integer, ForeignKey("sources.youtube_videos.id", ondelete="CASCADE"), primary_key=True)
+    segment_index = Column(Integer, primary_key=True)
+    start_seconds = Column(Float, nullable=False)
+    end_seconds = Column(Float, nullable=False)
+    text = Column(Text, nullable=False)
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed("to_tsvector('simple'::regconfig, sources.hebrew_normalize(text))", persisted=True)
+    ))
+    
+    def __repr__(self):
+        return f"<TranscriptSegment(video_id={self.video_id}, segment_index={self.segment_index}, start={self.start_seconds})>"
+
+
+class IngestionRun(Base):
+    """Ingestion Run model - one record per pipeline run."""
+    
+    __tablename__ = "ingestion_runs"
+    __table_args__ = {"schema": "sources"}
+    
+    id = Column(Integer, primary_key=True, index=True)
+    pipeline = Column(String(100), nullable=False, index=True)
+    status = Column(String(50), nullable=False)
+    hostname = Column(String(255), nullable=True)
+    stats = Column(JSONB, nullable=True)
+    started_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    
+    # Relationships
+    attempts = relationship("IngestionAttempt", back_populates="run")
+    
+    def __repr__(self):
+        return f"<IngestionRun(id={self.id}, pipeline='{self.pipeline}', status='{self.status}')>"
+
+
+class IngestionAttempt(Base):
+    """Ingestion Attempt model - one record per item attempt within a run."""
+    
+    __tablename__ = "ingestion_attempts"
+    __table_args__ = {"schema": "sources"}
+    
+    id = Column(Integer, primary_key=True, index=True)
+    run_id = Column(Integer, ForeignKey("sources.ingestion_runs.id"), nullable=False, index=True)
+    pipeline = Column(String(100), nullable=False)
+    item_key = Column(String(255), nullable=False, index=True)
+    status = Column(String(50), nullable=False)
+    stage = Column(String(100), nullable=True)
+    error_class = Column(String(255), nullable=True)
+    error_message = Column(Text, nullable=True)
+    attempt = Column(Integer, nullable=False)
+    next_eligible_at = Column(DateTime(timezone=True), nullable=True)
+    
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    # Relationships
+    run = relationship("IngestionRun", back_populates="attempts")
+    
+    def __repr__(self):
+        return f"<IngestionAttempt(id={self.id}, item_key='{self.item_key}', status='{self.status}', attempt={self.attempt})>"
+
+
+class IngestionItemState(Base):
+    """Ingestion Item State model - current retry state of a failing item.
+    
+    Rows exist only for items whose latest attempt failed; a success removes the row.
+    """
+    
+    __tablename__ = "ingestion_item_states"
+    __table_args__ = (
+        UniqueConstraint("pipeline", "item_key", name="uq_ingestion_item_states_pipeline_item_key"),
+        {"schema": "sources"},
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    pipeline = Column(String(100), nullable=False)
+    item_key = Column(String(255), nullable=False)
+    failures = Column(Integer, nullable=False)
+    last_stage = Column(String(100), nullable=True)
+    last_error_class = Column(String(255), nullable=True)
+    next_eligible_at = Column(DateTime(timezone=True), nullable=False)
+    quarantined = Column(Boolean, nullable=False, default=False)
+    
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    
+    def __repr__(self):
+        return f"<IngestionItemState(pipeline='{self.pipeline}', item_key='{self.item_key}', failures={self.failures})>"